@@ -1,9 +1,10 @@
 """API routes for Ollama provider management."""
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
+import json
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
+from sse_starlette.sse import EventSourceResponse
 from app.services.ai_providers.ollama_provider import OllamaProvider
-from app.services.mlx_model_manager import MLXModelManager
+from app.services.mlx_model_manager import MLXModelManager, POPULAR_MLX_MODELS
 from app.core.config import settings
 
 router = APIRouter()
@@ -83,7 +84,7 @@ async def get_model_info(model_name: str):
 
 
 @router.post("/ollama/models/pull")
-async def pull_model(request: PullModelRequest):
+async def pull_model(request: PullModelRequest, http_request: Request):
     """
     Pull/download a model from Ollama library.
 
@@ -96,12 +97,14 @@ async def pull_model(request: PullModelRequest):
             can_run, message = provider.can_run_model(request.model_name)
 
             if not can_run:
-                yield f'data: {{"error": "{message}"}}\n\n'
+                yield {"data": json.dumps({"error": message})}
                 return
 
             async for status in provider.pull_model(request.model_name):
-                import json
-                yield f"data: {json.dumps(status)}\n\n"
+                if await http_request.is_disconnected():
+                    break
+
+                yield {"data": json.dumps(status)}
 
                 if "error" in status:
                     break
@@ -110,21 +113,13 @@ async def pull_model(request: PullModelRequest):
                 if status.get("status") == "success":
                     break
 
-    return StreamingResponse(
-        stream_pull(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        },
-    )
+    return EventSourceResponse(stream_pull(), sep="\n")
 
 
 @router.get("/ollama/mlx/available")
 async def list_available_mlx_models():
     """List popular MLX models available for download."""
-    manager = MLXModelManager()
-    models = manager.list_popular_models()
+    models = POPULAR_MLX_MODELS
 
     return {
         "models": models,
@@ -133,7 +128,7 @@ async def list_available_mlx_models():
 
 
 @router.post("/ollama/mlx/download")
-async def download_mlx_model(request: DownloadMLXRequest):
+async def download_mlx_model(request: DownloadMLXRequest, http_request: Request):
     """
     Download MLX model from HuggingFace and import to Ollama.
 
@@ -141,29 +136,23 @@ async def download_mlx_model(request: DownloadMLXRequest):
     """
     async def stream_download():
         """Stream download progress."""
-        manager = MLXModelManager()
+        async with MLXModelManager() as manager:
+            async for status in manager.download_mlx_model(
+                request.model_key,
+                request.custom_repo
+            ):
+                if await http_request.is_disconnected():
+                    break
 
-        async for status in manager.download_mlx_model(
-            request.model_key,
-            request.custom_repo
-        ):
-            import json
-            yield f"data: {json.dumps(status)}\n\n"
+                yield {"data": json.dumps(status)}
 
-            if "error" in status:
-                break
+                if "error" in status:
+                    break
 
-            if status.get("status") == "complete":
-                break
+                if status.get("status") == "complete":
+                    break
 
-    return StreamingResponse(
-        stream_download(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        },
-    )
+    return EventSourceResponse(stream_download(), sep="\n")
 
 
 @router.delete("/ollama/models/{model_name}")
@@ -173,7 +162,8 @@ async def delete_model(model_name: str):
 
     async with httpx.AsyncClient() as client:
         try:
-            response = await client.delete(
+            response = await client.request(
+                "DELETE",
                 f"{settings.ollama_base_url}/api/delete",
                 json={"name": model_name}
             )
@@ -2,12 +2,13 @@
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete as sql_delete
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 from typing import Optional
 import json
-import uuid
+from uuid import uuid4
 
 from app.core.database import get_db
+from app.core.validation import MAX_COUNCIL_MEMBERS, MAX_TEMPLATE_SIZE
 from app.models.council_template import CouncilTemplate
 
 router = APIRouter()
@@ -17,7 +18,14 @@ class SaveTemplateRequest(BaseModel):
     """Request to save a council template."""
     name: str
     description: Optional[str] = None
-    members: list[dict]
+    members: list[dict] = Field(..., max_length=MAX_COUNCIL_MEMBERS)
+
+    @model_validator(mode="after")
+    def validate_members_size(self) -> "SaveTemplateRequest":
+        """Reject oversized member payloads before they reach the database."""
+        if len(json.dumps(self.members)) > MAX_TEMPLATE_SIZE:
+            raise ValueError(f"Template members exceed the maximum size of {MAX_TEMPLATE_SIZE} bytes")
+        return self
 
 
 class TemplateResponse(BaseModel):
@@ -43,18 +51,15 @@ async def list_templates(db: AsyncSession = Depends(get_db)):
 @router.post("/templates", response_model=TemplateResponse)
 async def save_template(request: SaveTemplateRequest, db: AsyncSession = Depends(get_db)):
     """Save a new council template."""
-    template_id = str(uuid.uuid4())
-
     template = CouncilTemplate(
-        id=template_id,
+        id=str(uuid4()),
         name=request.name,
         description=request.description,
-        members_json=json.dumps(request.members)
+        members_json=request.members
     )
 
     db.add(template)
     await db.commit()
-    await db.refresh(template)
 
     return template.to_dict()
 
@@ -107,9 +112,8 @@ async def update_template(
 
     template.name = request.name
     template.description = request.description
-    template.members_json = json.dumps(request.members)
+    template.members_json = request.members
 
     await db.commit()
-    await db.refresh(template)
 
     return template.to_dict()
@@ -46,6 +46,7 @@ PROVIDER_CONFIGS = {
         "default_model": "gpt-4o",
         "env_key": "OPENAI_API_KEY",
         "supports_streaming": True,
+        "max_concurrent_requests": 8,
         "available_models": [
             "gpt-4o",
             "gpt-4o-mini",
@@ -53,11 +54,17 @@ PROVIDER_CONFIGS = {
             "gpt-4",
             "gpt-3.5-turbo",
         ],
+        "vision_models": [
+            "gpt-4o",
+            "gpt-4o-mini",
+            "gpt-4-turbo",
+        ],
     },
     "anthropic": {
         "default_model": "claude-sonnet-4-20250514",
         "env_key": "ANTHROPIC_API_KEY",
         "supports_streaming": True,
+        "max_concurrent_requests": 5,
         "available_models": [
             "claude-opus-4-20250514",
             "claude-sonnet-4-20250514",
@@ -70,6 +77,7 @@ PROVIDER_CONFIGS = {
         "default_model": "gemini-2.0-flash-exp",
         "env_key": "GOOGLE_API_KEY",
         "supports_streaming": True,
+        "max_concurrent_requests": 5,
         "available_models": [
             "gemini-2.0-flash-exp",
             "gemini-1.5-pro",
@@ -81,6 +89,7 @@ PROVIDER_CONFIGS = {
         "default_model": "grok-beta",
         "env_key": "GROK_API_KEY",
         "supports_streaming": True,
+        "max_concurrent_requests": 5,
         "base_url": "https://api.x.ai/v1",
         "available_models": [
             "grok-beta",
@@ -91,6 +100,7 @@ PROVIDER_CONFIGS = {
         "default_model": "phi3:mini",
         "env_key": None,  # No API key needed for local
         "supports_streaming": True,
+        "max_concurrent_requests": 4,
         "base_url": "http://localhost:11434",
         "available_models": [
             "phi3:mini",
@@ -138,6 +148,20 @@ PRICING = {
     "grok:grok-vision-beta": (5.00, 15.00),
 }
 
+
+def _group_pricing(pricing: dict[str, tuple[float, float]]) -> dict[str, dict[str, tuple[float, float]]]:
+    """Regroup "provider:model" pricing keys as provider -> model -> price."""
+    grouped: dict[str, dict[str, tuple[float, float]]] = {}
+    for key, price in pricing.items():
+        provider, model = key.split(":", 1)
+        grouped.setdefault(provider, {})[model] = price
+    return grouped
+
+
+# Per-provider pricing tables, so lookups need no "provider:model" key formatting
+PROVIDER_PRICING = _group_pricing(PRICING)
+
+
 # Preset temperature mappings
 PRESETS = {
     "creative": 0.9,
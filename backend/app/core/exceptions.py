@@ -1,9 +1,20 @@
-"""Custom exception classes for AI provider errors."""
+"""
+Custom exception classes for AI provider errors.
+
+Exceptions declare __slots__ so their attributes are stored in slots and
+no per-instance __dict__ is created when they are raised.
+
+Instances are deliberately not cached or reused: a raised exception keeps
+its __traceback__ and __context__, so a shared instance would leak frames
+from one raise into the next and mix state across concurrent requests.
+"""
 
 
 class AIProviderError(Exception):
     """Base exception for AI provider errors."""
 
+    __slots__ = ("provider",)
+
     def __init__(self, message: str, provider: str | None = None):
         self.provider = provider
         super().__init__(message)
@@ -12,6 +23,8 @@ class AIProviderError(Exception):
 class RateLimitError(AIProviderError):
     """Raised when the API rate limit is exceeded."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(self, message: str = "Rate limit exceeded", provider: str | None = None, retry_after: int | None = None):
         self.retry_after = retry_after
         super().__init__(message, provider)
@@ -20,6 +33,8 @@ class RateLimitError(AIProviderError):
 class AuthenticationError(AIProviderError):
     """Raised when API authentication fails (invalid API key)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Authentication failed - check your API key", provider: str | None = None):
         super().__init__(message, provider)
 
@@ -27,14 +42,23 @@ class AuthenticationError(AIProviderError):
 class ModelNotFoundError(AIProviderError):
     """Raised when the specified model is not available."""
 
+    __slots__ = ("model",)
+
     def __init__(self, model: str, provider: str | None = None):
         self.model = model
-        super().__init__(f"Model '{model}' not found", provider)
+        self.provider = provider
+        # The message is only formatted if the error is actually rendered
+        Exception.__init__(self, model)
+
+    def __str__(self) -> str:
+        return f"Model '{self.model}' not found"
 
 
 class ContextLengthError(AIProviderError):
     """Raised when the input exceeds the model's context length."""
 
+    __slots__ = ("max_tokens",)
+
     def __init__(self, message: str = "Input exceeds model's context length", provider: str | None = None, max_tokens: int | None = None):
         self.max_tokens = max_tokens
         super().__init__(message, provider)
@@ -43,6 +67,8 @@ class ContextLengthError(AIProviderError):
 class ContentFilterError(AIProviderError):
     """Raised when content is blocked by the provider's content filter."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Content blocked by safety filter", provider: str | None = None):
         super().__init__(message, provider)
 
@@ -50,6 +76,8 @@ class ContentFilterError(AIProviderError):
 class ConnectionError(AIProviderError):
     """Raised when unable to connect to the provider's API."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Unable to connect to API", provider: str | None = None):
         super().__init__(message, provider)
 
@@ -57,6 +85,8 @@ class ConnectionError(AIProviderError):
 class TimeoutError(AIProviderError):
     """Raised when the API request times out."""
 
+    __slots__ = ("timeout_seconds",)
+
     def __init__(self, message: str = "Request timed out", provider: str | None = None, timeout_seconds: int | None = None):
         self.timeout_seconds = timeout_seconds
         super().__init__(message, provider)
@@ -65,6 +95,8 @@ class TimeoutError(AIProviderError):
 class InsufficientQuotaError(AIProviderError):
     """Raised when the account has insufficient quota/credits."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Insufficient quota or credits", provider: str | None = None):
         super().__init__(message, provider)
 
@@ -72,6 +104,8 @@ class InsufficientQuotaError(AIProviderError):
 class ServiceUnavailableError(AIProviderError):
     """Raised when the provider's service is temporarily unavailable."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Service temporarily unavailable", provider: str | None = None):
         super().__init__(message, provider)
 
@@ -81,6 +115,8 @@ class ServiceUnavailableError(AIProviderError):
 class LLMingsError(Exception):
     """Base exception for LLMings application errors."""
 
+    __slots__ = ("message", "status_code")
+
     def __init__(self, message: str, status_code: int = 500):
         self.message = message
         self.status_code = status_code
@@ -90,24 +126,43 @@ class LLMingsError(Exception):
 class ValidationError(LLMingsError):
     """Raised when input validation fails."""
 
+    __slots__ = ("field",)
+
     def __init__(self, message: str, field: str | None = None):
         self.field = field
-        super().__init__(message, status_code=400)
+        self.message = message
+        self.status_code = 400
+        Exception.__init__(self, message)
 
 
 class NotFoundError(LLMingsError):
     """Raised when a requested resource is not found."""
 
+    __slots__ = ("resource", "identifier")
+
     def __init__(self, resource: str, identifier: str | None = None):
         self.resource = resource
         self.identifier = identifier
-        message = f"{resource} not found" if not identifier else f"{resource} '{identifier}' not found"
-        super().__init__(message, status_code=404)
+        self.status_code = 404
+        # The message is only formatted if the error is actually rendered
+        Exception.__init__(self, resource, identifier)
+
+    @property
+    def message(self) -> str:
+        """Human-readable message, formatted on access."""
+        if not self.identifier:
+            return f"{self.resource} not found"
+        return f"{self.resource} '{self.identifier}' not found"
+
+    def __str__(self) -> str:
+        return self.message
 
 
 class ConfigurationError(LLMingsError):
     """Raised when there's a configuration issue."""
 
+    __slots__ = ()
+
     def __init__(self, message: str):
         super().__init__(message, status_code=500)
 
@@ -115,6 +170,10 @@ class ConfigurationError(LLMingsError):
 class SessionError(LLMingsError):
     """Raised when there's an error with a council session."""
 
+    __slots__ = ("session_id",)
+
     def __init__(self, message: str, session_id: str | None = None):
         self.session_id = session_id
-        super().__init__(message, status_code=400)
+        self.message = message
+        self.status_code = 400
+        Exception.__init__(self, message)
@@ -1,39 +1,41 @@
 """Personality archetypes for council members."""
+import heapq
+from functools import lru_cache
 
 # Model recommendations for each archetype (Ollama models)
 # These are fallback recommendations - dynamic recommendations based on
 # installed models and suitability scores are preferred
 ARCHETYPE_MODEL_RECOMMENDATIONS = {
     # Well-rounded models for balanced perspective
-    "balanced": ["llama3.3", "qwen3", "gemma3", "glm-4.7:cloud"],
+    "balanced": ("llama3.3", "qwen3", "gemma3", "glm-4.7:cloud"),
     # Creative + general strength for optimistic visioning
-    "optimist": ["gemma3", "llama3.3", "minimax-m2.1:cloud", "qwen3"],
+    "optimist": ("gemma3", "llama3.3", "minimax-m2.1:cloud", "qwen3"),
     # Strong reasoning for critical analysis
-    "critic": ["deepseek-r1", "mistral", "qwen3", "llama3.3"],
+    "critic": ("deepseek-r1", "mistral", "qwen3", "llama3.3"),
     # Efficient, practical models for implementation focus
-    "pragmatist": ["phi4-mini", "qwen2.5", "mistral", "llama3.2"],
+    "pragmatist": ("phi4-mini", "qwen2.5", "mistral", "llama3.2"),
     # High creativity scores for innovation
-    "creative": ["gemma3", "minimax-m2.1:cloud", "llama3.3", "qwen3"],
+    "creative": ("gemma3", "minimax-m2.1:cloud", "llama3.3", "qwen3"),
     # Strong reasoning and coding for data analysis
-    "analyst": ["deepseek-r1", "qwen3", "mistral", "phi4"],
+    "analyst": ("deepseek-r1", "qwen3", "mistral", "phi4"),
     # Strong reasoning for devil's advocate role
-    "devil_advocate": ["deepseek-r1", "mistral", "qwen3", "llama3.3"],
+    "devil_advocate": ("deepseek-r1", "mistral", "qwen3", "llama3.3"),
     # Creativity + reasoning for synthesis
-    "synthesizer": ["llama3.3", "gemma3", "qwen3", "glm-4.7:cloud"],
+    "synthesizer": ("llama3.3", "gemma3", "qwen3", "glm-4.7:cloud"),
     # Strong reasoning for ethical evaluation
-    "ethicist": ["deepseek-r1", "llama3.3", "qwen3", "mistral"],
+    "ethicist": ("deepseek-r1", "llama3.3", "qwen3", "mistral"),
     # Long-term thinking, reasoning for strategy
-    "strategist": ["llama3.3", "deepseek-r1", "qwen3", "glm-4.7:cloud"],
+    "strategist": ("llama3.3", "deepseek-r1", "qwen3", "glm-4.7:cloud"),
     # Efficient models for minimalist simplicity
-    "minimalist": ["phi4-mini", "smollm2", "qwen2.5", "mistral"],
+    "minimalist": ("phi4-mini", "smollm2", "qwen2.5", "mistral"),
     # Broad thinking models for maximalist expansion
-    "maximalist": ["llama3.3", "gemma3", "qwen3", "deepseek-v3"],
+    "maximalist": ("llama3.3", "gemma3", "qwen3", "deepseek-v3"),
     # Technical specialist models for coding/architecture
-    "technical": ["qwen3-coder", "devstral", "deepseek-coder-v2", "codellama"],
+    "technical": ("qwen3-coder", "devstral", "deepseek-coder-v2", "codellama"),
     # Empathy + general strength for user advocacy
-    "user_advocate": ["gemma3", "llama3.3", "minimax-m2.1:cloud", "qwen3"],
+    "user_advocate": ("gemma3", "llama3.3", "minimax-m2.1:cloud", "qwen3"),
     # Rigorous reasoning for research
-    "researcher": ["deepseek-r1", "qwen3", "mistral", "llama3.3"],
+    "researcher": ("deepseek-r1", "qwen3", "mistral", "llama3.3"),
 }
 
 # Archetype requirements mapping - defines what capabilities each archetype needs
@@ -150,6 +152,19 @@ PERSONALITY_ARCHETYPES = {
 }
 
 
+# Archetype list with static recommendations, built once at import
+_STATIC_ARCHETYPE_LIST = [
+    {
+        "id": key,
+        "name": value["name"],
+        "description": value["description"],
+        "emoji": value["emoji"],
+        "recommended_models": ARCHETYPE_MODEL_RECOMMENDATIONS.get(key, ()),
+    }
+    for key, value in PERSONALITY_ARCHETYPES.items()
+]
+
+
 def get_archetype_list(installed_models: list[str] | None = None, model_suitability: dict | None = None):
     """
     Get list of archetypes for UI dropdown.
@@ -159,30 +174,24 @@ def get_archetype_list(installed_models: list[str] | None = None, model_suitabil
         model_suitability: Optional dict of model suitability scores from OllamaProvider
 
     Returns:
-        List of archetype dicts with recommended_models field
+        List of archetype dicts with recommended_models field (an immutable tuple,
+        shared between callers)
     """
-    archetypes = []
-
-    for key, value in PERSONALITY_ARCHETYPES.items():
-        archetype = {
-            "id": key,
-            "name": value["name"],
-            "description": value["description"],
-            "emoji": value["emoji"],
-        }
-
-        # Get dynamic recommendations if we have installed models and suitability data
-        if installed_models and model_suitability:
-            archetype["recommended_models"] = get_dynamic_model_recommendations(
-                key, installed_models, model_suitability
-            )
-        else:
-            # Fall back to static recommendations
-            archetype["recommended_models"] = ARCHETYPE_MODEL_RECOMMENDATIONS.get(key, [])
+    # Without installed models and suitability data, serve the static recommendations
+    if not (installed_models and model_suitability):
+        return [archetype.copy() for archetype in _STATIC_ARCHETYPE_LIST]
 
-        archetypes.append(archetype)
+    # Freeze the inputs once and share the cache key across all archetypes
+    models_key = tuple(installed_models)
+    suitability_key = _freeze_suitability(model_suitability)
 
-    return archetypes
+    return [
+        {
+            **archetype,
+            "recommended_models": _cached_recommendations(archetype["id"], models_key, suitability_key, 4),
+        }
+        for archetype in _STATIC_ARCHETYPE_LIST
+    ]
 
 
 def get_dynamic_model_recommendations(
@@ -194,6 +203,9 @@ def get_dynamic_model_recommendations(
     """
     Dynamically recommend models for an archetype based on installed models and suitability.
 
+    Results are memoized on the (frozen) inputs, so repeated polls with the
+    same installed models are served from cache.
+
     Args:
         archetype_id: The archetype identifier
         installed_models: List of installed Ollama model names
@@ -203,48 +215,105 @@ def get_dynamic_model_recommendations(
     Returns:
         List of recommended model names, sorted by suitability
     """
-    requirements = ARCHETYPE_REQUIREMENTS.get(archetype_id, {"general": 7})
+    return list(_cached_recommendations(
+        archetype_id,
+        tuple(installed_models),
+        _freeze_suitability(model_suitability),
+        max_recommendations,
+    ))
+
+
+def _freeze_suitability(model_suitability: dict) -> tuple:
+    """Convert a suitability mapping into a hashable, order-independent cache key."""
+    return tuple(sorted(
+        (model_name, tuple(sorted(scores.items())))
+        for model_name, scores in model_suitability.items()
+    ))
 
-    # Score each installed model based on archetype requirements
-    scored_models = []
 
+@lru_cache(maxsize=256)
+def _cached_recommendations(
+    archetype_id: str,
+    installed_models: tuple[str, ...],
+    suitability_key: tuple,
+    max_recommendations: int,
+) -> tuple[str, ...]:
+    """Memoized recommendations keyed on frozen inputs."""
+    return tuple(_score_recommendations(
+        archetype_id, _resolve_suitability(installed_models, suitability_key), max_recommendations
+    ))
+
+
+@lru_cache(maxsize=32)
+def _resolve_suitability(
+    installed_models: tuple[str, ...],
+    suitability_key: tuple,
+) -> tuple[tuple[str, dict], ...]:
+    """
+    Pair each installed model with its suitability scores.
+
+    Shared by every archetype for the same inputs, so the tag stripping and
+    fallback lookups run once per installed-model set rather than once per
+    archetype. Models without suitability data are dropped.
+    """
+    model_suitability = {model_name: dict(scores) for model_name, scores in suitability_key}
+    resolved = []
     for model_name in installed_models:
         # Get base model name (handle tags like "llama3.1:latest")
-        base_model = model_name.split(":")[0] if ":" in model_name else model_name
-
-        # Get suitability scores for this model
+        base_model = model_name.split(":", 1)[0]
         suitability = model_suitability.get(model_name) or model_suitability.get(base_model)
-
         if suitability:
-            # Calculate weighted score based on archetype requirements
-            total_score = 0
-            total_weight = 0
+            resolved.append((model_name, suitability))
+    return tuple(resolved)
 
-            for capability, min_score in requirements.items():
-                model_score = suitability.get(capability, 5)
-                # Weight by how important the capability is (higher min = more important)
-                weight = min_score / 10
-                total_weight += weight
-                total_score += model_score * weight
 
-            if total_weight > 0:
-                avg_score = total_score / total_weight
-                scored_models.append((model_name, avg_score))
+def _score_recommendations(
+    archetype_id: str,
+    resolved_models: tuple[tuple[str, dict], ...],
+    max_recommendations: int,
+) -> list[str]:
+    """Rank installed models for an archetype, topped up with static recommendations."""
+    requirements = ARCHETYPE_REQUIREMENTS.get(archetype_id, {"general": 7})
 
-    # Sort by score (highest first) and return top recommendations
-    scored_models.sort(key=lambda x: x[1], reverse=True)
-    recommendations = [model for model, _ in scored_models[:max_recommendations]]
+    # Weight each capability by how important it is (higher min = more important).
+    # The weights are the same for every model, so compute them once.
+    weighted_requirements = [(capability, min_score / 10) for capability, min_score in requirements.items()]
+    total_weight = sum(weight for _, weight in weighted_requirements)
+
+    # Score each installed model based on archetype requirements
+    scored_models = []
+
+    if total_weight > 0:
+        for model_name, suitability in resolved_models:
+            total_score = sum(
+                suitability.get(capability, 5) * weight
+                for capability, weight in weighted_requirements
+            )
+            scored_models.append((model_name, total_score / total_weight))
+
+    # Take the highest scoring models without sorting the full list
+    top_models = heapq.nlargest(max_recommendations, scored_models, key=lambda x: x[1])
+    recommendations = [model for model, _ in top_models]
 
     # If we don't have enough dynamic recommendations, fall back to static ones
     if len(recommendations) < max_recommendations:
-        static_recs = ARCHETYPE_MODEL_RECOMMENDATIONS.get(archetype_id, [])
+        static_recs = ARCHETYPE_MODEL_RECOMMENDATIONS.get(archetype_id, ())
+        seen = set(recommendations)
         for rec in static_recs:
-            if rec not in recommendations and len(recommendations) < max_recommendations:
+            if len(recommendations) >= max_recommendations:
+                break
+            if rec not in seen:
                 recommendations.append(rec)
+                seen.add(rec)
 
     return recommendations
 
 
+# Flat archetype -> system prompt lookup; unknown archetypes use "balanced"
+_ARCHETYPE_SYSTEM_PROMPTS = {key: value["system_prompt"] for key, value in PERSONALITY_ARCHETYPES.items()}
+_DEFAULT_SYSTEM_PROMPT = _ARCHETYPE_SYSTEM_PROMPTS["balanced"]
+
+
 def get_archetype_system_prompt(archetype_id: str, custom_personality: str | None = None) -> str:
     """
     Get system prompt for an archetype with optional custom personality overlay.
@@ -256,7 +325,7 @@ def get_archetype_system_prompt(archetype_id: str, custom_personality: str | Non
     Returns:
         Combined system prompt
     """
-    base_prompt = PERSONALITY_ARCHETYPES.get(archetype_id, PERSONALITY_ARCHETYPES["balanced"])["system_prompt"]
+    base_prompt = _ARCHETYPE_SYSTEM_PROMPTS.get(archetype_id, _DEFAULT_SYSTEM_PROMPT)
 
     if custom_personality and custom_personality.strip():
         return f"{base_prompt}\n\nAdditional personality guidance: {custom_personality.strip()}"
@@ -16,3 +16,6 @@ MAX_ITERATIONS = 10
 MIN_ITERATIONS = 1
 MAX_COUNCIL_MEMBERS = 10
 MIN_COUNCIL_MEMBERS = 1
+
+# Template limits (backend only - bounds the serialized members JSON)
+MAX_TEMPLATE_SIZE = 1024 * 1024  # 1MB
@@ -1,4 +1,5 @@
 """FastAPI application entry point."""
+import asyncio
 import logging
 import uuid
 from contextlib import asynccontextmanager
@@ -9,6 +10,8 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from app.core.config import settings
 from app.core.database import init_db, close_db
 from app.api.routes import session, providers, files, ollama, config, archetypes, system, templates
+from app.services import file_processor, mlx_model_manager
+from app.services.ai_providers import anthropic_provider, grok_provider, ollama_provider, openai_provider
 
 # Configure logging
 logging.basicConfig(
@@ -56,6 +59,12 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down...")
     await close_db()
     logger.info("Database connections closed.")
+    await openai_provider.close_clients()
+    await anthropic_provider.close_clients()
+    await grok_provider.close_clients()
+    await ollama_provider.close_clients()
+    await mlx_model_manager.close_client()
+    await asyncio.to_thread(file_processor.shutdown_pdf_pool, wait=True)
 
 
 # Create FastAPI app
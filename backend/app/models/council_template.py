@@ -1,8 +1,7 @@
 """Council template model for saving and reusing council configurations."""
-from sqlalchemy import Column, String, Text, DateTime
+from sqlalchemy import Column, String, DateTime, JSON
 from sqlalchemy.sql import func
 from app.core.database import Base
-import json
 
 
 class CouncilTemplate(Base):
@@ -13,17 +12,23 @@ class CouncilTemplate(Base):
     id = Column(String, primary_key=True)
     name = Column(String, nullable=False)
     description = Column(String, nullable=True)
-    members_json = Column(Text, nullable=False)  # JSON array of council members
+    members_json = Column(JSON, nullable=False)  # JSON array of council members, decoded on load
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
+    # Fetch server-generated timestamps with RETURNING on INSERT/UPDATE
+    # so writes don't need a follow-up refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
+
     def to_dict(self):
         """Convert to dictionary."""
+        created_at = self.created_at
+        updated_at = self.updated_at
         return {
             "id": self.id,
             "name": self.name,
             "description": self.description,
-            "members": json.loads(self.members_json),
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "members": self.members_json,
+            "created_at": created_at and created_at.isoformat(),
+            "updated_at": updated_at and updated_at.isoformat(),
         }
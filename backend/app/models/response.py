@@ -1,9 +1,10 @@
 """Response database model."""
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, Float
+from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, Float, Index, Enum
+from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
+from app.core.constants import ResponseRole
 from app.core.database import Base
 
 
@@ -13,7 +14,7 @@ class Response(Base):
     __tablename__ = "responses"
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
 
     # Foreign key
     session_id = Column(String, ForeignKey("sessions.id"), nullable=False)
@@ -27,7 +28,17 @@ class Response(Base):
 
     # Iteration context
     iteration = Column(Integer, default=1, nullable=False)
-    role = Column(String, nullable=False)  # 'council' or 'chair'
+    # 'council' or 'chair', stored as the plain string value
+    role = Column(
+        Enum(
+            ResponseRole,
+            native_enum=False,
+            create_constraint=False,
+            values_callable=lambda roles: [role.value for role in roles],
+            length=16,
+        ),
+        nullable=False,
+    )
 
     # Metadata
     input_tokens = Column(Integer, default=0)
@@ -41,5 +52,15 @@ class Response(Base):
     # Relationship
     session = relationship("Session", back_populates="responses")
 
+    # Responses are always looked up per session, usually narrowed by
+    # iteration and role; the leading session_id also serves cascade deletes
+    __table_args__ = (
+        Index("ix_responses_session_iter_role", "session_id", "iteration", "role"),
+    )
+
+    # created_at is rendered as a SQL expression; fetch it with RETURNING
+    # on INSERT so async callers never trigger a lazy reload
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self):
         return f"<Response(id={self.id}, provider={self.provider}, role={self.role}, iteration={self.iteration})>"
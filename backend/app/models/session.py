@@ -1,9 +1,10 @@
 """Session database model."""
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Integer, DateTime, Text, Boolean
+from sqlalchemy import Column, String, Integer, DateTime, Text, Boolean, JSON, Enum
+from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
+from app.core.constants import SessionStatus
 from app.core.database import Base
 
 
@@ -13,8 +14,8 @@ class Session(Base):
     __tablename__ = "sessions"
 
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
 
     # Original prompt
     prompt = Column(Text, nullable=False)
@@ -34,21 +35,42 @@ class Session(Base):
     user_guidance = Column(Text, nullable=True)
 
     # Status: 'pending', 'running', 'paused', 'completed', 'failed'
-    status = Column(String, default="pending", nullable=False)
+    # Stored as the plain string value (compatible with existing rows) and
+    # loaded as a SessionStatus member
+    status = Column(
+        Enum(
+            SessionStatus,
+            native_enum=False,
+            create_constraint=False,
+            values_callable=lambda statuses: [status.value for status in statuses],
+            length=16,
+        ),
+        default=SessionStatus.PENDING,
+        nullable=False,
+    )
 
-    # Provider selection (JSON arrays)
+    # Provider selection (JSON columns, (de)serialized by SQLAlchemy)
     # Note: selected_providers is deprecated - use council_members instead
-    selected_providers = Column(Text, nullable=True)  # [DEPRECATED] JSON serialized list
-    excluded_providers = Column(Text, nullable=True)  # JSON serialized list (for iterations)
+    selected_providers = Column(JSON, nullable=True)  # [DEPRECATED] list of provider names
+    excluded_providers = Column(JSON, nullable=True)  # list of provider names (for iterations)
 
     # Council members configuration
-    council_members = Column(Text, nullable=True)  # JSON serialized list of council member configs
+    council_members = Column(JSON, nullable=True)  # list of council member configs
 
     # Autopilot mode
     autopilot = Column(Boolean, default=False, nullable=False)
 
     # Relationships
-    responses = relationship("Response", back_populates="session", cascade="all, delete-orphan")
+    responses = relationship(
+        "Response",
+        back_populates="session",
+        cascade="all, delete-orphan",
+        order_by="Response.iteration",
+    )
+
+    # Timestamps are rendered as SQL expressions; fetch them with RETURNING
+    # on INSERT/UPDATE so async callers never trigger a lazy reload
+    __mapper_args__ = {"eager_defaults": True}
 
     def __repr__(self):
         return f"<Session(id={self.id}, prompt={self.prompt[:50]}..., status={self.status})>"
@@ -1,6 +1,6 @@
 """Settings database model."""
-from datetime import datetime
 from sqlalchemy import Column, String, Text, DateTime
+from sqlalchemy.sql import func
 
 from app.core.database import Base
 
@@ -12,7 +12,11 @@ class Settings(Base):
 
     key = Column(String, primary_key=True)
     value = Column(Text, nullable=False)  # JSON serialized
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+    # Timestamps are rendered as SQL expressions; fetch them with RETURNING
+    # on INSERT/UPDATE so async callers never trigger a lazy reload
+    __mapper_args__ = {"eager_defaults": True}
 
     def __repr__(self):
         return f"<Settings(key={self.key}, value={self.value[:50]}...)>"
@@ -27,7 +27,7 @@ class CouncilMember(BaseModel):
     model: str = Field(..., description="Model name to use")
     role: str = Field(..., description="Display name/role for this member")
     archetype: str = Field(default="balanced", description="Personality archetype ID")
-    custom_personality: str | None = Field(default=None, description="Custom personality instructions")
+    custom_personality: str | None = Field(default=None, max_length=MAX_PROMPT_LENGTH, description="Custom personality instructions")
     is_chair: bool = Field(default=False, description="Whether this member is the chair")
 
 
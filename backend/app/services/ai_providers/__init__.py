@@ -1,5 +1,5 @@
 """AI provider services."""
-from .base import AIProvider
+from .base import AIProvider, TokenUsage
 from .openai_provider import OpenAIProvider
 from .anthropic_provider import AnthropicProvider
 from .google_provider import GoogleProvider
@@ -13,4 +13,5 @@ __all__ = [
     "GoogleProvider",
     "GrokProvider",
     "ProviderFactory",
+    "TokenUsage",
 ]
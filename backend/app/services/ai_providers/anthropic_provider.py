@@ -1,9 +1,10 @@
 """Anthropic (Claude) provider implementation."""
+import httpx
 from anthropic import AsyncAnthropic, APIError, RateLimitError as AnthropicRateLimitError, AuthenticationError as AnthropicAuthError
 from typing import AsyncGenerator
 
-from .base import AIProvider
-from app.core.constants import PRICING, PROVIDER_CONFIGS
+from .base import AIProvider, TokenUsage
+from app.core.constants import PROVIDER_CONFIGS, PROVIDER_PRICING
 from app.core.exceptions import (
     AIProviderError,
     RateLimitError,
@@ -15,6 +16,55 @@ from app.core.exceptions import (
     ServiceUnavailableError,
 )
 
+# (substrings that must all appear, exception class) checked in order
+# against the lowercased APIError message
+_API_ERROR_RULES = (
+    (("model", "not found"), ModelNotFoundError),
+    (("context",), ContextLengthError),
+    (("too long",), ContextLengthError),
+    (("content", "blocked"), ContentFilterError),
+    (("content", "filter"), ContentFilterError),
+    (("timeout",), TimeoutError),
+    (("overloaded",), ServiceUnavailableError),
+    (("unavailable",), ServiceUnavailableError),
+)
+
+
+def _classify_api_error(message: str) -> type[AIProviderError]:
+    """Map an Anthropic APIError message to the matching provider exception class."""
+    lowered = message.lower()
+    for needles, error_cls in _API_ERROR_RULES:
+        if all(needle in lowered for needle in needles):
+            return error_cls
+    return AIProviderError
+
+
+# Clients shared by all AnthropicProvider instances, keyed by API key, so
+# each session reuses the same connection pool and TLS sessions
+_clients: dict[str, AsyncAnthropic] = {}
+
+
+def _get_client(api_key: str) -> AsyncAnthropic:
+    """Return the shared client for this key, creating it on first use."""
+    client = _clients.get(api_key)
+    if client is None:
+        client = _clients[api_key] = AsyncAnthropic(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                timeout=httpx.Timeout(60.0, connect=5.0),
+            ),
+        )
+    return client
+
+
+async def close_clients() -> None:
+    """Close all shared Anthropic clients (called on application shutdown)."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.close()
+
 
 class AnthropicProvider(AIProvider):
     """Anthropic Claude API provider."""
@@ -22,7 +72,7 @@ class AnthropicProvider(AIProvider):
     def __init__(self, api_key: str, model: str | None = None):
         """Initialize Anthropic provider."""
         super().__init__(api_key, model)
-        self.client = AsyncAnthropic(api_key=api_key)
+        self.client = _get_client(api_key)
         self.name = "anthropic"
 
     async def stream_completion(
@@ -32,52 +82,61 @@ class AnthropicProvider(AIProvider):
         temperature: float = 0.7,
         max_tokens: int = 2000,
         image_data: str | None = None,
-    ) -> AsyncGenerator[str, None]:
+        context: str | None = None,
+    ) -> AsyncGenerator[str | TokenUsage, None]:
         """Stream completion from Anthropic."""
+        system = system_prompt if system_prompt else ""
+        if context:
+            # Mark the shared context as a cache breakpoint so later requests
+            # read it from the prompt cache at the discounted rate
+            system = [{
+                "type": "text",
+                "text": self._system_with_context(None, context),
+                "cache_control": {"type": "ephemeral"},
+            }]
+            if system_prompt:
+                system.append({"type": "text", "text": system_prompt})
+
         try:
             async with self.client.messages.stream(
                 model=self.model,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                system=system_prompt if system_prompt else "",
+                system=system,
                 messages=[
                     {"role": "user", "content": prompt}
                 ],
             ) as stream:
-                async for text in stream.text_stream:
-                    yield text
+                async for piece in self._batched_stream(stream.text_stream):
+                    yield piece
+                # Prompt-cache reads and writes are reported apart from
+                # input_tokens but are still part of the prompt
+                usage = (await stream.get_final_message()).usage
+                yield TokenUsage(
+                    usage.input_tokens
+                    + (usage.cache_creation_input_tokens or 0)
+                    + (usage.cache_read_input_tokens or 0),
+                    usage.output_tokens,
+                )
 
         except AnthropicRateLimitError as e:
             raise RateLimitError(str(e), provider="anthropic")
         except AnthropicAuthError as e:
             raise AuthenticationError(str(e), provider="anthropic")
         except APIError as e:
-            error_message = str(e).lower()
-            if "model" in error_message and "not found" in error_message:
+            error_message = str(e)
+            error_cls = _classify_api_error(error_message)
+            if error_cls is ModelNotFoundError:
                 raise ModelNotFoundError(self.model, provider="anthropic")
-            elif "context" in error_message or "too long" in error_message:
-                raise ContextLengthError(str(e), provider="anthropic")
-            elif "content" in error_message and ("blocked" in error_message or "filter" in error_message):
-                raise ContentFilterError(str(e), provider="anthropic")
-            elif "timeout" in error_message:
-                raise TimeoutError(str(e), provider="anthropic")
-            elif "overloaded" in error_message or "unavailable" in error_message:
-                raise ServiceUnavailableError(str(e), provider="anthropic")
-            else:
-                raise AIProviderError(f"Anthropic API error: {str(e)}", provider="anthropic")
+            if error_cls is AIProviderError:
+                raise AIProviderError(f"Anthropic API error: {error_message}", provider="anthropic")
+            raise error_cls(error_message, provider="anthropic")
         except Exception as e:
             raise AIProviderError(f"Anthropic error: {str(e)}", provider="anthropic")
 
-    def count_tokens(self, text: str) -> int:
-        """
-        Count tokens using Claude's tokenizer.
-        Note: This is an approximation. For exact counts, use Anthropic's count_tokens API.
-        """
-        try:
-            # Rough estimate: Claude uses ~4 characters per token on average
-            return len(text) // 4
-        except Exception:
-            return len(text) // 4
+    # Rough estimate: Claude uses ~4 characters per token on average.
+    # For exact counts, use Anthropic's count_tokens API.
+    count_tokens = staticmethod(AIProvider._approx_tokens)
 
     def get_default_model(self) -> str:
         """Get default Anthropic model."""
@@ -85,6 +144,5 @@ class AnthropicProvider(AIProvider):
 
     def get_pricing(self) -> tuple[float, float]:
         """Get Anthropic pricing."""
-        key = f"anthropic:{self.model}"
         # Default to Sonnet 4 pricing if model not found
-        return PRICING.get(key, (3.0, 15.0))
+        return PROVIDER_PRICING["anthropic"].get(self.model, (3.0, 15.0))
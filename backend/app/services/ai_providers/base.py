@@ -1,6 +1,14 @@
 """Abstract base class for AI providers."""
+import asyncio
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator
+from typing import AsyncGenerator, AsyncIterator, NamedTuple
+
+
+class TokenUsage(NamedTuple):
+    """Exact token counts a provider reports at the end of a stream."""
+
+    input_tokens: int
+    output_tokens: int
 
 
 class AIProvider(ABC):
@@ -12,6 +20,20 @@ class AIProvider(ABC):
         self.model = model or self.get_default_model()
         self.name = self.__class__.__name__.replace("Provider", "").lower()
 
+    @property
+    def model(self) -> str:
+        """Active model name."""
+        return self._model
+
+    @model.setter
+    def model(self, value: str) -> None:
+        # Resolve the per-token rates whenever the model changes (e.g. on a
+        # ProviderFactory model variant) rather than per estimate
+        self._model = value
+        input_price, output_price = self.get_pricing()
+        self._input_rate = input_price / 1000
+        self._output_rate = output_price / 1000
+
     @abstractmethod
     async def stream_completion(
         self,
@@ -20,7 +42,8 @@ class AIProvider(ABC):
         temperature: float = 0.7,
         max_tokens: int = 2000,
         image_data: str | None = None,
-    ) -> AsyncGenerator[str, None]:
+        context: str | None = None,
+    ) -> AsyncGenerator[str | TokenUsage, None]:
         """
         Stream completion tokens from the AI provider.
 
@@ -30,16 +53,101 @@ class AIProvider(ABC):
             temperature: Temperature for response randomness
             max_tokens: Maximum tokens in response
             image_data: Optional base64 encoded image data for vision models
+            context: Optional reference material (e.g. uploaded files) shared
+                by every request of a session
 
         Yields:
-            str: Token strings as they arrive
+            str: Token strings as they arrive; providers whose API reports
+            usage end the stream with a TokenUsage
         """
         pass
 
+    @staticmethod
+    def _system_with_context(system_prompt: str | None, context: str | None) -> str | None:
+        """
+        Combine shared context and a system prompt into one system message.
+
+        The context goes first, so every request carrying it starts with the
+        same prefix and can be served from the provider's prompt cache.
+        """
+        if not context:
+            return system_prompt
+        block = f"<FILE_CONTEXT>\n{context}\n</FILE_CONTEXT>"
+        return f"{block}\n\n{system_prompt}" if system_prompt else block
+
+    async def _batched_stream(
+        self,
+        chunks: AsyncIterator[str],
+        max_chars: int = 64,
+        max_delay_ms: int = 20,
+    ) -> AsyncGenerator[str, None]:
+        """
+        Coalesce small upstream chunks into fewer, larger yields.
+
+        A batch is flushed once it reaches max_chars, once max_delay_ms has
+        passed since its first chunk arrived, or when the upstream ends.
+
+        Args:
+            chunks: Upstream token stream
+            max_chars: Flush once the buffered text reaches this length
+            max_delay_ms: Maximum time a chunk waits in the buffer
+
+        Yields:
+            str: Concatenated chunks
+        """
+        loop = asyncio.get_running_loop()
+        iterator = chunks.__aiter__()
+        max_delay = max_delay_ms / 1000
+        buffer: list[str] = []
+        buffered_chars = 0
+        deadline = 0.0
+        # The pending __anext__ is kept across flushes rather than cancelled
+        # on timeout, since cancelling it would tear down the upstream stream
+        pending: asyncio.Future | None = None
+
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(iterator.__anext__())
+
+                timeout = max(deadline - loop.time(), 0) if buffer else None
+                done, _ = await asyncio.wait((pending,), timeout=timeout)
+                if not done:
+                    # Deadline passed while waiting for the next chunk
+                    yield "".join(buffer)
+                    buffer.clear()
+                    buffered_chars = 0
+                    continue
+
+                finished, pending = pending, None
+                try:
+                    chunk = finished.result()
+                except StopAsyncIteration:
+                    break
+
+                if not buffer:
+                    deadline = loop.time() + max_delay
+                buffer.append(chunk)
+                buffered_chars += len(chunk)
+
+                if buffered_chars >= max_chars or loop.time() >= deadline:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    buffered_chars = 0
+
+            if buffer:
+                yield "".join(buffer)
+        finally:
+            if pending is not None:
+                pending.cancel()
+
     def supports_vision(self) -> bool:
         """
         Check if this provider supports vision/image inputs.
 
+        Deprecated for callers holding a ProviderFactory: use
+        ProviderFactory.supports_vision, which answers from PROVIDER_CONFIGS.
+
         Returns:
             bool: True if provider supports vision
         """
@@ -58,6 +166,15 @@ class AIProvider(ABC):
         """
         pass
 
+    @staticmethod
+    def _approx_tokens(text: str) -> int:
+        """
+        Estimate tokens at ~4 characters per token.
+
+        Providers without a local tokenizer alias count_tokens to this.
+        """
+        return len(text) // 4
+
     @abstractmethod
     def get_default_model(self) -> str:
         """
@@ -98,6 +215,4 @@ class AIProvider(ABC):
         Returns:
             float: Estimated cost in USD
         """
-        input_price, output_price = self.get_pricing()
-        cost = (input_tokens / 1000 * input_price) + (output_tokens / 1000 * output_price)
-        return round(cost, 6)
+        return round(input_tokens * self._input_rate + output_tokens * self._output_rate, 6)
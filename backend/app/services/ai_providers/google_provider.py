@@ -1,10 +1,13 @@
 """Google (Gemini) provider implementation."""
+import re
 import google.generativeai as genai
 from google.api_core import exceptions as google_exceptions
+from google.generativeai import protos
+from google.generativeai.types import BlockedPromptException, StopCandidateException
 from typing import AsyncGenerator
 
 from .base import AIProvider
-from app.core.constants import PRICING, PROVIDER_CONFIGS
+from app.core.constants import PROVIDER_CONFIGS, PROVIDER_PRICING
 from app.core.exceptions import (
     AIProviderError,
     RateLimitError,
@@ -15,6 +18,15 @@ from app.core.exceptions import (
     ServiceUnavailableError,
 )
 
+# Error message patterns, matched case-insensitively without lowercasing
+_CONTEXT_LENGTH_PATTERN = re.compile(r"token|length|too long", re.IGNORECASE)
+_CONTENT_FILTER_PATTERN = re.compile(r"safety|blocked", re.IGNORECASE)
+
+_SAFETY_FINISH_REASON = protos.Candidate.FinishReason.SAFETY
+
+# Distinct (model, temperature, max_tokens) configurations kept per provider
+_MODEL_CACHE_SIZE = 16
+
 
 class GoogleProvider(AIProvider):
     """Google Gemini API provider."""
@@ -24,6 +36,25 @@ class GoogleProvider(AIProvider):
         super().__init__(api_key, model)
         genai.configure(api_key=api_key)
         self.name = "google"
+        self._model_cache: dict[tuple, genai.GenerativeModel] = {}
+
+    def _get_generative_model(self, temperature: float, max_tokens: int) -> genai.GenerativeModel:
+        """Return a GenerativeModel for the current settings, reusing earlier instances."""
+        key = (self.model, temperature, max_tokens)
+        model = self._model_cache.get(key)
+        if model is None:
+            if len(self._model_cache) >= _MODEL_CACHE_SIZE:
+                # Evict the oldest entry
+                self._model_cache.pop(next(iter(self._model_cache)))
+            model = genai.GenerativeModel(
+                model_name=self.model,
+                generation_config={
+                    "temperature": temperature,
+                    "max_output_tokens": max_tokens,
+                }
+            )
+            self._model_cache[key] = model
+        return model
 
     async def stream_completion(
         self,
@@ -32,20 +63,15 @@ class GoogleProvider(AIProvider):
         temperature: float = 0.7,
         max_tokens: int = 2000,
         image_data: str | None = None,
+        context: str | None = None,
     ) -> AsyncGenerator[str, None]:
         """Stream completion from Google Gemini."""
         try:
-            # Create model instance
-            model = genai.GenerativeModel(
-                model_name=self.model,
-                generation_config={
-                    "temperature": temperature,
-                    "max_output_tokens": max_tokens,
-                }
-            )
+            model = self._get_generative_model(temperature, max_tokens)
 
             # Combine system prompt and user prompt if system prompt provided
             full_prompt = prompt
+            system_prompt = self._system_with_context(system_prompt, context)
             if system_prompt:
                 full_prompt = f"{system_prompt}\n\nUser: {prompt}"
 
@@ -55,9 +81,18 @@ class GoogleProvider(AIProvider):
                 stream=True
             )
 
-            async for chunk in response:
-                if chunk.text:
-                    yield chunk.text
+            async def tokens():
+                async for chunk in response:
+                    # A safety stop leaves the chunk without parts; report it
+                    # directly instead of letting chunk.text raise ValueError
+                    candidates = chunk.candidates
+                    if candidates and candidates[0].finish_reason == _SAFETY_FINISH_REASON:
+                        raise ContentFilterError("Response blocked by safety filters", provider="google")
+                    if chunk.text:
+                        yield chunk.text
+
+            async for piece in self._batched_stream(tokens()):
+                yield piece
 
         except google_exceptions.ResourceExhausted as e:
             raise RateLimitError(str(e), provider="google")
@@ -68,28 +103,25 @@ class GoogleProvider(AIProvider):
         except google_exceptions.NotFound as e:
             raise ModelNotFoundError(self.model, provider="google")
         except google_exceptions.InvalidArgument as e:
-            error_msg = str(e).lower()
-            if "token" in error_msg or "length" in error_msg or "too long" in error_msg:
-                raise ContextLengthError(str(e), provider="google")
-            raise AIProviderError(f"Google API error: {str(e)}", provider="google")
+            error_msg = str(e)
+            if _CONTEXT_LENGTH_PATTERN.search(error_msg):
+                raise ContextLengthError(error_msg, provider="google")
+            raise AIProviderError(f"Google API error: {error_msg}", provider="google")
         except google_exceptions.ServiceUnavailable as e:
             raise ServiceUnavailableError(str(e), provider="google")
+        except (BlockedPromptException, StopCandidateException) as e:
+            raise ContentFilterError(str(e), provider="google")
+        except AIProviderError:
+            raise
         except Exception as e:
-            error_msg = str(e).lower()
-            if "safety" in error_msg or "blocked" in error_msg:
-                raise ContentFilterError(str(e), provider="google")
-            raise AIProviderError(f"Google API error: {str(e)}", provider="google")
-
-    def count_tokens(self, text: str) -> int:
-        """
-        Count tokens for Google models.
-        Note: This is an approximation. Google has a count_tokens API for exact counts.
-        """
-        try:
-            # Rough estimate: ~4 characters per token
-            return len(text) // 4
-        except Exception:
-            return len(text) // 4
+            error_msg = str(e)
+            if _CONTENT_FILTER_PATTERN.search(error_msg):
+                raise ContentFilterError(error_msg, provider="google")
+            raise AIProviderError(f"Google API error: {error_msg}", provider="google")
+
+    # Rough estimate: ~4 characters per token.
+    # Google has a count_tokens API for exact counts.
+    count_tokens = staticmethod(AIProvider._approx_tokens)
 
     def get_default_model(self) -> str:
         """Get default Google model."""
@@ -97,6 +129,5 @@ class GoogleProvider(AIProvider):
 
     def get_pricing(self) -> tuple[float, float]:
         """Get Google pricing."""
-        key = f"google:{self.model}"
         # Default to Gemini 1.5 Pro pricing if model not found
-        return PRICING.get(key, (1.25, 5.0))
+        return PROVIDER_PRICING["google"].get(self.model, (1.25, 5.0))
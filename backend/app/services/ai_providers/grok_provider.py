@@ -1,9 +1,10 @@
 """Grok (xAI) provider implementation."""
+import httpx
 from openai import AsyncOpenAI, APIError, RateLimitError as OpenAIRateLimitError, AuthenticationError as OpenAIAuthError
 from typing import AsyncGenerator
 
-from .base import AIProvider
-from app.core.constants import PRICING, PROVIDER_CONFIGS
+from .base import AIProvider, TokenUsage
+from app.core.constants import PROVIDER_CONFIGS, PROVIDER_PRICING
 from app.core.exceptions import (
     AIProviderError,
     RateLimitError,
@@ -15,6 +16,57 @@ from app.core.exceptions import (
     ServiceUnavailableError,
 )
 
+# (substrings that must all appear, exception class) checked in order
+# against the lowercased APIError message
+_API_ERROR_RULES = (
+    (("model", "not found"), ModelNotFoundError),
+    (("model", "does not exist"), ModelNotFoundError),
+    (("context_length",), ContextLengthError),
+    (("maximum context",), ContextLengthError),
+    (("content_filter",), ContentFilterError),
+    (("content_policy",), ContentFilterError),
+    (("timeout",), TimeoutError),
+    (("service", "unavailable"), ServiceUnavailableError),
+)
+
+
+def _classify_api_error(message: str) -> type[AIProviderError]:
+    """Map a Grok APIError message to the matching provider exception class."""
+    lowered = message.lower()
+    for needles, error_cls in _API_ERROR_RULES:
+        if all(needle in lowered for needle in needles):
+            return error_cls
+    return AIProviderError
+
+
+# Clients shared by all GrokProvider instances, keyed by (base_url, api_key),
+# so each session reuses the same connection pool and TLS sessions
+_clients: dict[tuple[str, str], AsyncOpenAI] = {}
+
+
+def _get_client(api_key: str, base_url: str) -> AsyncOpenAI:
+    """Return the shared client for this endpoint and key, creating it on first use."""
+    key = (base_url, api_key)
+    client = _clients.get(key)
+    if client is None:
+        client = _clients[key] = AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                timeout=httpx.Timeout(60.0, connect=5.0),
+            ),
+        )
+    return client
+
+
+async def close_clients() -> None:
+    """Close all shared Grok clients (called on application shutdown)."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.close()
+
 
 class GrokProvider(AIProvider):
     """Grok (xAI) API provider using OpenAI-compatible interface."""
@@ -23,10 +75,7 @@ class GrokProvider(AIProvider):
         """Initialize Grok provider."""
         super().__init__(api_key, model)
         # Grok uses OpenAI-compatible API with custom base URL
-        self.client = AsyncOpenAI(
-            api_key=api_key,
-            base_url=PROVIDER_CONFIGS["grok"]["base_url"]
-        )
+        self.client = _get_client(api_key, PROVIDER_CONFIGS["grok"]["base_url"])
         self.name = "grok"
 
     async def stream_completion(
@@ -36,10 +85,12 @@ class GrokProvider(AIProvider):
         temperature: float = 0.7,
         max_tokens: int = 2000,
         image_data: str | None = None,
-    ) -> AsyncGenerator[str, None]:
+        context: str | None = None,
+    ) -> AsyncGenerator[str | TokenUsage, None]:
         """Stream completion from Grok."""
         messages = []
 
+        system_prompt = self._system_with_context(system_prompt, context)
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
 
@@ -52,40 +103,44 @@ class GrokProvider(AIProvider):
                 temperature=temperature,
                 max_tokens=max_tokens,
                 stream=True,
+                stream_options={"include_usage": True},
             )
+            usage = None
 
-            async for chunk in stream:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+            async def tokens():
+                nonlocal usage
+                async for chunk in stream:
+                    # Bind once per chunk; the final usage chunk has no choices
+                    choices = chunk.choices
+                    if choices:
+                        content = choices[0].delta.content
+                        if content:
+                            yield content
+                    elif getattr(chunk, "usage", None):
+                        usage = chunk.usage
+
+            async for piece in self._batched_stream(tokens()):
+                yield piece
+            if usage:
+                yield TokenUsage(usage.prompt_tokens, usage.completion_tokens)
 
         except OpenAIRateLimitError as e:
             raise RateLimitError(str(e), provider="grok")
         except OpenAIAuthError as e:
             raise AuthenticationError(str(e), provider="grok")
         except APIError as e:
-            error_message = str(e).lower()
-            if "model" in error_message and ("not found" in error_message or "does not exist" in error_message):
+            error_message = str(e)
+            error_cls = _classify_api_error(error_message)
+            if error_cls is ModelNotFoundError:
                 raise ModelNotFoundError(self.model, provider="grok")
-            elif "context_length" in error_message or "maximum context" in error_message:
-                raise ContextLengthError(str(e), provider="grok")
-            elif "content_filter" in error_message or "content_policy" in error_message:
-                raise ContentFilterError(str(e), provider="grok")
-            elif "timeout" in error_message:
-                raise TimeoutError(str(e), provider="grok")
-            elif "service" in error_message and "unavailable" in error_message:
-                raise ServiceUnavailableError(str(e), provider="grok")
-            else:
-                raise AIProviderError(f"Grok API error: {str(e)}", provider="grok")
+            if error_cls is AIProviderError:
+                raise AIProviderError(f"Grok API error: {error_message}", provider="grok")
+            raise error_cls(error_message, provider="grok")
         except Exception as e:
             raise AIProviderError(f"Grok error: {str(e)}", provider="grok")
 
-    def count_tokens(self, text: str) -> int:
-        """Count tokens (rough estimate for Grok)."""
-        try:
-            # Rough estimate: 4 chars per token
-            return len(text) // 4
-        except Exception:
-            return len(text) // 4
+    # Rough estimate: 4 chars per token
+    count_tokens = staticmethod(AIProvider._approx_tokens)
 
     def get_default_model(self) -> str:
         """Get default Grok model."""
@@ -93,5 +148,4 @@ class GrokProvider(AIProvider):
 
     def get_pricing(self) -> tuple[float, float]:
         """Get Grok pricing."""
-        key = f"grok:{self.model}"
-        return PRICING.get(key, (5.0, 15.0))  # Default to grok-beta pricing
+        return PROVIDER_PRICING["grok"].get(self.model, (5.0, 15.0))  # Default to grok-beta pricing
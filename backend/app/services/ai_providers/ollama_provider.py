@@ -3,7 +3,7 @@ import logging
 import httpx
 import psutil
 from typing import AsyncGenerator
-from .base import AIProvider
+from .base import AIProvider, TokenUsage
 from app.core.config import settings
 from app.core.constants import PRICING, PROVIDER_CONFIGS
 from app.core.exceptions import (
@@ -15,6 +15,26 @@ from app.core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Clients shared by all OllamaProvider instances, keyed by server URL, so
+# sessions and the model-management routes reuse the same connection pool
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def _get_client(base_url: str) -> httpx.AsyncClient:
+    """Return the shared client for this server, creating it on first use."""
+    client = _clients.get(base_url)
+    if client is None:
+        client = _clients[base_url] = httpx.AsyncClient(timeout=60.0)  # 60 second timeout for local models
+    return client
+
+
+async def close_clients() -> None:
+    """Close all shared Ollama clients (called on application shutdown)."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
+
 
 class OllamaProvider(AIProvider):
     """Ollama local LLM provider with RAM checks and model suitability."""
@@ -90,7 +110,7 @@ class OllamaProvider(AIProvider):
         super().__init__(api_key, model)
         self.base_url = base_url or settings.ollama_base_url
         self.name = "ollama"
-        self.client = httpx.AsyncClient(timeout=60.0)  # 60 second timeout for local models
+        self.client = _get_client(self.base_url)
 
     async def stream_completion(
         self,
@@ -99,10 +119,12 @@ class OllamaProvider(AIProvider):
         temperature: float = 0.7,
         max_tokens: int = 2000,
         image_data: str | None = None,
-    ) -> AsyncGenerator[str, None]:
+        context: str | None = None,
+    ) -> AsyncGenerator[str | TokenUsage, None]:
         """Stream completion from Ollama."""
         messages = []
 
+        system_prompt = self._system_with_context(system_prompt, context)
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
 
@@ -141,6 +163,9 @@ class OllamaProvider(AIProvider):
                                 content = chunk["message"]["content"]
                                 if content:
                                     yield content
+                            # The final chunk carries the evaluated token counts
+                            if "prompt_eval_count" in chunk and "eval_count" in chunk:
+                                yield TokenUsage(chunk["prompt_eval_count"], chunk["eval_count"])
                         except json.JSONDecodeError:
                             continue
 
@@ -163,10 +188,8 @@ class OllamaProvider(AIProvider):
         vision_models = {"llava", "bakllava", "llava-phi3", "llava-llama3"}
         return any(vm in self.model.lower() for vm in vision_models)
 
-    def count_tokens(self, text: str) -> int:
-        """Count tokens using rough estimation."""
-        # Rough estimate: 4 chars per token for most models
-        return len(text) // 4
+    # Rough estimate: 4 chars per token for most models
+    count_tokens = staticmethod(AIProvider._approx_tokens)
 
     def get_default_model(self) -> str:
         """Get default Ollama model."""
@@ -342,5 +365,4 @@ class OllamaProvider(AIProvider):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        await self.client.aclose()
+        """Async context manager exit; the shared client stays open until shutdown."""
@@ -1,5 +1,6 @@
 """OpenAI provider implementation."""
 import logging
+import httpx
 from openai import AsyncOpenAI, APIError, RateLimitError as OpenAIRateLimitError, AuthenticationError as OpenAIAuthError
 from typing import AsyncGenerator
 
@@ -9,8 +10,8 @@ try:
 except ImportError:
     TIKTOKEN_AVAILABLE = False
 
-from .base import AIProvider
-from app.core.constants import PRICING, PROVIDER_CONFIGS
+from .base import AIProvider, TokenUsage
+from app.core.constants import PROVIDER_CONFIGS, PROVIDER_PRICING
 from app.core.exceptions import (
     AIProviderError,
     RateLimitError,
@@ -24,6 +25,59 @@ from app.core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Clients shared by all OpenAIProvider instances, keyed by API key, so
+# each session reuses the same connection pool and TLS sessions
+_clients: dict[str, AsyncOpenAI] = {}
+
+
+def _get_client(api_key: str) -> AsyncOpenAI:
+    """Return the shared client for this key, creating it on first use."""
+    client = _clients.get(api_key)
+    if client is None:
+        client = _clients[api_key] = AsyncOpenAI(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                timeout=httpx.Timeout(60.0, connect=5.0),
+            ),
+        )
+    return client
+
+
+async def close_clients() -> None:
+    """Close all shared OpenAI clients (called on application shutdown)."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.close()
+
+
+# tiktoken encodings are immutable and safe to share across threads, so each
+# model's encoding is loaded once per process and reused by every instance
+_tokenizers: dict[str, "tiktoken.Encoding | None"] = {}
+
+
+def _get_tokenizer(model: str) -> "tiktoken.Encoding | None":
+    """Return the shared tokenizer for this model, loading it on first use."""
+    if model in _tokenizers:
+        return _tokenizers[model]
+
+    tokenizer = None
+    if TIKTOKEN_AVAILABLE:
+        try:
+            tokenizer = tiktoken.encoding_for_model(model)
+        except KeyError:
+            # Model not found, try cl100k_base (works for most modern models)
+            try:
+                tokenizer = tiktoken.get_encoding("cl100k_base")
+            except Exception as e:
+                logger.warning(f"Could not initialize tiktoken: {e}")
+        except Exception as e:
+            # e.g. the encoding file could not be downloaded
+            logger.warning(f"Could not initialize tiktoken: {e}")
+    _tokenizers[model] = tokenizer
+    return tokenizer
+
 
 class OpenAIProvider(AIProvider):
     """OpenAI API provider."""
@@ -31,20 +85,8 @@ class OpenAIProvider(AIProvider):
     def __init__(self, api_key: str, model: str | None = None):
         """Initialize OpenAI provider."""
         super().__init__(api_key, model)
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = _get_client(api_key)
         self.name = "openai"
-        self._tokenizer = None
-
-        # Initialize tokenizer if tiktoken is available
-        if TIKTOKEN_AVAILABLE:
-            try:
-                self._tokenizer = tiktoken.encoding_for_model(self.model)
-            except KeyError:
-                # Model not found, try cl100k_base (works for most modern models)
-                try:
-                    self._tokenizer = tiktoken.get_encoding("cl100k_base")
-                except Exception as e:
-                    logger.warning(f"Could not initialize tiktoken: {e}")
 
     async def stream_completion(
         self,
@@ -53,10 +95,12 @@ class OpenAIProvider(AIProvider):
         temperature: float = 0.7,
         max_tokens: int = 2000,
         image_data: str | None = None,
-    ) -> AsyncGenerator[str, None]:
+        context: str | None = None,
+    ) -> AsyncGenerator[str | TokenUsage, None]:
         """Stream completion from OpenAI."""
         messages = []
 
+        system_prompt = self._system_with_context(system_prompt, context)
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
 
@@ -84,11 +128,22 @@ class OpenAIProvider(AIProvider):
                 temperature=temperature,
                 max_tokens=max_tokens,
                 stream=True,
+                stream_options={"include_usage": True},
             )
+            usage = None
+
+            async def tokens():
+                nonlocal usage
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+                    elif chunk.usage:
+                        usage = chunk.usage
 
-            async for chunk in stream:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+            async for piece in self._batched_stream(tokens()):
+                yield piece
+            if usage:
+                yield TokenUsage(usage.prompt_tokens, usage.completion_tokens)
 
         except OpenAIRateLimitError as e:
             raise RateLimitError(str(e), provider="openai")
@@ -114,19 +169,18 @@ class OpenAIProvider(AIProvider):
 
     def supports_vision(self) -> bool:
         """Check if model supports vision."""
-        # GPT-4o and GPT-4 Turbo support vision
-        vision_models = {"gpt-4o", "gpt-4o-mini", "gpt-4-turbo"}
-        return self.model in vision_models
+        return self.model in PROVIDER_CONFIGS["openai"]["vision_models"]
 
     def count_tokens(self, text: str) -> int:
         """Count tokens using tiktoken if available, otherwise fallback estimation."""
-        if self._tokenizer:
+        tokenizer = _get_tokenizer(self.model)
+        if tokenizer:
             try:
-                return len(self._tokenizer.encode(text))
+                return len(tokenizer.encode(text))
             except Exception:
                 pass
         # Fallback: rough estimate (4 chars per token)
-        return len(text) // 4
+        return self._approx_tokens(text)
 
     def get_default_model(self) -> str:
         """Get default OpenAI model."""
@@ -134,5 +188,4 @@ class OpenAIProvider(AIProvider):
 
     def get_pricing(self) -> tuple[float, float]:
         """Get OpenAI pricing."""
-        key = f"openai:{self.model}"
-        return PRICING.get(key, (5.0, 15.0))  # Default to gpt-4o pricing
+        return PROVIDER_PRICING["openai"].get(self.model, (5.0, 15.0))  # Default to gpt-4o pricing
@@ -1,4 +1,7 @@
 """Factory for creating AI provider instances."""
+import copy
+from typing import Callable
+
 from .base import AIProvider
 from .openai_provider import OpenAIProvider
 from .anthropic_provider import AnthropicProvider
@@ -9,6 +12,19 @@ from app.core.config import settings
 from app.core.constants import PROVIDER_CONFIGS
 
 
+# (provider, model) pairs declared vision-capable in PROVIDER_CONFIGS. Providers
+# without a "vision_models" list (e.g. Ollama, which matches local model names
+# by substring) are answered by the provider itself.
+_VISION_CAPABLE = frozenset(
+    (name, model)
+    for name, config in PROVIDER_CONFIGS.items()
+    for model in config.get("vision_models", ())
+)
+_VISION_TABLE_PROVIDERS = frozenset(
+    name for name, config in PROVIDER_CONFIGS.items() if "vision_models" in config
+)
+
+
 class ProviderFactory:
     """Factory for creating and managing AI providers."""
 
@@ -21,8 +37,9 @@ class ProviderFactory:
                           If not provided, uses defaults from settings or PROVIDER_CONFIGS.
         """
         self._providers: dict[str, AIProvider] = {}
+        self._model_variants: dict[tuple[str, str], AIProvider] = {}
         self._model_configs = model_configs or {}
-        self._initialize_providers()
+        self._constructors = self._collect_constructors()
 
     def _get_model_for_provider(self, provider_name: str) -> str | None:
         """
@@ -47,35 +64,52 @@ class ProviderFactory:
         # Return None to use provider default
         return None
 
-    def _initialize_providers(self):
-        """Initialize all configured providers with their models."""
+    def _collect_constructors(self) -> dict[str, Callable[[], AIProvider]]:
+        """
+        Collect constructors for all configured providers.
+
+        Providers are only instantiated on first use (see get_provider), so a
+        session that uses one provider doesn't set up SDK clients for the rest.
+        """
+        constructors: dict[str, Callable[[], AIProvider]] = {}
+
         if settings.openai_api_key:
-            model = self._get_model_for_provider("openai")
-            self._providers["openai"] = OpenAIProvider(settings.openai_api_key, model)
+            constructors["openai"] = lambda: OpenAIProvider(
+                settings.openai_api_key, self._get_model_for_provider("openai")
+            )
 
         if settings.anthropic_api_key:
-            model = self._get_model_for_provider("anthropic")
-            self._providers["anthropic"] = AnthropicProvider(settings.anthropic_api_key, model)
+            constructors["anthropic"] = lambda: AnthropicProvider(
+                settings.anthropic_api_key, self._get_model_for_provider("anthropic")
+            )
 
         if settings.google_api_key:
-            model = self._get_model_for_provider("google")
-            self._providers["google"] = GoogleProvider(settings.google_api_key, model)
+            constructors["google"] = lambda: GoogleProvider(
+                settings.google_api_key, self._get_model_for_provider("google")
+            )
 
         if settings.grok_api_key:
-            model = self._get_model_for_provider("grok")
-            self._providers["grok"] = GrokProvider(settings.grok_api_key, model)
+            constructors["grok"] = lambda: GrokProvider(
+                settings.grok_api_key, self._get_model_for_provider("grok")
+            )
 
         # Ollama is always available (local, no API key needed)
-        model = self._get_model_for_provider("ollama")
         base_url = getattr(settings, "ollama_base_url", "http://localhost:11434")
-        self._providers["ollama"] = OllamaProvider("not-needed", model, base_url)
+        constructors["ollama"] = lambda: OllamaProvider(
+            "not-needed", self._get_model_for_provider("ollama"), base_url
+        )
+
+        return constructors
 
-    def get_provider(self, name: str) -> AIProvider:
+    def get_provider(self, name: str, model: str | None = None) -> AIProvider:
         """
         Get a provider by name.
 
         Args:
             name: Provider name (e.g., 'openai')
+            model: Optional model the instance must use. Each other model gets
+                its own instance, sharing the provider's client, so concurrent
+                requests to different models never contend over `model`.
 
         Returns:
             AIProvider: The provider instance
@@ -83,18 +117,30 @@ class ProviderFactory:
         Raises:
             ValueError: If provider not found or not configured
         """
-        if name not in self._providers:
-            raise ValueError(f"Provider '{name}' not found or not configured")
-        return self._providers[name]
+        provider = self._providers.get(name)
+        if provider is None:
+            constructor = self._constructors.get(name)
+            if constructor is None:
+                raise ValueError(f"Provider '{name}' not found or not configured")
+            provider = self._providers[name] = constructor()
+        if not model or model == provider.model:
+            return provider
+
+        key = (name, model)
+        variant = self._model_variants.get(key)
+        if variant is None:
+            variant = self._model_variants[key] = copy.copy(provider)
+            variant.model = model
+        return variant
 
     def get_all_providers(self) -> list[AIProvider]:
         """
-        Get all configured providers.
+        Get all configured providers, instantiating any not yet used.
 
         Returns:
             list[AIProvider]: List of all providers
         """
-        return list(self._providers.values())
+        return [self.get_provider(name) for name in self._constructors]
 
     def get_provider_names(self) -> list[str]:
         """
@@ -103,7 +149,7 @@ class ProviderFactory:
         Returns:
             list[str]: List of provider names
         """
-        return list(self._providers.keys())
+        return list(self._constructors)
 
     def is_provider_configured(self, name: str) -> bool:
         """
@@ -115,7 +161,28 @@ class ProviderFactory:
         Returns:
             bool: True if provider is configured
         """
-        return name in self._providers
+        return name in self._constructors
+
+    def supports_vision(self, name: str, model: str | None = None) -> bool:
+        """
+        Check if a provider's model accepts image inputs.
+
+        Args:
+            name: Provider name
+            model: Model to check; defaults to the provider's current model
+
+        Returns:
+            bool: True if the provider's model supports vision
+
+        Raises:
+            ValueError: If provider not found or not configured
+        """
+        if model and name in _VISION_TABLE_PROVIDERS:
+            return (name, model) in _VISION_CAPABLE
+        provider = self.get_provider(name, model)
+        if name in _VISION_TABLE_PROVIDERS:
+            return (name, provider.model) in _VISION_CAPABLE
+        return provider.supports_vision()
 
     def get_available_models(self, provider_name: str) -> list[str]:
         """
@@ -1,13 +1,312 @@
 """MLX model manager for downloading and converting HuggingFace models."""
+import asyncio
+import fnmatch
+import hashlib
+import importlib.util
+import json
 import logging
 import os
-import subprocess
+import re
+import shutil
+import stat
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import AsyncGenerator
+from types import MappingProxyType
+from typing import AsyncGenerator, Mapping
 import httpx
 
+from app.core.config import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
+# Files needed to run an MLX model; skips READMEs, images and original
+# (non-MLX) checkpoints that some repos carry alongside the weights
+HF_ALLOW_PATTERNS = ["*.safetensors", "*.json", "*.model", "tokenizer*", "*.txt"]
+HF_ENDPOINT = "https://huggingface.co"
+
+# At most HF_MAX_PARALLEL_FILES files x HF_RANGE_SPLITS ranges are in flight,
+# which fits the client's 32-connection pool
+HF_MAX_PARALLEL_FILES = 4
+HF_RANGE_SPLITS = 8
+HF_MIN_RANGE_BYTES = 8 * 1024 * 1024  # smaller files are fetched in one request
+HF_CHUNK_BYTES = 1024 * 1024
+HF_CHECKPOINT_BYTES = 64 * 1024 * 1024  # range progress is saved at least this often
+HF_PROGRESS_INTERVAL = 0.25  # seconds between byte progress updates
+
+# Used instead of the built-in downloader when aria2c is on PATH
+ARIA2_ARGS = [
+    "--input-file=-",
+    f"--max-concurrent-downloads={HF_MAX_PARALLEL_FILES}",
+    "--split=16",
+    "--max-connection-per-server=16",
+    "--min-split-size=1M",
+    "--file-allocation=falloc",
+    "--auto-file-renaming=false",
+    "--continue=true",
+    "--summary-interval=1",
+    "--console-log-level=warn",
+]
+# Summary readout, e.g. "[#2089b0 400MiB/1.2GiB(33%) CN:16 DL:115MiB ETA:7s]"
+_ARIA2_PROGRESS = re.compile(r"\[#(\w+) ([\d.]+)([KMGT]?i?B)/")
+_ARIA2_UNITS = {"B": 1, "KiB": 1024, "MiB": 1024**2, "GiB": 1024**3, "TiB": 1024**4}
+
+DELETE_WORKERS = 8  # unlink releases the GIL, so deletes overlap in threads
+
+# Present in a model directory while its download is incomplete; records each
+# file's ETag, size and per-range progress so a retry fetches only what's missing
+DOWNLOAD_STATE_FILE = ".hivecouncil_download_state.json"
+
+# Total bytes of a downloaded model, reused while it is newer than the directory
+SIZE_CACHE_FILE = ".size"
+_BOOKKEEPING_FILES = frozenset({SIZE_CACHE_FILE, DOWNLOAD_STATE_FILE})
+
+
+# Modelfile written next to downloaded weights; only the FROM path varies
+MODELFILE_TEMPLATE = """FROM {path}
+TEMPLATE \"\"\"{{{{ if .System }}}}{{{{ .System }}}}{{{{ end }}}}{{{{ if .Prompt }}}}{{{{ .Prompt }}}}{{{{ end }}}}\"\"\"
+PARAMETER temperature 0.7
+PARAMETER top_p 0.9
+"""
+
+
+def _resolved_request(head: httpx.Response, headers: dict) -> tuple[str, dict]:
+    """
+    URL a HEAD request was finally answered from, and the headers to send there.
+
+    Like httpx's own redirect handling, the token is not sent on to another
+    host: it would leak to the CDN and can break its presigned URLs.
+    """
+    if head.history and head.url.host != head.history[0].url.host:
+        headers = {name: value for name, value in headers.items() if name.lower() != "authorization"}
+    return str(head.url), headers
+
+
+def _write_download_state(state_path: Path, state: dict) -> None:
+    """Atomically replace the download state file."""
+    tmp_path = state_path.with_name(state_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(state))
+    os.replace(tmp_path, state_path)
+
+
+
+def _scandir_files(path):
+    """Yield DirEntry objects for every file under path.
+
+    DirEntry caches the type from the directory read, so unlike
+    Path.rglob() plus is_file()/stat() no extra syscalls are needed to
+    classify entries. Symlinked directories are not followed.
+    """
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scandir_files(entry.path)
+                elif entry.is_file():
+                    yield entry
+    except PermissionError:
+        pass
+
+
+def _dir_exists(path) -> bool:
+    """True if path is a directory, with a single stat call."""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def _fast_rmtree(root: str) -> None:
+    """Delete a directory tree, unlinking files from a thread pool.
+
+    Symlinks are removed, never followed, including a symlinked root: only
+    the link itself is deleted, not the directory it points to.
+    """
+    if os.path.islink(root):
+        os.unlink(root)
+        return
+
+    dirs = []
+    files = []
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        dirs.append(path)
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    files.append(entry.path)
+
+    with ThreadPoolExecutor(DELETE_WORKERS) as executor:
+        for _ in executor.map(os.unlink, files):
+            pass
+
+    # Children were discovered after their parents, so remove in reverse
+    for path in reversed(dirs):
+        os.rmdir(path)
+
+
+def _preallocate(fd: int, size: int) -> None:
+    """Reserve size bytes for fd up front, contiguously where the OS supports it."""
+    if hasattr(os, "posix_fallocate") and size:
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return
+        except OSError:
+            pass  # e.g. filesystems without fallocate support
+    os.ftruncate(fd, size)
+
+
+def _bypass_page_cache(fd: int) -> None:
+    """On macOS, stop fd's reads and writes from filling the page cache (F_NOCACHE)."""
+    if fcntl is not None and hasattr(fcntl, "F_NOCACHE"):
+        fcntl.fcntl(fd, fcntl.F_NOCACHE, 1)
+
+
+def _drop_page_cache(path: Path) -> None:
+    """On Linux, flush a finished file and drop its pages from the page cache.
+
+    Multi-GB shards would otherwise sit in cache and evict the pages of
+    models that are loaded for inference.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # Only clean pages can be dropped
+        os.fdatasync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def _file_sha256(path: Path) -> str:
+    """SHA-256 hex digest of a file, read in chunks (hashlib releases the GIL)."""
+    digest = hashlib.sha256()
+    buffer = bytearray(HF_CHUNK_BYTES)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        _bypass_page_cache(f.fileno())
+        while n := f.readinto(buffer):
+            digest.update(view[:n])
+    return digest.hexdigest()
+
+
+def _model_size(path: str) -> int:
+    """Total bytes of the model files under a directory, cached in its SIZE_CACHE_FILE.
+
+    The cache file itself and download bookkeeping (resume state, aria2
+    control files) are not counted. Adding or removing top-level files bumps
+    the directory mtime past the cache file's, which triggers a fresh walk.
+    """
+    cache_path = os.path.join(path, SIZE_CACHE_FILE)
+    try:
+        if os.stat(cache_path).st_mtime >= os.stat(path).st_mtime:
+            with open(cache_path) as f:
+                return int(f.read())
+    except (OSError, ValueError):
+        pass
+
+    size = sum(
+        entry.stat().st_size
+        for entry in _scandir_files(path)
+        if entry.name not in _BOOKKEEPING_FILES and not entry.name.endswith(".aria2")
+    )
+    try:
+        # Written in place: a rename would bump the directory mtime past it
+        with open(cache_path, "w") as f:
+            f.write(str(size))
+    except OSError:
+        pass
+    return size
+
+
+# Shared by every manager so keep-alive connections and TLS sessions to
+# HuggingFace survive across requests (the API builds a manager per request)
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared download client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        # HTTP/2 needs the optional h2 package; HTTP/1.1 otherwise
+        _client = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            timeout=httpx.Timeout(300.0, connect=10.0),
+            follow_redirects=True,
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared download client (called on application shutdown)."""
+    global _client
+    client, _client = _client, None
+    if client is not None:
+        await client.aclose()
+
+
+@dataclass(frozen=True, slots=True)
+class MLXModelSpec:
+    """A downloadable MLX model on HuggingFace."""
+
+    repo: str
+    description: str
+    size: str
+    quantization: str
+
+
+# Popular MLX-compatible models on HuggingFace (read-only)
+POPULAR_MLX_MODELS: Mapping[str, MLXModelSpec] = MappingProxyType({
+    "llama-3.1-8b": MLXModelSpec(
+        repo="mlx-community/Meta-Llama-3.1-8B-Instruct-4bit",
+        description="Llama 3.1 8B - Fast, high quality",
+        size="4.9GB",
+        quantization="4-bit",
+    ),
+    "llama-3-8b": MLXModelSpec(
+        repo="mlx-community/Meta-Llama-3-8B-Instruct-4bit",
+        description="Llama 3 8B - Reliable, well-tested",
+        size="4.9GB",
+        quantization="4-bit",
+    ),
+    "mistral-7b": MLXModelSpec(
+        repo="mlx-community/Mistral-7B-Instruct-v0.3-4bit",
+        description="Mistral 7B - Excellent reasoning",
+        size="4.1GB",
+        quantization="4-bit",
+    ),
+    "phi-3-mini": MLXModelSpec(
+        repo="mlx-community/Phi-3-mini-4k-instruct-4bit",
+        description="Phi-3 Mini - Compact, efficient",
+        size="2.4GB",
+        quantization="4-bit",
+    ),
+    "gemma-2-9b": MLXModelSpec(
+        repo="mlx-community/gemma-2-9b-it-4bit",
+        description="Gemma 2 9B - Google's latest",
+        size="5.4GB",
+        quantization="4-bit",
+    ),
+    "qwen-2-7b": MLXModelSpec(
+        repo="mlx-community/Qwen2-7B-Instruct-4bit",
+        description="Qwen 2 7B - Excellent multilingual",
+        size="4.4GB",
+        quantization="4-bit",
+    ),
+})
+
 
 class MLXModelManager:
     """Manage MLX models from HuggingFace for local inference."""
@@ -24,47 +323,14 @@ class MLXModelManager:
 
         self.models_dir = Path(models_dir)
         self.models_dir.mkdir(parents=True, exist_ok=True)
-        self.client = httpx.AsyncClient(timeout=300.0)
+        self.client = _get_client()
+        self._file_slots = asyncio.Semaphore(HF_MAX_PARALLEL_FILES)
+        # Bytes of the current download on disk, counted as chunks are written
+        self._bytes_written = 0
+        self._ollama_models: set[str] | None = None
 
     # Popular MLX-compatible models on HuggingFace
-    POPULAR_MLX_MODELS = {
-        "llama-3.1-8b": {
-            "repo": "mlx-community/Meta-Llama-3.1-8B-Instruct-4bit",
-            "description": "Llama 3.1 8B - Fast, high quality",
-            "size": "4.9GB",
-            "quantization": "4-bit",
-        },
-        "llama-3-8b": {
-            "repo": "mlx-community/Meta-Llama-3-8B-Instruct-4bit",
-            "description": "Llama 3 8B - Reliable, well-tested",
-            "size": "4.9GB",
-            "quantization": "4-bit",
-        },
-        "mistral-7b": {
-            "repo": "mlx-community/Mistral-7B-Instruct-v0.3-4bit",
-            "description": "Mistral 7B - Excellent reasoning",
-            "size": "4.1GB",
-            "quantization": "4-bit",
-        },
-        "phi-3-mini": {
-            "repo": "mlx-community/Phi-3-mini-4k-instruct-4bit",
-            "description": "Phi-3 Mini - Compact, efficient",
-            "size": "2.4GB",
-            "quantization": "4-bit",
-        },
-        "gemma-2-9b": {
-            "repo": "mlx-community/gemma-2-9b-it-4bit",
-            "description": "Gemma 2 9B - Google's latest",
-            "size": "5.4GB",
-            "quantization": "4-bit",
-        },
-        "qwen-2-7b": {
-            "repo": "mlx-community/Qwen2-7B-Instruct-4bit",
-            "description": "Qwen 2 7B - Excellent multilingual",
-            "size": "4.4GB",
-            "quantization": "4-bit",
-        },
-    }
+    POPULAR_MLX_MODELS = POPULAR_MLX_MODELS
 
     async def download_mlx_model(
         self,
@@ -84,18 +350,21 @@ class MLXModelManager:
         # Get repo info
         if custom_repo:
             repo = custom_repo
-            model_name = repo.split("/")[-1]
+            _, _, model_name = repo.rpartition("/")
         elif model_key in self.POPULAR_MLX_MODELS:
-            repo = self.POPULAR_MLX_MODELS[model_key]["repo"]
+            repo = self.POPULAR_MLX_MODELS[model_key].repo
             model_name = model_key
         else:
             yield {"error": f"Unknown model: {model_key}"}
             return
 
-        model_path = self.models_dir / model_name
+        model_path = self._model_path(model_name)
+        if model_path is None:
+            yield {"error": f"Invalid model name: {model_name}"}
+            return
 
-        # Check if already downloaded
-        if model_path.exists():
+        # Check if already downloaded (an interrupted download is resumed)
+        if _dir_exists(model_path) and not os.path.exists(model_path / DOWNLOAD_STATE_FILE):
             yield {
                 "status": "complete",
                 "message": f"Model already exists at {model_path}",
@@ -106,15 +375,15 @@ class MLXModelManager:
         yield {"status": "starting", "message": f"Downloading {repo}..."}
 
         try:
-            # Use huggingface-cli to download
             # Note: Requires huggingface-hub installed
-            process = await self._run_hf_download(repo, str(model_path))
-
-            async for update in process:
+            async for update in self._run_hf_download(repo, str(model_path)):
                 yield update
+                if "error" in update:
+                    return
+            (model_path / DOWNLOAD_STATE_FILE).unlink(missing_ok=True)
 
             # Verify download
-            if model_path.exists():
+            if _dir_exists(model_path):
                 yield {
                     "status": "complete",
                     "message": f"Model downloaded successfully",
@@ -124,6 +393,7 @@ class MLXModelManager:
                 # Convert to Ollama Modelfile format
                 yield {"status": "converting", "message": "Creating Ollama model..."}
                 await self._create_ollama_model(model_name, model_path)
+                await asyncio.to_thread(_model_size, str(model_path))
 
                 yield {
                     "status": "ready",
@@ -135,108 +405,407 @@ class MLXModelManager:
         except Exception as e:
             yield {"error": f"Download failed: {str(e)}"}
 
+    def _model_path(self, model_name: str) -> Path | None:
+        """
+        Directory for a model directly inside models_dir.
+
+        Returns None for names that would point elsewhere ("..", "",
+        absolute paths or nested paths), so a custom repo or delete request
+        can't write or remove outside models_dir. The check is lexical, so
+        symlinked model directories still work.
+        """
+        models_dir = os.path.normpath(self.models_dir)
+        model_path = os.path.normpath(os.path.join(models_dir, model_name))
+        if os.path.dirname(model_path) != models_dir:
+            return None
+        return Path(model_path)
+
     async def _run_hf_download(self, repo: str, output_path: str) -> AsyncGenerator[dict, None]:
-        """Run huggingface-cli download command."""
+        """Download the repository's model files in parallel, yielding progress."""
+        headers = {}
+        token = os.environ.get("HF_TOKEN")
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+
         try:
-            # Use git clone for simplicity (could use huggingface_hub library for better progress)
-            cmd = [
-                "git", "clone",
-                f"https://huggingface.co/{repo}",
-                output_path
-            ]
-
-            yield {"status": "downloading", "message": "Cloning repository..."}
-
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+            # blobs=true adds sizes and each LFS file's SHA-256 to the listing
+            response = await self.client.get(
+                f"{HF_ENDPOINT}/api/models/{repo}", params={"blobs": "true"}, headers=headers
             )
+            response.raise_for_status()
+            info = response.json()
+        except Exception as e:
+            yield {"error": f"Could not fetch file list for {repo}: {str(e)}"}
+            return
 
-            # Read output
-            while True:
-                line = process.stdout.readline()
-                if not line and process.poll() is not None:
-                    break
-                if line:
-                    yield {
-                        "status": "downloading",
-                        "message": line.strip()
-                    }
+        # Pin every file to the commit the listing came from
+        revision = info.get("sha", "main")
+        siblings = [
+            sibling
+            for sibling in info.get("siblings", [])
+            if any(fnmatch.fnmatch(sibling["rfilename"], pattern) for pattern in HF_ALLOW_PATTERNS)
+        ]
+        checksums = {sibling["rfilename"]: (sibling.get("lfs") or {}).get("sha256") for sibling in siblings}
+        total_bytes = sum(sibling.get("size") or 0 for sibling in siblings)
+        filenames = list(checksums)
+        if not filenames:
+            yield {"error": f"No model files found in {repo}"}
+            return
 
-            # Check return code
-            if process.returncode != 0:
-                stderr = process.stderr.read()
-                raise Exception(f"Git clone failed: {stderr}")
+        yield {"status": "downloading", "message": f"Downloading {len(filenames)} files from {repo}..."}
+
+        output_dir = Path(output_path)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        state_path = output_dir / DOWNLOAD_STATE_FILE
+        try:
+            state = json.loads(state_path.read_text())
+        except (OSError, ValueError):
+            state = {"files": {}}
+        _write_download_state(state_path, state)
+
+        urls = {filename: f"{HF_ENDPOINT}/{repo}/resolve/{revision}/{filename}" for filename in filenames}
+        if shutil.which("aria2c"):
+            async for update in self._aria2_download(urls, checksums, total_bytes, output_dir, headers):
+                yield update
+            return
+
+        tasks = [
+            asyncio.ensure_future(self._download_file(
+                urls[filename],
+                output_dir / filename,
+                headers,
+                state,
+                state_path,
+                checksums[filename],
+            ))
+            for filename in filenames
+        ]
+        self._bytes_written = 0
+        completed = 0
+        pending = set(tasks)
+        try:
+            # One update per finished file, plus byte progress at most every
+            # HF_PROGRESS_INTERVAL while nothing finishes; no re-stat of files
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, timeout=HF_PROGRESS_INTERVAL, return_when=asyncio.FIRST_COMPLETED
+                )
+                if done:
+                    for task in done:
+                        completed += 1
+                        message = f"Downloaded {task.result().name} ({completed}/{len(filenames)} files)"
+                else:
+                    message = f"Downloaded {self._bytes_written / 1024**2:.0f} of {total_bytes / 1024**2:.0f} MB"
+                yield {
+                    "status": "downloading",
+                    "message": message,
+                    "completed": completed,
+                    "total": len(filenames),
+                    "bytes": self._bytes_written,
+                    "total_bytes": total_bytes,
+                }
+        except Exception as e:
+            yield {"error": f"HuggingFace download failed: {str(e)}"}
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Let cancelled downloads record their progress before returning
+            await asyncio.gather(*tasks, return_exceptions=True)
+            _write_download_state(state_path, state)
+
+    async def _aria2_download(
+        self,
+        urls: dict[str, str],
+        checksums: dict[str, str | None],
+        total_bytes: int,
+        output_dir: Path,
+        headers: dict,
+    ) -> AsyncGenerator[dict, None]:
+        """
+        Download all files with aria2c, which resumes and verifies checksums itself.
+
+        aria2 prints one readout line per active file; these are folded into
+        a single byte count that is reported at most every HF_PROGRESS_INTERVAL.
+        """
+        # aria2c re-sends custom headers after a redirect, so it is given each
+        # file's resolved location, and only same-host locations get the token
+        try:
+            heads = await asyncio.gather(*(self.client.head(url, headers=headers) for url in urls.values()))
+            for head in heads:
+                head.raise_for_status()
+        except httpx.HTTPError as e:
+            yield {"error": f"Could not resolve download URLs: {str(e)}"}
+            return
+
+        entries = []
+        for filename, head in zip(urls, heads):
+            url, file_headers = _resolved_request(head, headers)
+            entries.append(url)
+            entries.append(f"  out={filename}")
+            if checksums.get(filename):
+                entries.append(f"  checksum=sha-256={checksums[filename]}")
+            for name, value in file_headers.items():
+                entries.append(f"  header={name}: {value}")
 
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "aria2c", *ARIA2_ARGS, f"--dir={output_dir}",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+            )
         except FileNotFoundError:
-            yield {
-                "error": "git not found. Please install git or use: brew install git"
+            yield {"error": "aria2c not found"}
+            return
+
+        try:
+            process.stdin.write("\n".join(entries).encode() + b"\n")
+            await process.stdin.drain()
+            process.stdin.close()
+
+            # Keep the tail of non-progress output for the error message
+            messages = deque(maxlen=5)
+            downloaded = {}  # aria2 download id -> bytes done
+            last_report = time.monotonic()
+            async for raw_line in process.stdout:
+                line = raw_line.decode(errors="replace").strip()
+                match = _ARIA2_PROGRESS.search(line)
+                if match is None:
+                    if line:
+                        messages.append(line)
+                    continue
+
+                downloaded[match[1]] = int(float(match[2]) * _ARIA2_UNITS.get(match[3], 1))
+                now = time.monotonic()
+                if now - last_report >= HF_PROGRESS_INTERVAL:
+                    last_report = now
+                    yield self._aria2_progress(sum(downloaded.values()), total_bytes)
+
+            if await process.wait() != 0:
+                yield {"error": f"aria2c download failed: {' '.join(messages)}"}
+            else:
+                yield self._aria2_progress(total_bytes, total_bytes)
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+
+    @staticmethod
+    def _aria2_progress(done: int, total_bytes: int) -> dict:
+        """Progress update in the same shape as the built-in downloader's byte updates."""
+        return {
+            "status": "downloading",
+            "message": f"Downloaded {done / 1024**2:.0f} of {total_bytes / 1024**2:.0f} MB",
+            "bytes": done,
+            "total_bytes": total_bytes,
+        }
+
+    async def _download_file(
+        self, url: str, dest: Path, headers: dict, state: dict, state_path: Path, sha256: str | None = None
+    ) -> Path:
+        """
+        Download one file via a .part file, verify it, then move it into place.
+
+        Files with a known SHA-256 (LFS weights) are hashed once complete;
+        a mismatch discards the .part and downloads the file once more.
+        """
+        # Files are only renamed into place once complete and verified
+        try:
+            size = os.stat(dest).st_size
+            # aria2c writes in place; its control file marks an unfinished file
+            if not os.path.exists(f"{dest}.aria2"):
+                self._bytes_written += size
+                return dest
+        except FileNotFoundError:
+            pass
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        part_path = dest.with_name(dest.name + ".part")
+        key = dest.relative_to(state_path.parent).as_posix()
+
+        async with self._file_slots:
+            for _ in range(2):
+                # HEAD only once the slot is held, and again before a retry:
+                # it resolves a presigned CDN URL that may expire while the
+                # file waits behind other downloads
+                head = await self.client.head(url, headers=headers)
+                head.raise_for_status()
+                await self._fetch_part(head, part_path, key, headers, state, state_path)
+                if sha256 is None or await asyncio.to_thread(_file_sha256, part_path) == sha256:
+                    break
+                logger.warning(f"Checksum mismatch for {key}, downloading it again")
+                self._bytes_written -= part_path.stat().st_size
+                part_path.unlink()
+                state["files"].pop(key, None)
+                _write_download_state(state_path, state)
+            else:
+                raise ValueError(f"Checksum mismatch for {key}")
+
+            await asyncio.to_thread(_drop_page_cache, part_path)
+            os.replace(part_path, dest)
+            if state["files"].pop(key, None) is not None:
+                _write_download_state(state_path, state)
+        return dest
+
+    async def _fetch_part(
+        self, head: httpx.Response, part_path: Path, key: str, headers: dict, state: dict, state_path: Path
+    ):
+        """
+        Fill part_path with the file described by a HEAD response, resuming from saved progress.
+
+        Large files are split into parallel byte ranges. Saved progress is
+        reused only if the server's ETag and size still match.
+        """
+        # Ranged requests go straight to the CDN location instead of
+        # repeating the redirect for every range
+        url, headers = _resolved_request(head, headers)
+        etag = head.headers.get("etag")
+        size = int(head.headers.get("content-length", 0))
+
+        if head.headers.get("accept-ranges") != "bytes" or etag is None or size == 0:
+            # Not resumable, or no size to split into ranges: fetch the whole
+            # body in one request
+            state["files"].pop(key, None)
+            with open(part_path, "wb") as f:
+                _bypass_page_cache(f.fileno())
+                async with self.client.stream("GET", url, headers=headers) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(HF_CHUNK_BYTES):
+                        await asyncio.to_thread(f.write, chunk)
+                        self._bytes_written += len(chunk)
+            return
+
+        entry = state["files"].get(key)
+        if entry is None or entry["etag"] != etag or entry["size"] != size or not part_path.exists():
+            parts = max(1, min(HF_RANGE_SPLITS, size // HF_MIN_RANGE_BYTES))
+            part_size = -(-size // parts)
+            # Each range is [start, end (inclusive), next offset to write]
+            entry = state["files"][key] = {
+                "etag": etag,
+                "size": size,
+                "ranges": [
+                    [start, min(start + part_size, size) - 1, start]
+                    for start in range(0, size, part_size or 1)
+                ],
             }
-        except Exception as e:
-            yield {"error": str(e)}
+            with open(part_path, "wb") as f:
+                _preallocate(f.fileno(), size)
+            _write_download_state(state_path, state)
+        else:
+            # Resuming: count what earlier attempts already wrote
+            self._bytes_written += sum(offset - start for start, _, offset in entry["ranges"])
+
+        with open(part_path, "r+b") as f:
+            _bypass_page_cache(f.fileno())
+            await asyncio.gather(*(
+                self._download_range(url, f.fileno(), byte_range, headers, state, state_path)
+                for byte_range in entry["ranges"]
+                if byte_range[2] <= byte_range[1]
+            ))
+
+    async def _download_range(
+        self, url: str, fd: int, byte_range: list[int], headers: dict, state: dict, state_path: Path
+    ):
+        """Write the rest of a [start, end, offset] range into fd, advancing its offset."""
+        _, end, offset = byte_range
+        range_headers = {**headers, "Range": f"bytes={offset}-{end}"}
+        unsaved = 0
+        try:
+            async with self.client.stream("GET", url, headers=range_headers) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise httpx.HTTPError(f"Server ignored range request for {url}")
+                async for chunk in response.aiter_bytes(HF_CHUNK_BYTES):
+                    await asyncio.to_thread(os.pwrite, fd, chunk, byte_range[2])
+                    byte_range[2] += len(chunk)
+                    self._bytes_written += len(chunk)
+                    unsaved += len(chunk)
+                    if unsaved >= HF_CHECKPOINT_BYTES:
+                        _write_download_state(state_path, state)
+                        unsaved = 0
+        finally:
+            if unsaved:
+                _write_download_state(state_path, state)
+        if byte_range[2] != end + 1:
+            raise httpx.HTTPError(f"Range {offset}-{end} of {url} ended early at byte {byte_range[2]}")
 
     async def _create_ollama_model(self, model_name: str, model_path: Path):
         """Create an Ollama model from downloaded MLX weights."""
-        # Create Modelfile
-        modelfile_content = f"""FROM {model_path}
-TEMPLATE \"\"\"{{{{ if .System }}}}{{{{ .System }}}}{{{{ end }}}}{{{{ if .Prompt }}}}{{{{ .Prompt }}}}{{{{ end }}}}\"\"\"
-PARAMETER temperature 0.7
-PARAMETER top_p 0.9
-"""
-
         modelfile_path = model_path / "Modelfile"
-        modelfile_path.write_text(modelfile_content)
+        await asyncio.to_thread(modelfile_path.write_text, MODELFILE_TEMPLATE.format(path=model_path))
+
+        if model_name in await self._ollama_model_names():
+            logger.info(f"Ollama model '{model_name}' already exists, skipping import")
+            return
 
-        # Import into Ollama
+        # Import into Ollama without blocking the event loop for the whole import
         try:
-            subprocess.run(
-                ["ollama", "create", model_name, "-f", str(modelfile_path)],
-                check=True,
-                capture_output=True,
-                text=True
+            process = await asyncio.create_subprocess_exec(
+                "ollama", "create", model_name, "-f", str(modelfile_path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to create Ollama model: {e.stderr}")
+            _, stderr = await process.communicate()
+            if process.returncode != 0:
+                logger.error(f"Failed to create Ollama model: {stderr.decode(errors='replace')}")
+            else:
+                self._ollama_models.add(model_name)
         except FileNotFoundError:
             logger.warning("Ollama CLI not found. Model downloaded but not imported to Ollama.")
 
+    async def _ollama_model_names(self) -> set[str]:
+        """Names of models installed in Ollama, fetched once per manager via the HTTP API."""
+        if self._ollama_models is None:
+            self._ollama_models = set()
+            try:
+                response = await self.client.get(f"{settings.ollama_base_url}/api/tags")
+                response.raise_for_status()
+                for model_info in response.json().get("models", []):
+                    name = model_info.get("name", "")
+                    # `ollama create foo` registers foo:latest
+                    self._ollama_models.add(name.removesuffix(":latest"))
+            except Exception as e:
+                logger.warning(f"Error listing Ollama models: {e}")
+        return self._ollama_models
+
     async def list_downloaded_models(self) -> list[dict]:
         """List models downloaded to local storage."""
-        models = []
-
-        if not self.models_dir.exists():
-            return models
-
-        for model_dir in self.models_dir.iterdir():
-            if model_dir.is_dir():
-                # Get model info
-                size = sum(f.stat().st_size for f in model_dir.rglob('*') if f.is_file())
-                models.append({
-                    "name": model_dir.name,
-                    "path": str(model_dir),
-                    "size_gb": round(size / (1024**3), 2),
-                })
-
-        return models
+        try:
+            entries = os.scandir(self.models_dir)
+        except FileNotFoundError:
+            return []
+
+        with entries:
+            model_dirs = [model_dir for model_dir in entries if model_dir.is_dir()]
+
+        # Sizing may walk a whole model directory, so it runs off the event loop
+        sizes = await asyncio.gather(
+            *(asyncio.to_thread(_model_size, model_dir.path) for model_dir in model_dirs)
+        )
+        return [
+            {
+                "name": model_dir.name,
+                "path": model_dir.path,
+                "size_gb": round(size / (1024**3), 2),
+            }
+            for model_dir, size in zip(model_dirs, sizes)
+        ]
 
     async def delete_model(self, model_name: str) -> bool:
         """Delete a downloaded model."""
-        model_path = self.models_dir / model_name
+        model_path = self._model_path(model_name)
 
-        if not model_path.exists():
+        if model_path is None or not _dir_exists(model_path):
             return False
 
         try:
-            import shutil
-            shutil.rmtree(model_path)
+            await asyncio.to_thread(_fast_rmtree, str(model_path))
             return True
         except Exception as e:
             logger.error(f"Failed to delete model: {e}")
             return False
 
-    def list_popular_models(self) -> dict:
+    def list_popular_models(self) -> Mapping[str, MLXModelSpec]:
         """Get list of popular MLX models available for download."""
         return self.POPULAR_MLX_MODELS
 
@@ -245,5 +814,4 @@ PARAMETER top_p 0.9
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        await self.client.aclose()
+        """Async context manager exit; the shared client stays open for other managers."""
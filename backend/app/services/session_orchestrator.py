@@ -9,9 +9,13 @@ Coordinates the entire council session flow:
 
 import asyncio
 import logging
+import random
+import time
+import uuid
+from hashlib import blake2b
 from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import literal_column, select
 
 from app.models.session import Session
 
@@ -19,8 +23,143 @@ logger = logging.getLogger(__name__)
 
 from app.models.response import Response
 from app.schemas.session import SessionCreate
+from app.services.ai_providers.base import AIProvider, TokenUsage
 from app.services.ai_providers.provider_factory import ProviderFactory
-from app.core.constants import MERGE_TEMPLATES, PRESET_CONFIGS
+from app.core.constants import MERGE_TEMPLATES, PRESET_CONFIGS, PROVIDER_CONFIGS, SessionStatus, ResponseRole
+from app.core.exceptions import ConnectionError, RateLimitError, ServiceUnavailableError, TimeoutError
+
+# Pushed by each _fan_in producer once its stream is exhausted
+_STREAM_END = object()
+
+# Transient provider failures are retried with full-jitter exponential
+# backoff, as long as nothing of the response has been relayed yet
+PROVIDER_MAX_ATTEMPTS = 4
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 20.0
+_RETRYABLE_ERRORS = (RateLimitError, ServiceUnavailableError, TimeoutError, ConnectionError)
+
+# Requests in flight per provider across all sessions (from PROVIDER_CONFIGS'
+# max_concurrent_requests), so large councils queue briefly instead of
+# tripping the provider's rate limits
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+_provider_slots: dict[str, asyncio.Semaphore] = {}
+
+# Councils with at least this many responses are merged in two steps
+# (parallel partial drafts, then a final merge) to keep chair prompts short
+MERGE_SHARD_MIN_RESPONSES = 4
+
+# Completed provider responses shared across sessions, so repeated prompts
+# replay instead of paying for the same call again. Only near-deterministic
+# requests (temperature <= RESPONSE_CACHE_MAX_TEMPERATURE) are read or
+# stored: at higher temperatures a re-run is expected to produce a fresh
+# sample. Entries live in process memory only, for at most RESPONSE_CACHE_TTL
+# seconds and _RESPONSE_CACHE_SIZE entries. Resumed sessions don't rely on
+# it; they reload their responses from the database.
+# Maps a request digest to (expires_at, (content, input_tokens, output_tokens))
+RESPONSE_CACHE_MAX_TEMPERATURE = 0.3
+RESPONSE_CACHE_TTL = 3600
+_RESPONSE_CACHE_SIZE = 256
+_response_cache: dict[str, tuple[float, tuple[str, int, int]]] = {}
+
+# Only at this temperature (greedy decoding) do council members with
+# identical provider, model and personality share one call; at any higher
+# temperature each member samples independently, as the council relies on
+# that diversity
+DEDUPE_MAX_TEMPERATURE = 0.0
+
+
+def _normalize_prompt(text: str) -> str:
+    """Drop leading and trailing whitespace, which never changes a prompt's meaning.
+
+    Case and inner whitespace are kept: code, YAML and identifiers in a
+    prompt or file context depend on them.
+    """
+    return text.strip()
+
+
+def _response_cache_key(
+    provider_name: str, model: str, temperature: float, system_prompt: str | None,
+    prompt: str, image_data: str | None,
+) -> str:
+    """Digest of everything that determines a provider's response.
+
+    Prompts are keyed after trimming surrounding whitespace, so a stray
+    trailing newline still hits the cache.
+    """
+    system_prompt = _normalize_prompt(system_prompt or "")
+    prompt = _normalize_prompt(prompt)
+
+    digest = blake2b(digest_size=16)
+    for part in (provider_name, model, repr(temperature), system_prompt, prompt, image_data or ""):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return "llm:" + digest.hexdigest()
+
+
+def _get_cached_response(key: str) -> tuple[str, int, int] | None:
+    """Return a cached response that has not expired yet."""
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, response = entry
+    if expires_at < time.monotonic():
+        del _response_cache[key]
+        return None
+    return response
+
+
+def _cache_response(key: str, response: tuple[str, int, int]) -> None:
+    """Store a completed response, evicting the oldest entry when full."""
+    _response_cache.pop(key, None)
+    if len(_response_cache) >= _RESPONSE_CACHE_SIZE:
+        _response_cache.pop(next(iter(_response_cache)))
+    _response_cache[key] = (time.monotonic() + RESPONSE_CACHE_TTL, response)
+
+
+async def _count_tokens(provider, text: str) -> int:
+    """
+    Count tokens without stalling the event loop.
+
+    A real tokenizer (e.g. tiktoken) takes tens of milliseconds on multi-KB
+    text, so it runs in a worker thread; the ~4 chars/token estimate is
+    cheaper than the thread hop and is computed inline.
+    """
+    if provider.count_tokens is AIProvider._approx_tokens:
+        return provider.count_tokens(text)
+    return await asyncio.to_thread(provider.count_tokens, text)
+
+
+def _provider_slot(provider_name: str) -> asyncio.Semaphore:
+    """Return the shared request limiter for a provider, creating it on first use."""
+    slot = _provider_slots.get(provider_name)
+    if slot is None:
+        limit = PROVIDER_CONFIGS.get(provider_name, {}).get(
+            "max_concurrent_requests", DEFAULT_MAX_CONCURRENT_REQUESTS
+        )
+        slot = _provider_slots[provider_name] = asyncio.Semaphore(limit)
+    return slot
+
+
+def _retry_delay(attempt: int, retry_after: int | None = None) -> float:
+    """Backoff before retry number `attempt`, honoring a provider's Retry-After."""
+    delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+    if retry_after:
+        delay = max(delay, min(retry_after, RETRY_MAX_DELAY))
+    return delay
+
+
+def _format_council_responses(responses: list[dict]) -> str:
+    """Render council responses as labelled sections for a chair prompt.
+
+    Pieces are joined in one pass, so each (possibly long) response is
+    copied once instead of into a per-response section string first.
+    """
+    parts = []
+    for r in responses:
+        parts += ("--- Response from ", str(r['provider']), " ---\n", str(r['content']), "\n\n")
+    if parts:
+        parts.pop()  # No separator after the last section
+    return "".join(parts)
 
 
 class SessionOrchestrator:
@@ -31,6 +170,10 @@ class SessionOrchestrator:
         self.provider_factory = ProviderFactory()
         self.file_context = ""  # Extracted text from files
         self.image_data = None  # Base64 image data for vision models
+        self._reused_tokens: dict[tuple[str, str, str], int] = {}  # (provider, model, text) -> token count
+        self._vision_support: dict[tuple[str, str], bool] = {}  # (provider, model) -> accepts images
+        self._chair_member = None  # Council member flagged as chair, resolved in create_session
+        self._provider_by_member_id: dict = {}  # Resolved once in create_session
 
     def _get_temperature_for_session(self, session: Session) -> float:
         """Get temperature from session preset."""
@@ -39,11 +182,11 @@ class SessionOrchestrator:
 
     async def create_session(self, config: SessionCreate) -> Session:
         """Create a new session in the database."""
-        import json
         from app.core.personality_archetypes import get_archetype_system_prompt
 
         # Store council members configuration for use during execution
         self.council_members = config.council_members
+        self._chair_member = next((m for m in config.council_members if m.is_chair), None)
 
         # Build model configs from council members
         model_configs = {}
@@ -54,6 +197,17 @@ class SessionOrchestrator:
         if model_configs:
             self.provider_factory = ProviderFactory(model_configs=model_configs)
 
+        # Resolve each member's provider once; members whose provider isn't
+        # configured are reported now and left out of every round
+        self._provider_by_member_id = {}
+        for member in config.council_members:
+            try:
+                self._provider_by_member_id[member.id] = self.provider_factory.get_provider(
+                    member.provider, member.model
+                )
+            except ValueError as e:
+                logger.warning(f"Council member {member.id} skipped: {e}")
+
         # Store personality system prompts for each member
         self.member_personalities = {}
         for member in config.council_members:
@@ -82,11 +236,7 @@ class SessionOrchestrator:
         temperature = preset_config["temperature"]
 
         # Find the chair member
-        chair_member = next((m for m in config.council_members if m.is_chair), config.council_members[0])
-
-        # Serialize council members and selected providers
-        council_members_json = json.dumps([m.dict() for m in config.council_members])
-        selected_providers_json = json.dumps([m.provider for m in config.council_members])
+        chair_member = self._chair_member or config.council_members[0]
 
         # Create session record
         session = Session(
@@ -96,14 +246,15 @@ class SessionOrchestrator:
             merge_template=config.template,
             preset=config.preset,
             autopilot=config.autopilot,
-            selected_providers=selected_providers_json,
-            council_members=council_members_json,
-            status="running",
+            selected_providers=[m.provider for m in config.council_members],
+            council_members=[m.model_dump() for m in config.council_members],
+            status=SessionStatus.RUNNING,
         )
 
+        # Server-side defaults come back via RETURNING (eager_defaults) and
+        # commits don't expire attributes, so no refresh SELECT is needed
         self.db.add(session)
         await self.db.commit()
-        await self.db.refresh(session)
 
         return session
 
@@ -111,7 +262,9 @@ class SessionOrchestrator:
         """
         Run the complete session with iterations.
 
-        Yields status updates as the session progresses:
+        Yields status updates as the session progresses. Response, merge and
+        feedback events first stream tokens as {"delta": "...", "done": False}
+        and finish with a single "done": True event carrying the full content:
         - {"type": "initial_response", "provider": "openai", "content": "...", "done": bool}
         - {"type": "merge", "iteration": 1, "content": "...", "done": bool}
         - {"type": "feedback", "iteration": 2, "provider": "openai", "content": "...", "done": bool}
@@ -129,7 +282,7 @@ class SessionOrchestrator:
 
             if not initial_responses:
                 yield {"type": "error", "message": "No providers are configured with API keys"}
-                session.status = "failed"
+                session.status = SessionStatus.FAILED
                 await self.db.commit()
                 return
 
@@ -143,32 +296,17 @@ class SessionOrchestrator:
                     merged_response = update
 
             # Phase 3: Iteration cycles (if total_iterations > 1)
-            for iteration in range(2, session.total_iterations + 1):
-                yield {"type": "status", "message": f"Starting iteration {iteration}/{session.total_iterations}..."}
-
-                # Collect feedback from council on the merged response
-                feedback_responses = []
-                async for update in self._collect_feedback(session, merged_response, iteration):
-                    yield update
-                    if update.get("done"):
-                        feedback_responses.append(update)
-
-                # Chair merges feedback into improved response
-                yield {"type": "status", "message": f"Chair is merging iteration {iteration} feedback..."}
-
-                async for update in self._create_merge(session, feedback_responses, iteration, merged_response):
-                    yield update
-                    if update.get("done"):
-                        merged_response = update
+            async for update in self._run_iteration_cycle(session, merged_response, start=2):
+                yield update
 
             # Complete
-            session.status = "completed"
+            session.status = SessionStatus.COMPLETED
             await self.db.commit()
 
             yield {"type": "complete", "session_id": session.id}
 
         except Exception as e:
-            session.status = "failed"
+            session.status = SessionStatus.FAILED
             await self.db.commit()
             yield {"type": "error", "message": str(e)}
 
@@ -184,10 +322,15 @@ class SessionOrchestrator:
                 - merged_responses: List of completed merged responses
                 - total_cost: Running cost
                 - total_tokens: Running token counts
+              or just the paused session's id ("session_id"), in which case
+              the completed responses are loaded from the database
 
         Yields status updates as the session progresses.
         """
         try:
+            if resume_state.get('session_id') and 'responses' not in resume_state:
+                resume_state = await self._load_resume_state(resume_state['session_id'])
+
             current_iteration = resume_state.get('current_iteration', 1)
             existing_responses = resume_state.get('responses', [])
             existing_merged = resume_state.get('merged_responses', [])
@@ -259,35 +402,101 @@ class SessionOrchestrator:
                             merged_response = update
 
             # Phase 2: Continue with remaining iterations
-            for iteration in range(current_iteration + 1, session.total_iterations + 1):
-                yield {"type": "status", "message": f"Starting iteration {iteration}/{session.total_iterations}..."}
-
-                # Collect feedback from council on the merged response
-                feedback_responses = []
-                async for update in self._collect_feedback(session, merged_response, iteration):
-                    yield update
-                    if update.get("done"):
-                        feedback_responses.append(update)
-
-                # Chair merges feedback into improved response
-                yield {"type": "status", "message": f"Chair is merging iteration {iteration} feedback..."}
-
-                async for update in self._create_merge(session, feedback_responses, iteration, merged_response):
-                    yield update
-                    if update.get("done"):
-                        merged_response = update
+            async for update in self._run_iteration_cycle(session, merged_response, start=current_iteration + 1):
+                yield update
 
             # Complete
-            session.status = "completed"
+            session.status = SessionStatus.COMPLETED
             await self.db.commit()
 
             yield {"type": "complete", "session_id": session.id}
 
         except Exception as e:
-            session.status = "failed"
+            session.status = SessionStatus.FAILED
             await self.db.commit()
             yield {"type": "error", "message": str(e)}
 
+    async def _load_resume_state(self, session_id: str) -> dict:
+        """
+        Rebuild a resume state from a paused session's saved responses.
+
+        All responses are fetched in a single query. Council rows are matched
+        back to their members: feedback rows store the member id as provider,
+        initial responses are matched by provider and model.
+        """
+        # created_at has one-second resolution on SQLite, and a batched round
+        # shares one value, so ties go council before chair, then by
+        # insertion order (rowid, where the database has one)
+        if self.db.get_bind().dialect.name == "sqlite":
+            insertion_order = literal_column("responses.rowid")
+        else:
+            insertion_order = Response.id
+        result = await self.db.execute(
+            select(Response)
+            .where(Response.session_id == session_id)
+            .order_by(
+                Response.iteration,
+                Response.created_at,
+                Response.role == ResponseRole.CHAIR,
+                insertion_order,
+            )
+        )
+
+        responses, merged_responses = [], []
+        claimed = set()  # (iteration, member_id) already matched to a row
+        for row in result.scalars():
+            entry = {"provider": row.provider, "content": row.content, "iteration": row.iteration}
+            if row.role == ResponseRole.CHAIR:
+                merged_responses.append(entry)
+                continue
+
+            member = next(
+                (
+                    m for m in self.council_members
+                    if (row.iteration, m.id) not in claimed
+                    and (m.id == row.provider or (m.provider, m.model) == (row.provider, row.model))
+                ),
+                None,
+            )
+            if member:
+                claimed.add((row.iteration, member.id))
+                entry["member_id"] = member.id
+            responses.append(entry)
+
+        iterations = [r["iteration"] for r in responses + merged_responses]
+        return {
+            "current_iteration": max(iterations, default=1),
+            "responses": responses,
+            "merged_responses": merged_responses,
+        }
+
+    async def _run_iteration_cycle(
+        self, session: Session, merged_response: dict | None, start: int
+    ) -> AsyncGenerator[dict, None]:
+        """
+        Run feedback-and-merge iterations from `start` through the session's last.
+
+        Each iteration collects council feedback on the latest merge and has
+        the chair merge it into an improved version.
+        """
+        for iteration in range(start, session.total_iterations + 1):
+            yield {"type": "status", "message": f"Starting iteration {iteration}/{session.total_iterations}..."}
+
+            # Collect feedback from council on the merged response
+            feedback_responses = []
+            async for update in self._collect_feedback(session, merged_response, iteration):
+                yield update
+                if update.get("done"):
+                    feedback_responses.append(update)
+
+            # Chair merges feedback into improved response
+            yield {"type": "status", "message": f"Chair is merging iteration {iteration} feedback..."}
+
+            async for update in self._create_merge(session, feedback_responses, iteration, merged_response):
+                yield update
+                if update.get("done"):
+                    merged_response = update
+
     async def _collect_responses_from_members(
         self, session: Session, members: list, iteration: int
     ) -> AsyncGenerator[dict, None]:
@@ -297,28 +506,25 @@ class SessionOrchestrator:
 
         temperature = self._get_temperature_for_session(session)
 
-        # Create wrapper coroutines
-        async def get_response_with_name(provider, name, member_id, member_model, prompt, temp, system_prompt):
-            try:
-                result = await self._get_provider_response(provider, prompt, temp, system_prompt, model=member_model)
-                return name, member_model, member_id, result, None
-            except Exception as e:
-                return name, None, member_id, None, e
+        # Stream each specified member's response
+        jobs = self._member_jobs(members, session.prompt, temperature)
 
-        # Create tasks for specified members only
-        tasks = []
-        for member in members:
-            provider = self.provider_factory.get_provider(member.provider)
-            if provider:
-                system_prompt = self.member_personalities.get(member.id)
-                tasks.append(get_response_with_name(
-                    provider, member.provider, member.id, member.model,
-                    session.prompt, temperature, system_prompt
-                ))
-
-        # Run in parallel and yield results as they complete
-        for coro in asyncio.as_completed(tasks):
-            provider_name, model, member_id, result, error = await coro
+        # Relay tokens as they arrive; completed responses are saved together
+        staged = []
+        async for member, delta, result, error in self._fan_in(jobs):
+            provider_name, model, member_id = member.provider, member.model, member.id
+
+            if result is None and error is None:
+                yield {
+                    "type": "initial_response",
+                    "provider": provider_name,
+                    "member_id": member_id,
+                    "member_role": member.role,
+                    "iteration": iteration,
+                    "delta": delta,
+                    "done": False,
+                }
+                continue
 
             if error:
                 yield {
@@ -330,28 +536,24 @@ class SessionOrchestrator:
                 continue
 
             try:
-                content, input_tokens, output_tokens, cost = result
+                content, input_tokens, output_tokens, cost, cache_hit = result
 
-                # Get member role for display
-                member_role = provider_name
-                member = next((m for m in members if m.id == member_id), None)
-                if member:
-                    member_role = member.role
+                member_role = member.role
 
-                # Save to database
+                # Stage for the batch save once every member has finished
                 response = Response(
+                    id=str(uuid.uuid4()),
                     session_id=session.id,
                     provider=provider_name,
                     model=model,
                     iteration=iteration,
-                    role="council",
+                    role=ResponseRole.COUNCIL,
                     content=content,
                     input_tokens=input_tokens,
                     output_tokens=output_tokens,
                     estimated_cost=cost,
                 )
-                self.db.add(response)
-                await self.db.commit()
+                staged.append(response)
 
                 yield {
                     "type": "initial_response",
@@ -363,6 +565,7 @@ class SessionOrchestrator:
                     "iteration": iteration,
                     "tokens": {"input": input_tokens, "output": output_tokens},
                     "cost": cost,
+                    "cache_hit": cache_hit,
                     "done": True,
                 }
             except Exception as e:
@@ -373,6 +576,13 @@ class SessionOrchestrator:
                     "message": f"Failed to save response: {str(e)}",
                 }
 
+        error = await self._save_responses(staged)
+        if error:
+            yield {
+                "type": "error",
+                "message": f"Failed to save responses: {str(error)}",
+            }
+
     async def _collect_feedback_from_members(
         self, session: Session, previous_output: dict, members: list, iteration: int
     ) -> AsyncGenerator[dict, None]:
@@ -390,28 +600,25 @@ Previous output (iteration {iteration - 1}):
 
 Please provide constructive feedback on this output. What could be improved? What's working well? What's missing?"""
 
-        # Create wrapper coroutines
-        async def get_response_with_name(provider, name, member_id, member_model, prompt, temp, system_prompt):
-            try:
-                result = await self._get_provider_response(provider, prompt, temp, system_prompt, model=member_model)
-                return name, member_model, member_id, result, None
-            except Exception as e:
-                return name, None, member_id, None, e
+        # Stream each specified member's feedback
+        jobs = self._member_jobs(members, feedback_prompt, temperature)
 
-        # Create tasks for specified members only
-        tasks = []
-        for member in members:
-            provider = self.provider_factory.get_provider(member.provider)
-            if provider:
-                system_prompt = self.member_personalities.get(member.id)
-                tasks.append(get_response_with_name(
-                    provider, member.provider, member.id, member.model,
-                    feedback_prompt, temperature, system_prompt
-                ))
-
-        # Run in parallel and yield results as they complete
-        for coro in asyncio.as_completed(tasks):
-            provider_name, model, member_id, result, error = await coro
+        # Relay tokens as they arrive; completed responses are saved together
+        staged = []
+        async for member, delta, result, error in self._fan_in(jobs):
+            provider_name, model, member_id = member.provider, member.model, member.id
+
+            if result is None and error is None:
+                yield {
+                    "type": "feedback",
+                    "provider": provider_name,
+                    "member_id": member_id,
+                    "member_role": member.role,
+                    "iteration": iteration,
+                    "delta": delta,
+                    "done": False,
+                }
+                continue
 
             if error:
                 yield {
@@ -423,28 +630,24 @@ Please provide constructive feedback on this output. What could be improved? Wha
                 continue
 
             try:
-                content, input_tokens, output_tokens, cost = result
+                content, input_tokens, output_tokens, cost, cache_hit = result
 
-                # Get member role for display
-                member_role = provider_name
-                member = next((m for m in members if m.id == member_id), None)
-                if member:
-                    member_role = member.role
+                member_role = member.role
 
-                # Save to database
+                # Stage for the batch save once every member has finished
                 response = Response(
+                    id=str(uuid.uuid4()),
                     session_id=session.id,
                     provider=provider_name,
                     model=model,
                     iteration=iteration,
-                    role="council",
+                    role=ResponseRole.COUNCIL,
                     content=content,
                     input_tokens=input_tokens,
                     output_tokens=output_tokens,
                     estimated_cost=cost,
                 )
-                self.db.add(response)
-                await self.db.commit()
+                staged.append(response)
 
                 yield {
                     "type": "feedback",
@@ -456,6 +659,7 @@ Please provide constructive feedback on this output. What could be improved? Wha
                     "iteration": iteration,
                     "tokens": {"input": input_tokens, "output": output_tokens},
                     "cost": cost,
+                    "cache_hit": cache_hit,
                     "done": True,
                 }
             except Exception as e:
@@ -466,6 +670,13 @@ Please provide constructive feedback on this output. What could be improved? Wha
                     "message": f"Failed to save feedback: {str(e)}",
                 }
 
+        error = await self._save_responses(staged)
+        if error:
+            yield {
+                "type": "error",
+                "message": f"Failed to save responses: {str(error)}",
+            }
+
     async def _collect_initial_responses(
         self, session: Session
     ) -> AsyncGenerator[dict, None]:
@@ -479,28 +690,24 @@ Please provide constructive feedback on this output. What could be improved? Wha
 
         temperature = self._get_temperature_for_session(session)
 
-        # Create wrapper coroutines that return provider name, model, and member info with result
-        async def get_response_with_name(provider, name, member_id, member_model, prompt, temp, system_prompt):
-            try:
-                result = await self._get_provider_response(provider, prompt, temp, system_prompt, model=member_model)
-                return name, member_model, member_id, result, None
-            except Exception as e:
-                return name, None, member_id, None, e
-
-        # Create tasks for all council members
-        tasks = []
-        for member in self.council_members:
-            provider = self.provider_factory.get_provider(member.provider)
-            if provider:
-                system_prompt = self.member_personalities.get(member.id)
-                tasks.append(get_response_with_name(
-                    provider, member.provider, member.id, member.model,
-                    session.prompt, temperature, system_prompt
-                ))
-
-        # Run all council members in parallel and yield results as they complete
-        for coro in asyncio.as_completed(tasks):
-            provider_name, model, member_id, result, error = await coro
+        # Stream every council member's response
+        jobs = self._member_jobs(self.council_members, session.prompt, temperature)
+
+        # Relay tokens as they arrive; completed responses are saved together
+        staged = []
+        async for member, delta, result, error in self._fan_in(jobs):
+            provider_name, model, member_id = member.provider, member.model, member.id
+
+            if result is None and error is None:
+                yield {
+                    "type": "initial_response",
+                    "provider": provider_name,
+                    "member_role": member.role,
+                    "member_id": member_id,
+                    "delta": delta,
+                    "done": False,
+                }
+                continue
 
             if error:
                 yield {
@@ -512,27 +719,24 @@ Please provide constructive feedback on this output. What could be improved? Wha
                 continue
 
             try:
-                content, input_tokens, output_tokens, cost = result
+                content, input_tokens, output_tokens, cost, cache_hit = result
 
-                # Get member role for display
-                member = next((m for m in self.council_members if m.id == member_id), None)
-                member_role = member.role if member else provider_name
+                member_role = member.role
 
-                # Save to database
+                # Stage for the batch save once every member has finished
                 response = Response(
+                    id=str(uuid.uuid4()),
                     session_id=session.id,
                     provider=provider_name,
                     model=model,
                     iteration=1,
-                    role="council",
+                    role=ResponseRole.COUNCIL,
                     content=content,
                     input_tokens=input_tokens,
                     output_tokens=output_tokens,
                     estimated_cost=cost,
                 )
-                self.db.add(response)
-                await self.db.commit()
-                await self.db.refresh(response)
+                staged.append(response)
 
                 yield {
                     "type": "initial_response",
@@ -542,6 +746,7 @@ Please provide constructive feedback on this output. What could be improved? Wha
                     "content": content,
                     "tokens": {"input": input_tokens, "output": output_tokens},
                     "cost": cost,
+                    "cache_hit": cache_hit,
                     "done": True,
                     "response_id": response.id,
                 }
@@ -553,6 +758,13 @@ Please provide constructive feedback on this output. What could be improved? Wha
                     "message": f"Failed to save response: {str(e)}",
                 }
 
+        error = await self._save_responses(staged)
+        if error:
+            yield {
+                "type": "error",
+                "message": f"Failed to save responses: {str(error)}",
+            }
+
     async def _collect_feedback(
         self, session: Session, merged_response: dict, iteration: int
     ) -> AsyncGenerator[dict, None]:
@@ -564,26 +776,10 @@ Please provide constructive feedback on this output. What could be improved? Wha
             }
             return
 
-        # Create wrapper coroutines that return member info with result
-        async def get_feedback_with_member(provider, member_id, member_role, member_model, prompt, temp, system_prompt):
-            try:
-                result = await self._get_provider_response(provider, prompt, temp, system_prompt, model=member_model)
-                return member_id, member_role, member_model, result, None
-            except Exception as e:
-                return member_id, member_role, None, None, e
-
         temperature = self._get_temperature_for_session(session)
 
-        # Create tasks for all council members
-        tasks = []
-        for member in self.council_members:
-            provider = self.provider_factory.get_provider(member.provider)
-            if provider:
-                # Get member's personality system prompt
-                system_prompt = self.member_personalities.get(member.id)
-
-                # Create feedback prompt
-                feedback_prompt = f"""Please review and critique the following merged response:
+        # The feedback prompt is the same for every member; build it once
+        feedback_prompt = f"""Please review and critique the following merged response:
 
 {merged_response['content']}
 
@@ -595,14 +791,25 @@ Provide constructive feedback on:
 3. Any missing perspectives or considerations
 4. Specific suggestions for enhancement"""
 
-                tasks.append(get_feedback_with_member(
-                    provider, member.id, member.role, member.model,
-                    feedback_prompt, temperature, system_prompt
-                ))
+        # Stream every council member's feedback
+        jobs = self._member_jobs(self.council_members, feedback_prompt, temperature)
 
-        # Run all members in parallel
-        for coro in asyncio.as_completed(tasks):
-            member_id, member_role, model, result, error = await coro
+        # Relay tokens as they arrive; completed responses are saved together
+        staged = []
+        async for member, delta, result, error in self._fan_in(jobs):
+            member_id, member_role, model = member.id, member.role, member.model
+
+            if result is None and error is None:
+                yield {
+                    "type": "feedback",
+                    "iteration": iteration,
+                    "provider": member_id,
+                    "member_id": member_id,
+                    "member_role": member_role,
+                    "delta": delta,
+                    "done": False,
+                }
+                continue
 
             if error:
                 yield {
@@ -614,23 +821,22 @@ Provide constructive feedback on:
                 continue
 
             try:
-                content, input_tokens, output_tokens, cost = result
+                content, input_tokens, output_tokens, cost, cache_hit = result
 
-                # Save to database with member info
+                # Stage for the batch save once every member has finished with member info
                 response = Response(
+                    id=str(uuid.uuid4()),
                     session_id=session.id,
                     provider=member_id,  # Store member_id in provider field
                     model=model,
                     iteration=iteration,
-                    role="council",
+                    role=ResponseRole.COUNCIL,
                     content=content,
                     input_tokens=input_tokens,
                     output_tokens=output_tokens,
                     estimated_cost=cost,
                 )
-                self.db.add(response)
-                await self.db.commit()
-                await self.db.refresh(response)
+                staged.append(response)
 
                 yield {
                     "type": "feedback",
@@ -641,6 +847,7 @@ Provide constructive feedback on:
                     "content": content,
                     "tokens": {"input": input_tokens, "output": output_tokens},
                     "cost": cost,
+                    "cache_hit": cache_hit,
                     "done": True,
                     "response_id": response.id,
                 }
@@ -653,11 +860,30 @@ Provide constructive feedback on:
                     "message": f"Failed to get feedback: {str(e)}",
                 }
 
+        error = await self._save_responses(staged)
+        if error:
+            yield {
+                "type": "error",
+                "message": f"Failed to save responses: {str(error)}",
+            }
+
     async def _create_merge(
         self, session: Session, responses: list[dict], iteration: int, previous_merge: dict = None
     ) -> AsyncGenerator[dict, None]:
         """Chair creates a merged response from all inputs."""
-        chair_provider = self.provider_factory.get_provider(session.chair_provider)
+        # Get chair's personality system prompt, model, and role from council members
+        chair_system_prompt = None
+        chair_member_id = None
+        chair_member_role = None
+        chair_model = None
+        chair_member = self._chair_member
+        if chair_member:
+            chair_system_prompt = self.member_personalities.get(chair_member.id)
+            chair_member_id = chair_member.id
+            chair_member_role = chair_member.role
+            chair_model = chair_member.model
+
+        chair_provider = self.provider_factory.get_provider(session.chair_provider, chair_model)
 
         if not chair_provider:
             yield {
@@ -666,24 +892,25 @@ Provide constructive feedback on:
             }
             return
 
-        # Get chair's personality system prompt, model, and role from council members
-        chair_system_prompt = None
-        chair_member_id = None
-        chair_member_role = None
-        chair_model = None
-        if self.council_members:
-            chair_member = next((m for m in self.council_members if m.is_chair), None)
-            if chair_member:
-                chair_system_prompt = self.member_personalities.get(chair_member.id)
-                chair_member_id = chair_member.id
-                chair_member_role = chair_member.role
-                chair_model = chair_member.model
-
-        # Build merge prompt
-        responses_text = "\n\n".join([
-            f"--- Response from {r['provider']} ---\n{r['content']}"
-            for r in responses
-        ])
+        temperature = self._get_temperature_for_session(session)
+
+        # Build merge prompt; large councils are first condensed into two
+        # partial syntheses drafted in parallel, keeping the final prompt short
+        shard_usage = (0, 0, 0.0)
+        if len(responses) >= MERGE_SHARD_MIN_RESPONSES:
+            yield {"type": "status", "message": "Chair is drafting partial syntheses..."}
+            try:
+                responses_text, shard_usage = await self._draft_merge_shards(
+                    session, responses, iteration, chair_provider, temperature, chair_system_prompt
+                )
+            except Exception as e:
+                yield {
+                    "type": "error",
+                    "message": f"Chair failed to create merge: {str(e)}",
+                }
+                return
+        else:
+            responses_text = _format_council_responses(responses)
 
         if iteration == 1:
             merge_prompt = f"""As the chair of this council, synthesize these council member responses into a single, concrete deliverable.
@@ -724,29 +951,50 @@ CRITICAL INSTRUCTIONS:
 Begin your response with the actual deliverable content immediately."""
 
         # Get chair's merged response with their personality
-        temperature = self._get_temperature_for_session(session)
-
         try:
-            content, input_tokens, output_tokens, cost = await self._get_provider_response(
-                chair_provider, merge_prompt, temperature, chair_system_prompt, model=chair_model
-            )
-
-            # Save to database (use chair_model if available, otherwise get from provider)
-            model_to_save = chair_model if chair_model else getattr(chair_provider, 'model', 'unknown')
+            async for delta, result in self._stream_provider_response(
+                chair_provider, merge_prompt, temperature, chair_system_prompt
+            ):
+                if result is None:
+                    yield {
+                        "type": "merge",
+                        "iteration": iteration,
+                        "provider": session.chair_provider,
+                        "member_id": chair_member_id,
+                        "member_role": chair_member_role,
+                        "delta": delta,
+                        "done": False,
+                    }
+            content, input_tokens, output_tokens, cost, cache_hit = result
+
+            # Drafting is part of the merge, so it counts towards its usage
+            input_tokens += shard_usage[0]
+            output_tokens += shard_usage[1]
+            cost += shard_usage[2]
+
+            # Save to database; the chair provider is bound to the chair's model
+            model_to_save = chair_provider.model
             response = Response(
+                id=str(uuid.uuid4()),
                 session_id=session.id,
                 provider=session.chair_provider,
                 model=model_to_save,
                 iteration=iteration,
-                role="chair",
+                role=ResponseRole.CHAIR,
                 content=content,
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
                 estimated_cost=cost,
             )
-            self.db.add(response)
-            await self.db.commit()
-            await self.db.refresh(response)
+            # Commit before reporting the merge as final, so it survives the
+            # client disconnecting or a later round's save failing
+            error = await self._save_responses([response])
+            if error:
+                yield {
+                    "type": "error",
+                    "message": f"Failed to save merge: {str(error)}",
+                }
+                return
 
             yield {
                 "type": "merge",
@@ -757,6 +1005,7 @@ Begin your response with the actual deliverable content immediately."""
                 "content": content,
                 "tokens": {"input": input_tokens, "output": output_tokens},
                 "cost": cost,
+                "cache_hit": cache_hit,
                 "done": True,
                 "response_id": response.id,
             }
@@ -767,57 +1016,264 @@ Begin your response with the actual deliverable content immediately."""
                 "message": f"Chair failed to create merge: {str(e)}",
             }
 
-    async def _get_provider_response(
-        self, provider, prompt: str, temperature: float, system_prompt: str | None = None, model: str | None = None
-    ) -> tuple[str, int, int, float]:
+    async def _draft_merge_shards(
+        self, session: Session, responses: list[dict], iteration: int, chair_provider,
+        temperature: float, system_prompt: str | None,
+    ) -> tuple[str, tuple[int, int, float]]:
+        """
+        Condense each half of the council's input into a partial synthesis.
+
+        Both halves are drafted by the chair in parallel, so the final merge
+        prompt carries two drafts instead of every response.
+
+        Returns: (drafts formatted for the merge prompt, (input_tokens, output_tokens, cost))
+        """
+        kind = "responses" if iteration == 1 else "feedback"
+
+        async def draft(shard: list[dict]) -> tuple:
+            draft_prompt = f"""As the chair of this council, you are preparing one part of a larger synthesis.
+
+Original prompt: {session.prompt}
+
+Council {kind}:
+{_format_council_responses(shard)}
+
+Condense these into a single partial synthesis that keeps every distinct point, recommendation and piece of content. It will be combined with the rest of the council's input in a later step, so do not add an introduction or conclusion."""
+
+            async for _, result in self._stream_provider_response(
+                chair_provider, draft_prompt, temperature, system_prompt
+            ):
+                pass
+            return result
+
+        half = (len(responses) + 1) // 2
+        drafts = await asyncio.gather(draft(responses[:half]), draft(responses[half:]))
+
+        drafts_text = "\n\n".join(
+            f"--- Partial synthesis {number} of {len(drafts)} ---\n{content}"
+            for number, (content, *_) in enumerate(drafts, 1)
+        )
+        usage = (
+            sum(d[1] for d in drafts),
+            sum(d[2] for d in drafts),
+            sum(d[3] for d in drafts),
+        )
+        return drafts_text, usage
+
+    async def _count_reused_tokens(self, provider, text: str | None) -> int:
         """
-        Get a complete response from a provider.
+        Token count of text sent unchanged with every request, tokenized once per session.
+
+        Personality system prompts and the uploaded file context are repeated
+        for every member on every iteration, so each is counted on first use
+        per provider and model and then looked up.
+        """
+        if not text:
+            return 0
+        key = (provider.name, provider.model, text)
+        count = self._reused_tokens.get(key)
+        if count is None:
+            count = self._reused_tokens[key] = await _count_tokens(provider, text)
+        return count
+
+    def _supports_vision(self, provider) -> bool:
+        """
+        Whether the provider's active model accepts images, resolved once per model.
+
+        Only consulted when the session has an image, so text-only sessions
+        never reach it.
+        """
+        key = (provider.name, provider.model)
+        supported = self._vision_support.get(key)
+        if supported is None:
+            supported = self._vision_support[key] = self.provider_factory.supports_vision(*key)
+        return supported
+
+    async def _save_responses(self, responses: list[Response]) -> Exception | None:
+        """
+        Save a round of council responses (or a chair merge) in a single transaction.
+
+        Members' responses are staged with pre-generated ids while their
+        streams are relayed, so the round costs one commit instead of one
+        per member. Returns the error if the commit failed.
+        """
+        if not responses:
+            return None
+
+        self.db.add_all(responses)
+        try:
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            return e
+        return None
+
+    def _member_jobs(self, members: list, prompt: str, temperature: float) -> list[tuple]:
+        """
+        Build one provider stream per distinct member configuration.
+
+        Members with the same provider, model and personality would send an
+        identical request. When sampling is deterministic (temperature at
+        DEDUPE_MAX_TEMPERATURE) their answers would be the same, so they
+        share a single stream whose output `_fan_in` relays to each.
+
+        Returns: (members, stream) jobs for `_fan_in`
+        """
+        dedupe = temperature <= DEDUPE_MAX_TEMPERATURE
+        groups: dict[tuple, list] = {}
+        jobs = []
+        for member in members:
+            provider = self._provider_by_member_id.get(member.id)
+            if not provider:
+                continue
+            system_prompt = self.member_personalities.get(member.id)
+            key = (member.provider, member.model, system_prompt)
+            if dedupe and key in groups:
+                groups[key].append(member)
+                continue
+            group = groups[key] = [member]
+            jobs.append((group, self._stream_provider_response(
+                provider, prompt, temperature, system_prompt
+            )))
+        return jobs
+
+    async def _fan_in(self, jobs: list[tuple]) -> AsyncGenerator[tuple, None]:
+        """
+        Drain several provider streams concurrently.
+
+        Each job is a (keys, stream) pair where stream is a
+        `_stream_provider_response` generator shared by every key in keys.
+        Every stream runs in its own producer task that pushes into a shared
+        queue and always ends with a sentinel, so tokens are relayed in
+        arrival order and a slow consumer (e.g. a DB write) never blocks
+        producers from queueing results.
+
+        Yields: (key, delta, result, error) for each key of the stream; a
+        stream is finished once its item carries a result or an error. Only
+        the first key of a shared stream is charged for it; the others get
+        the result as a cache hit at no cost.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def produce(keys, stream):
+            try:
+                async for delta, result in stream:
+                    await queue.put((keys, delta, result, None))
+            except Exception as e:
+                await queue.put((keys, None, None, e))
+            finally:
+                queue.put_nowait(_STREAM_END)
+
+        tasks = [asyncio.create_task(produce(keys, stream)) for keys, stream in jobs]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                item = await queue.get()
+                if item is _STREAM_END:
+                    remaining -= 1
+                    continue
+                keys, delta, result, error = item
+                for index, key in enumerate(keys):
+                    if index and result is not None:
+                        result = (*result[:3], 0.0, True)
+                    yield key, delta, result, error
+        finally:
+            # Stop any provider still streaming if the consumer goes away, and
+            # wait so every request is aborted before control moves on
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _stream_provider_response(
+        self, provider, prompt: str, temperature: float, system_prompt: str | None = None
+    ) -> AsyncGenerator[tuple[str, tuple[str, int, int, float, bool] | None], None]:
+        """
+        Stream a response from a provider.
+
+        At temperatures up to RESPONSE_CACHE_MAX_TEMPERATURE, identical
+        requests within RESPONSE_CACHE_TTL are replayed from the response
+        cache as a single chunk, at no cost.
 
         Args:
-            provider: The AI provider instance
+            provider: The AI provider instance, bound to the member's model
             prompt: The user prompt
             temperature: Temperature for generation
             system_prompt: Optional system prompt (personality/role instructions)
-            model: Optional specific model to use (overrides provider's default)
 
-        Returns: (content, input_tokens, output_tokens, cost)
+        Yields: (delta, None) for each text chunk as it arrives, then a final
+        ("", (content, input_tokens, output_tokens, cost, cache_hit)) once complete
         """
-        # Add file context to prompt if available
-        full_prompt = prompt
-        if self.file_context:
-            full_prompt = f"{self.file_context}\n\n{prompt}"
-
-        content = ""
+        # File context is sent as a stable system segment rather than
+        # prepended to the prompt, so providers can serve it from their
+        # prompt cache across members and iterations
+        context = self.file_context or None
+
+        chunks = []
+        usage = None
+
+        # Determine if we should send image data
+        image_to_send = None
+        if self.image_data and self._supports_vision(provider):
+            image_to_send = self.image_data
+
+        cache_key = None
+        if temperature <= RESPONSE_CACHE_MAX_TEMPERATURE:
+            cache_key = _response_cache_key(
+                provider.name, provider.model, temperature,
+                AIProvider._system_with_context(system_prompt, context), prompt, image_to_send,
+            )
+            cached = _get_cached_response(cache_key)
+            if cached is not None:
+                content, input_tokens, output_tokens = cached
+                yield content, None
+                yield "", (content, input_tokens, output_tokens, 0.0, True)
+                return
 
-        # Temporarily set model if specified (for supporting multiple models per provider)
-        original_model = None
-        if model:
-            original_model = provider.model
-            provider.model = model
+        # Relay streamed response with personality system prompt
+        for attempt in range(1, PROVIDER_MAX_ATTEMPTS + 1):
+            try:
+                async with _provider_slot(provider.name):
+                    async for chunk in provider.stream_completion(
+                        prompt=prompt,
+                        system_prompt=system_prompt,
+                        temperature=temperature,
+                        max_tokens=4000,
+                        image_data=image_to_send,
+                        context=context,
+                    ):
+                        if isinstance(chunk, TokenUsage):
+                            usage = chunk
+                            continue
+                        chunks.append(chunk)
+                        yield chunk, None
+                break
+            except _RETRYABLE_ERRORS as e:
+                # Output already relayed can't be taken back, so only a
+                # request that failed before its first chunk is retried
+                if chunks or attempt == PROVIDER_MAX_ATTEMPTS:
+                    raise
+                delay = _retry_delay(attempt, getattr(e, "retry_after", None))
+                logger.warning(
+                    f"{provider.name} request failed ({e}); retry {attempt}/{PROVIDER_MAX_ATTEMPTS - 1} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
 
-        try:
-            # Determine if we should send image data
-            image_to_send = None
-            if self.image_data and hasattr(provider, 'supports_vision') and provider.supports_vision():
-                image_to_send = self.image_data
-
-            # Collect streamed response with personality system prompt
-            async for chunk in provider.stream_completion(
-                prompt=full_prompt,
-                system_prompt=system_prompt,
-                temperature=temperature,
-                max_tokens=4000,
-                image_data=image_to_send,
-            ):
-                content += chunk
+        content = "".join(chunks)
 
-            # Count tokens and estimate cost
-            input_tokens = provider.count_tokens(full_prompt)
-            output_tokens = provider.count_tokens(content)
-            cost = provider.estimate_cost(input_tokens, output_tokens)
+        if usage:
+            # Exact counts reported by the provider
+            input_tokens, output_tokens = usage
+        else:
+            # Count tokens (system prompt included, as providers bill it); only
+            # the prompt itself is new, the file context is memoized
+            input_tokens = (
+                await _count_tokens(provider, prompt)
+                + await self._count_reused_tokens(provider, self.file_context)
+                + await self._count_reused_tokens(provider, system_prompt)
+            )
+            output_tokens = await _count_tokens(provider, content)
+        cost = provider.estimate_cost(input_tokens, output_tokens)
+        if cache_key and content:
+            _cache_response(cache_key, (content, input_tokens, output_tokens))
 
-            return content, input_tokens, output_tokens, cost
-        finally:
-            # Restore original model if we changed it
-            if original_model is not None:
-                provider.model = original_model
+        yield "", (content, input_tokens, output_tokens, cost, False)
@@ -1,12 +1,19 @@
 """Pytest configuration and fixtures."""
+
 import pytest
 import pytest_asyncio
+import respx
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
+from sse_starlette.sse import AppStatus
 
 from app.main import app
+from app.core.config import settings
 from app.core.database import Base, get_db
+from app.services import session_orchestrator
+from app.services.ai_providers import ollama_provider
+from app.services.ai_providers.ollama_provider import OllamaProvider
 
 
 # Test database URL (in-memory SQLite)
@@ -34,6 +41,14 @@ async def test_db():
     await engine.dispose()
 
 
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Keep cached provider responses and loop-bound limiters from leaking between tests."""
+    yield
+    session_orchestrator._response_cache.clear()
+    session_orchestrator._provider_slots.clear()
+
+
 @pytest_asyncio.fixture
 async def client(test_db):
     """Create a test client with database override."""
@@ -41,6 +56,8 @@ async def client(test_db):
         yield test_db
 
     app.dependency_overrides[get_db] = override_get_db
+    # sse-starlette caches its shutdown event on the first event loop it sees
+    AppStatus.should_exit_event = None
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
@@ -49,6 +66,34 @@ async def client(test_db):
     app.dependency_overrides.clear()
 
 
+@pytest_asyncio.fixture
+async def shared_ollama(monkeypatch):
+    """Make the API routes reuse one Ollama provider, closed on this test's event loop."""
+    provider = OllamaProvider()
+    factory = lambda *args, **kwargs: provider
+    for module in ("archetypes", "ollama", "system"):
+        monkeypatch.setattr(f"app.api.routes.{module}.OllamaProvider", factory)
+    yield provider
+    # The HTTP client is bound to the loop that created it; never carry it into the next test
+    await ollama_provider.close_clients()
+
+
+@pytest.fixture
+def mock_ollama():
+    """Stub the Ollama HTTP API so tests never need a running Ollama server."""
+    with respx.mock(base_url=settings.ollama_base_url, assert_all_called=False) as router:
+        router.get("/api/version").respond(json={"version": "0.5.7"})
+        router.get("/api/tags").respond(json={"models": [{"name": "llama3:8b"}, {"name": "qwen3:8b"}]})
+        router.post("/api/pull").respond(
+            text='{"status": "pulling manifest"}\n{"status": "success"}\n'
+        )
+        router.delete("/api/delete", name="delete").respond(json={})
+        router.post("/api/chat", name="chat").respond(
+            text='{"message": {"content": "Council "}}\n{"message": {"content": "reply"}}\n'
+        )
+        yield router
+
+
 @pytest.fixture
 def sample_council_members():
     """Sample council member configuration for tests."""
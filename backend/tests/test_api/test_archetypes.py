@@ -0,0 +1,30 @@
+"""Archetype endpoint tests."""
+import pytest
+
+from app.core.personality_archetypes import PERSONALITY_ARCHETYPES
+
+
+@pytest.mark.asyncio
+async def test_list_archetypes(client, shared_ollama, mock_ollama):
+    """Test archetype list returns every archetype with recommendations."""
+    response = await client.get("/api/archetypes")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == len(PERSONALITY_ARCHETYPES)
+    assert {a["id"] for a in data["archetypes"]} == set(PERSONALITY_ARCHETYPES)
+    for archetype in data["archetypes"]:
+        assert archetype["recommended_models"]
+
+    # Installed models with suitability scores are ranked ahead of static fallbacks
+    by_id = {a["id"]: a for a in data["archetypes"]}
+    assert by_id["balanced"]["recommended_models"][0] in {"llama3:8b", "qwen3:8b"}
+
+
+@pytest.mark.asyncio
+async def test_get_archetype(client):
+    """Test single archetype lookup includes its system prompt."""
+    response = await client.get("/api/archetypes/critic")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["id"] == "critic"
+    assert data["system_prompt"] == PERSONALITY_ARCHETYPES["critic"]["system_prompt"]
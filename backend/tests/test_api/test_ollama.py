@@ -0,0 +1,90 @@
+"""Ollama and system endpoint tests."""
+import json
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_ollama_status(client, shared_ollama, mock_ollama):
+    """Test status endpoint reports a running Ollama with its version."""
+    response = await client.get("/api/ollama/status")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["running"] is True
+    assert data["version"] == "0.5.7"
+    assert "system_ram" in data
+
+
+@pytest.mark.asyncio
+async def test_list_ollama_models(client, shared_ollama, mock_ollama):
+    """Test model list endpoint returns info for each installed model."""
+    response = await client.get("/api/ollama/models")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == 2
+    assert [m["name"] for m in data["models"]] == ["llama3:8b", "qwen3:8b"]
+    assert data["models"][1]["base_model"] == "qwen3"
+
+
+@pytest.mark.asyncio
+async def test_model_info_installed(client, shared_ollama, mock_ollama):
+    """Test model info endpoint flags installed models."""
+    response = await client.get("/api/ollama/models/llama3:8b/info")
+    assert response.status_code == 200
+    assert response.json()["installed"] is True
+
+
+@pytest.mark.asyncio
+async def test_pull_model_streams_progress(client, shared_ollama, mock_ollama):
+    """Test pull endpoint relays Ollama progress as SSE events."""
+    response = await client.post("/api/ollama/models/pull", json={"model_name": "tinyllama"})
+    assert response.status_code == 200
+    events = [
+        json.loads(line[len("data: "):])
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+    assert [e["status"] for e in events] == ["pulling manifest", "success"]
+
+
+@pytest.mark.asyncio
+async def test_delete_model(client, mock_ollama):
+    """Test delete endpoint forwards the request to Ollama."""
+    response = await client.delete("/api/ollama/models/llama3:8b")
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+    assert mock_ollama["delete"].called
+
+
+@pytest.mark.asyncio
+async def test_ollama_offline(client, shared_ollama, mock_ollama):
+    """Test status endpoint degrades gracefully when Ollama is unreachable."""
+    mock_ollama.get("/api/version").respond(status_code=503)
+    response = await client.get("/api/ollama/status")
+    assert response.status_code == 200
+    assert response.json()["running"] is False
+
+
+@pytest.mark.asyncio
+async def test_ram_status(client, shared_ollama):
+    """Test RAM status endpoint returns usage and model lists."""
+    response = await client.get("/api/system/ram-status")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] in {"healthy", "warning", "critical"}
+    assert len(data["all_models"]) == len(shared_ollama.MODEL_RAM_REQUIREMENTS)
+
+
+@pytest.mark.asyncio
+async def test_list_available_mlx_models(client):
+    """Test the popular MLX model catalogue is serialized field by field."""
+    response = await client.get("/api/ollama/mlx/available")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count"] == len(data["models"])
+    assert data["models"]["phi-3-mini"] == {
+        "repo": "mlx-community/Phi-3-mini-4k-instruct-4bit",
+        "description": "Phi-3 Mini - Compact, efficient",
+        "size": "2.4GB",
+        "quantization": "4-bit",
+    }
@@ -0,0 +1,15 @@
+"""Provider endpoint tests."""
+import pytest
+
+from app.core.constants import PROVIDER_CONFIGS
+
+
+@pytest.mark.asyncio
+async def test_list_providers(client, mock_ollama):
+    """Test provider list reports installed Ollama models and all known providers."""
+    response = await client.get("/api/providers")
+    assert response.status_code == 200
+    providers = response.json()["providers"]
+    assert set(providers) == set(PROVIDER_CONFIGS)
+    assert providers["ollama"]["configured"] is True
+    assert providers["ollama"]["available_models"] == ["llama3:8b", "qwen3:8b"]
@@ -0,0 +1,303 @@
+"""Session streaming endpoint tests."""
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+
+from app.api.routes import session as session_routes
+from app.core.config import settings
+from app.core.constants import ResponseRole
+from app.models.response import Response
+from app.schemas.session import SessionCreate
+from app.services.session_orchestrator import SessionOrchestrator
+
+
+def parse_events(body: str) -> list[dict]:
+    """Parse SSE `data:` lines into event dicts."""
+    return [
+        json.loads(line[len("data: "):])
+        for line in body.splitlines()
+        if line.startswith("data: ")
+    ]
+
+
+@pytest.fixture
+def ollama_council():
+    """Two-member council running entirely on (stubbed) Ollama."""
+    return [
+        {"id": "member-1", "provider": "ollama", "model": "llama3.1", "role": "Chair", "is_chair": True},
+        {"id": "member-2", "provider": "ollama", "model": "qwen3", "role": "Critic", "archetype": "critic"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_create_session_streams_events(client, mock_ollama, ollama_council):
+    """Test a session streams creation, member responses, the merge and completion."""
+    response = await client.post(
+        "/api/session/create",
+        json={"prompt": "Summarize TDD", "council_members": ollama_council},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    # Frames are compact JSON
+    assert 'data: {"type":"session_created",' in response.text
+
+    events = parse_events(response.text)
+    types = [e["type"] for e in events if e.get("done", True)]
+    assert types[0] == "session_created"
+    assert types.count("initial_response") == 2
+    assert "merge" in types
+    assert types[-1] == "complete"
+
+    merge = next(e for e in events if e["type"] == "merge" and e["done"])
+    assert merge["content"] == "Council reply"
+    assert merge["member_id"] == "member-1"
+
+
+def test_encoded_events_omit_unset_fields():
+    """Test SSE payloads are compact UTF-8 JSON without None-valued fields."""
+    event = {"type": "merge", "member_role": None, "delta": "café", "done": False}
+
+    assert session_routes._encode_event(event) == '{"type":"merge","delta":"café","done":false}'
+
+
+@pytest.mark.asyncio
+async def test_create_session_streams_token_deltas(client, mock_ollama, ollama_council):
+    """Test member and chair tokens are relayed before each completed response."""
+    response = await client.post(
+        "/api/session/create",
+        json={"prompt": "Summarize TDD", "council_members": ollama_council},
+    )
+    events = parse_events(response.text)
+
+    for member_id in ("member-1", "member-2"):
+        member_events = [
+            e for e in events
+            if e["type"] == "initial_response" and e["member_id"] == member_id
+        ]
+        *deltas, final = member_events
+        assert [e["delta"] for e in deltas] == ["Council ", "reply"]
+        assert not any(e["done"] for e in deltas)
+        assert final["done"] and final["content"] == "Council reply"
+
+    merge_events = [e for e in events if e["type"] == "merge"]
+    assert "".join(e.get("delta", "") for e in merge_events[:-1]) == "Council reply"
+    assert merge_events[-1]["done"]
+
+
+@pytest.mark.asyncio
+async def test_create_session_persists_streamed_response_ids(client, test_db, mock_ollama, ollama_council):
+    """Test the ids streamed with each response match the rows saved for it."""
+    response = await client.post(
+        "/api/session/create",
+        json={"prompt": "Summarize TDD", "council_members": ollama_council},
+    )
+    events = parse_events(response.text)
+    streamed = {
+        e["response_id"]: e["content"]
+        for e in events
+        if e["type"] in ("initial_response", "merge") and e["done"]
+    }
+
+    rows = (await test_db.execute(select(Response))).scalars().all()
+    assert {row.id: row.content for row in rows} == streamed
+    assert len(rows) == 3
+
+
+@pytest.mark.asyncio
+async def test_repeated_session_replays_cached_responses(client, mock_ollama, ollama_council):
+    """Test an identical precise session is served from the response cache at no cost."""
+    request = {"prompt": "Summarize TDD", "council_members": ollama_council, "preset": "precise"}
+    await client.post("/api/session/create", json=request)
+    calls = mock_ollama["chat"].call_count
+
+    response = await client.post("/api/session/create", json=request)
+    events = parse_events(response.text)
+
+    assert mock_ollama["chat"].call_count == calls
+    done = [e for e in events if e["type"] in ("initial_response", "merge") and e["done"]]
+    assert len(done) == 3
+    assert all(e["cache_hit"] and e["cost"] == 0.0 for e in done)
+    assert all(e["content"] == "Council reply" for e in done)
+
+
+@pytest.mark.asyncio
+async def test_repeated_creative_session_samples_again(client, mock_ollama, ollama_council):
+    """Test re-running a prompt above the cache temperature makes fresh calls."""
+    request = {"prompt": "Summarize TDD", "council_members": ollama_council, "preset": "creative"}
+    await client.post("/api/session/create", json=request)
+    calls = mock_ollama["chat"].call_count
+
+    response = await client.post("/api/session/create", json=request)
+    events = parse_events(response.text)
+
+    assert mock_ollama["chat"].call_count == 2 * calls
+    done = [e for e in events if e["type"] in ("initial_response", "merge") and e["done"]]
+    assert not any(e["cache_hit"] for e in done)
+
+
+@pytest.mark.asyncio
+async def test_multi_iteration_session_saves_every_merge(client, test_db, mock_ollama, ollama_council):
+    """Test every iteration's merge is persisted with the id it was streamed with."""
+    response = await client.post(
+        "/api/session/create",
+        json={"prompt": "Summarize TDD", "council_members": ollama_council, "iterations": 2},
+    )
+    events = parse_events(response.text)
+    streamed = {
+        e["response_id"]
+        for e in events
+        if e["type"] in ("initial_response", "merge", "feedback") and e["done"]
+    }
+
+    rows = (await test_db.execute(select(Response))).scalars().all()
+    assert {row.id for row in rows} == streamed
+    assert sorted((row.iteration, row.role.value) for row in rows if row.role.value == "chair") == [
+        (1, "chair"), (2, "chair"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_merge_is_saved_before_it_is_streamed(test_db, mock_ollama, ollama_council):
+    """Test a merge reported as done is persisted even if the client goes away right after."""
+    request = {"prompt": "Summarize TDD", "council_members": ollama_council, "iterations": 2}
+    orchestrator = SessionOrchestrator(test_db)
+    session = await orchestrator.create_session(SessionCreate(**request))
+
+    run = orchestrator.run_session(session)
+    async for update in run:
+        if update["type"] == "merge" and update["done"]:
+            break
+    await run.aclose()
+    await test_db.rollback()
+
+    chair = (await test_db.execute(select(Response).where(Response.id == update["response_id"]))).scalar_one()
+    assert chair.content == update["content"]
+
+
+@pytest.mark.asyncio
+async def test_large_council_merge_drafts_halves_first(client, mock_ollama):
+    """Test four or more responses are merged from two parallel partial drafts."""
+    council = [
+        {"id": f"member-{n}", "provider": "ollama", "model": f"model-{n}", "role": f"Member {n}", "is_chair": n == 1}
+        for n in range(1, 5)
+    ]
+    response = await client.post(
+        "/api/session/create",
+        json={"prompt": "Summarize TDD", "council_members": council},
+    )
+    events = parse_events(response.text)
+
+    assert {"type": "status", "message": "Chair is drafting partial syntheses..."} in events
+    # Four members, one draft per half and the final merge
+    assert mock_ollama["chat"].call_count == 7
+    final_prompt = json.loads(mock_ollama["chat"].calls[-1].request.content)["messages"][-1]["content"]
+    assert "Partial synthesis 2 of 2" in final_prompt
+    assert "Response from ollama" not in final_prompt
+
+    merge = next(e for e in events if e["type"] == "merge" and e["done"])
+    assert merge["content"] == "Council reply"
+
+
+@pytest.mark.asyncio
+async def test_identical_members_sample_independently(client, test_db, mock_ollama):
+    """Test identical members in a balanced (0.7) session each make their own call."""
+    twin = {"provider": "ollama", "model": "qwen3", "role": "Critic", "archetype": "critic"}
+    council = [
+        {"id": "member-1", "provider": "ollama", "model": "llama3.1", "role": "Chair", "is_chair": True},
+        {"id": "member-2", **twin},
+        {"id": "member-3", **twin},
+    ]
+    response = await client.post(
+        "/api/session/create",
+        json={"prompt": "Summarize TDD", "council_members": council},
+    )
+    events = parse_events(response.text)
+
+    # One call per member plus the chair's merge
+    assert mock_ollama["chat"].call_count == 4
+    done = {e["member_id"]: e for e in events if e["type"] == "initial_response" and e["done"]}
+    assert done.keys() == {"member-1", "member-2", "member-3"}
+    assert not done["member-3"]["cache_hit"]
+
+    rows = (await test_db.execute(select(Response))).scalars().all()
+    assert len(rows) == 4
+
+
+@pytest.mark.asyncio
+async def test_members_with_unconfigured_provider_are_skipped(client, mock_ollama, ollama_council, monkeypatch):
+    """Test a member whose provider has no API key doesn't fail the whole session."""
+    monkeypatch.setattr(settings, "grok_api_key", None)
+    council = ollama_council + [
+        {"id": "member-3", "provider": "grok", "model": "grok-2", "role": "Skeptic"},
+    ]
+    response = await client.post(
+        "/api/session/create",
+        json={"prompt": "Summarize TDD", "council_members": council},
+    )
+    events = parse_events(response.text)
+
+    done = [e for e in events if e["type"] == "initial_response" and e["done"]]
+    assert sorted(e["member_id"] for e in done) == ["member-1", "member-2"]
+    assert events[-1]["type"] == "complete"
+
+
+@pytest.mark.asyncio
+async def test_resume_state_loaded_from_saved_responses(client, test_db, mock_ollama, ollama_council):
+    """Test a paused session's responses are rebuilt into a resume state from the DB."""
+    request = {"prompt": "Summarize TDD", "council_members": ollama_council, "iterations": 2}
+    events = parse_events((await client.post("/api/session/create", json=request)).text)
+    paused_id = events[0]["session_id"]
+
+    orchestrator = SessionOrchestrator(test_db)
+    await orchestrator.create_session(SessionCreate(**request))
+    state = await orchestrator._load_resume_state(paused_id)
+
+    assert state["current_iteration"] == 2
+    assert [r["iteration"] for r in state["merged_responses"]] == [1, 2]
+    assert sorted((r["iteration"], r["member_id"]) for r in state["responses"]) == [
+        (1, "member-1"), (1, "member-2"), (2, "member-1"), (2, "member-2"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_resume_state_orders_rows_saved_in_the_same_second(test_db, ollama_council):
+    """Test rows sharing a created_at load council first, in the order they were saved."""
+    orchestrator = SessionOrchestrator(test_db)
+    session = await orchestrator.create_session(
+        SessionCreate(prompt="Summarize TDD", council_members=ollama_council)
+    )
+    stamp = datetime(2026, 1, 1, 12, 0, 0)
+    saved = [("merge", ResponseRole.CHAIR)] + [(f"reply {n}", ResponseRole.COUNCIL) for n in range(6)]
+    test_db.add_all([
+        Response(
+            session_id=session.id, provider="ollama", model="llama3.1", content=content,
+            iteration=1, role=role, created_at=stamp,
+        )
+        for content, role in saved
+    ])
+    await test_db.commit()
+
+    state = await orchestrator._load_resume_state(session.id)
+
+    assert [r["content"] for r in state["responses"]] == [f"reply {n}" for n in range(6)]
+    assert [r["content"] for r in state["merged_responses"]] == ["merge"]
+
+
+@pytest.mark.asyncio
+async def test_resume_by_session_id_skips_completed_work(client, mock_ollama, ollama_council):
+    """Test resuming with only the paused session id re-requests nothing already saved."""
+    request = {"prompt": "Summarize TDD", "council_members": ollama_council}
+    events = parse_events((await client.post("/api/session/create", json=request)).text)
+    calls = mock_ollama["chat"].call_count
+
+    response = await client.post(
+        "/api/session/resume",
+        json={**request, "resume_state": {"session_id": events[0]["session_id"]}},
+    )
+    events = parse_events(response.text)
+
+    assert mock_ollama["chat"].call_count == calls
+    assert not [e for e in events if e["type"] in ("initial_response", "merge")]
+    assert events[-1]["type"] == "complete"
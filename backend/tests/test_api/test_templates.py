@@ -0,0 +1,53 @@
+"""Council template endpoint tests."""
+import pytest
+
+from app.core.validation import MAX_TEMPLATE_SIZE
+
+
+@pytest.mark.asyncio
+async def test_save_and_get_template(client, sample_council_members):
+    """Test a saved template can be fetched back with its members."""
+    response = await client.post(
+        "/api/templates",
+        json={"name": "Default", "description": "Two members", "members": sample_council_members},
+    )
+    assert response.status_code == 200
+    saved = response.json()
+    assert saved["members"] == sample_council_members
+
+    response = await client.get(f"/api/templates/{saved['id']}")
+    assert response.status_code == 200
+    assert response.json()["name"] == "Default"
+
+
+@pytest.mark.asyncio
+async def test_update_template(client, sample_council_members):
+    """Test updating a template replaces its name and members."""
+    saved = (await client.post(
+        "/api/templates", json={"name": "Old", "members": sample_council_members}
+    )).json()
+
+    response = await client.put(
+        f"/api/templates/{saved['id']}",
+        json={"name": "New", "members": sample_council_members[:1]},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == "New"
+    assert data["members"] == sample_council_members[:1]
+
+
+@pytest.mark.asyncio
+async def test_oversized_template_rejected(client):
+    """Test templates whose members exceed the size limit are rejected."""
+    members = [{"id": "member-1", "custom_personality": "x" * MAX_TEMPLATE_SIZE}]
+    response = await client.post("/api/templates", json={"name": "Huge", "members": members})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_too_many_template_members_rejected(client):
+    """Test templates with more members than a council allows are rejected."""
+    members = [{"id": f"member-{i}"} for i in range(11)]
+    response = await client.post("/api/templates", json={"name": "Crowd", "members": members})
+    assert response.status_code == 422
@@ -0,0 +1,107 @@
+"""Test Anthropic provider helpers."""
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.exceptions import (
+    AIProviderError,
+    ModelNotFoundError,
+    ContextLengthError,
+    ContentFilterError,
+    TimeoutError,
+    ServiceUnavailableError,
+)
+from app.services.ai_providers import anthropic_provider
+from app.services.ai_providers.anthropic_provider import AnthropicProvider, _classify_api_error
+from app.services.ai_providers.base import TokenUsage
+
+
+@pytest.mark.asyncio
+async def test_client_shared_per_key():
+    """Test providers with the same key share one client and pool."""
+    first = AnthropicProvider(api_key="key-a")
+    second = AnthropicProvider(api_key="key-a", model="claude-3-haiku-20240307")
+    other = AnthropicProvider(api_key="key-b")
+
+    assert first.client is second.client
+    assert other.client is not first.client
+
+    await anthropic_provider.close_clients()
+    assert not anthropic_provider._clients
+    assert AnthropicProvider(api_key="key-a").client is not first.client
+    await anthropic_provider.close_clients()
+
+
+@pytest.mark.asyncio
+async def test_context_sent_as_cached_system_block(monkeypatch):
+    """Test shared context is a leading cached system block, chunks are coalesced and usage reported."""
+    sent = {}
+
+    class FakeStream:
+        async def __aenter__(self):
+            async def text_stream():
+                yield "o"
+                yield "k"
+            async def get_final_message():
+                usage = SimpleNamespace(
+                    input_tokens=5, cache_creation_input_tokens=None, cache_read_input_tokens=40, output_tokens=2
+                )
+                return SimpleNamespace(usage=usage)
+
+            return SimpleNamespace(text_stream=text_stream(), get_final_message=get_final_message)
+
+        async def __aexit__(self, *exc):
+            return False
+
+    def stream(**kwargs):
+        sent.update(kwargs)
+        return FakeStream()
+
+    provider = AnthropicProvider(api_key="key-context")
+    monkeypatch.setattr(provider, "client", SimpleNamespace(messages=SimpleNamespace(stream=stream)))
+    pieces = [piece async for piece in provider.stream_completion("Hi", system_prompt="Be brief.", context="notes")]
+
+    assert pieces == ["ok", TokenUsage(45, 2)]
+    assert sent["system"] == [
+        {
+            "type": "text",
+            "text": "<FILE_CONTEXT>\nnotes\n</FILE_CONTEXT>",
+            "cache_control": {"type": "ephemeral"},
+        },
+        {"type": "text", "text": "Be brief."},
+    ]
+    await anthropic_provider.close_clients()
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ("Error: model: claude-x not found", ModelNotFoundError),
+        ("prompt is too long: 250000 tokens", ContextLengthError),
+        ("Input exceeds the context window", ContextLengthError),
+        ("Content was blocked by policy", ContentFilterError),
+        ("Content filter triggered", ContentFilterError),
+        ("Request timeout", TimeoutError),
+        ("Overloaded", ServiceUnavailableError),
+        ("Service Unavailable", ServiceUnavailableError),
+        ("Something else went wrong", AIProviderError),
+    ],
+)
+def test_classify_api_error(message, expected):
+    """Test APIError messages map to the matching provider exception."""
+    assert _classify_api_error(message) is expected
+
+
+def test_pricing_follows_model():
+    """Test pricing and cost estimates follow the active model."""
+    provider = AnthropicProvider(api_key="test", model="claude-opus-4-20250514")
+    assert provider.get_pricing() == (15.00, 75.00)
+    assert provider.estimate_cost(1000, 1000) == 90.0
+
+    provider.model = "claude-haiku-3-5-20241022"
+    assert provider.get_pricing() == (0.80, 4.00)
+    assert provider.estimate_cost(1000, 1000) == 4.8
+
+    provider.model = "unknown-model"
+    assert provider.get_pricing() == (3.0, 15.0)
+    assert provider.estimate_cost(2000, 0) == 6.0
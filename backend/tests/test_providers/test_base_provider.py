@@ -0,0 +1,77 @@
+"""Test shared AIProvider helpers."""
+import asyncio
+
+import pytest
+
+from app.services.ai_providers.ollama_provider import OllamaProvider
+
+
+async def _stream(chunks, delay=0.0):
+    for chunk in chunks:
+        if delay:
+            await asyncio.sleep(delay)
+        yield chunk
+
+
+async def _collect(agen):
+    return [piece async for piece in agen]
+
+
+@pytest.fixture
+def provider():
+    return OllamaProvider(model="llama3:8b")
+
+
+class TestBatchedStream:
+    """Test upstream chunk coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_fast_chunks(self, provider):
+        """Test chunks arriving together are yielded as one piece."""
+        pieces = await _collect(provider._batched_stream(_stream(["a", "b", "c"])))
+        assert pieces == ["abc"]
+
+    @pytest.mark.asyncio
+    async def test_flushes_on_size(self, provider):
+        """Test a batch is flushed once it reaches max_chars."""
+        pieces = await _collect(provider._batched_stream(_stream(["ab", "cd", "e"]), max_chars=4))
+        assert pieces == ["abcd", "e"]
+
+    @pytest.mark.asyncio
+    async def test_flushes_on_delay(self, provider):
+        """Test slow chunks are not held back past max_delay_ms."""
+        pieces = await _collect(
+            provider._batched_stream(_stream(["a", "b"], delay=0.05), max_delay_ms=10)
+        )
+        assert pieces == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_propagates_upstream_errors(self, provider):
+        """Test errors from the upstream stream reach the caller."""
+        async def failing():
+            yield "partial"
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await _collect(provider._batched_stream(failing()))
+
+
+def test_count_tokens_estimate(provider):
+    """Test estimate-only providers count ~4 characters per token."""
+    assert provider.count_tokens("") == 0
+    assert provider.count_tokens("x" * 41) == 10
+    assert OllamaProvider.count_tokens("x" * 8) == 2
+
+
+@pytest.mark.parametrize(
+    "system_prompt, context, expected",
+    [
+        ("Be brief.", None, "Be brief."),
+        (None, None, None),
+        (None, "notes", "<FILE_CONTEXT>\nnotes\n</FILE_CONTEXT>"),
+        ("Be brief.", "notes", "<FILE_CONTEXT>\nnotes\n</FILE_CONTEXT>\n\nBe brief."),
+    ],
+)
+def test_system_with_context_puts_context_first(system_prompt, context, expected):
+    """Test shared context leads the system message so it forms a cacheable prefix."""
+    assert OllamaProvider._system_with_context(system_prompt, context) == expected
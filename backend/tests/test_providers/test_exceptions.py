@@ -11,67 +11,116 @@ from app.core.exceptions import (
     TimeoutError,
     InsufficientQuotaError,
     ServiceUnavailableError,
+    LLMingsError,
+    ValidationError,
+    NotFoundError,
+    ConfigurationError,
+    SessionError,
 )
 
 
-class TestExceptionHierarchy:
-    """Test exception class hierarchy and attributes."""
-
-    def test_base_exception_attributes(self):
-        """Test AIProviderError has correct attributes."""
-        error = AIProviderError("Test error", provider="openai")
-        assert str(error) == "Test error"
-        assert error.provider == "openai"
-
-    def test_rate_limit_error(self):
-        """Test RateLimitError with retry_after."""
-        error = RateLimitError("Rate limited", provider="anthropic", retry_after=60)
-        assert error.retry_after == 60
-        assert error.provider == "anthropic"
-        assert isinstance(error, AIProviderError)
-
-    def test_authentication_error(self):
-        """Test AuthenticationError."""
-        error = AuthenticationError(provider="google")
-        assert "Authentication failed" in str(error)
-        assert error.provider == "google"
-
-    def test_model_not_found_error(self):
-        """Test ModelNotFoundError with model name."""
-        error = ModelNotFoundError("gpt-5", provider="openai")
-        assert error.model == "gpt-5"
-        assert "gpt-5" in str(error)
-        assert "not found" in str(error).lower()
-
-    def test_context_length_error(self):
-        """Test ContextLengthError with max_tokens."""
-        error = ContextLengthError("Too long", provider="anthropic", max_tokens=100000)
-        assert error.max_tokens == 100000
-        assert error.provider == "anthropic"
-
-    def test_content_filter_error(self):
-        """Test ContentFilterError."""
-        error = ContentFilterError(provider="openai")
-        assert "blocked" in str(error).lower() or "filter" in str(error).lower()
+@pytest.mark.parametrize(
+    "exc_cls, args, kwargs, checks",
+    [
+        pytest.param(
+            AIProviderError, ("Test error",), {"provider": "openai"},
+            lambda e: str(e) == "Test error" and e.provider == "openai",
+            id="base",
+        ),
+        pytest.param(
+            RateLimitError, ("Rate limited",), {"provider": "anthropic", "retry_after": 60},
+            lambda e: e.retry_after == 60 and e.provider == "anthropic",
+            id="rate_limit",
+        ),
+        pytest.param(
+            AuthenticationError, (), {"provider": "google"},
+            lambda e: "Authentication failed" in str(e) and e.provider == "google",
+            id="authentication",
+        ),
+        pytest.param(
+            ModelNotFoundError, ("gpt-5",), {"provider": "openai"},
+            lambda e: e.model == "gpt-5" and "gpt-5" in str(e) and "not found" in str(e).lower(),
+            id="model_not_found",
+        ),
+        pytest.param(
+            ContextLengthError, ("Too long",), {"provider": "anthropic", "max_tokens": 100000},
+            lambda e: e.max_tokens == 100000 and e.provider == "anthropic",
+            id="context_length",
+        ),
+        pytest.param(
+            ContentFilterError, (), {"provider": "openai"},
+            lambda e: "blocked" in str(e).lower() or "filter" in str(e).lower(),
+            id="content_filter",
+        ),
+        pytest.param(
+            TimeoutError, ("Request timed out",), {"provider": "ollama", "timeout_seconds": 30},
+            lambda e: e.timeout_seconds == 30 and e.provider == "ollama",
+            id="timeout",
+        ),
+        pytest.param(
+            ConnectionError, (), {"provider": "ollama"},
+            lambda e: e.provider == "ollama",
+            id="connection",
+        ),
+        pytest.param(
+            InsufficientQuotaError, (), {"provider": "openai"},
+            lambda e: e.provider == "openai",
+            id="insufficient_quota",
+        ),
+        pytest.param(
+            ServiceUnavailableError, (), {"provider": "google"},
+            lambda e: e.provider == "google",
+            id="service_unavailable",
+        ),
+    ],
+)
+def test_exception(exc_cls, args, kwargs, checks):
+    """Test exception construction, attributes and inheritance from AIProviderError."""
+    error = exc_cls(*args, **kwargs)
+    assert isinstance(error, AIProviderError), f"{exc_cls} should inherit from AIProviderError"
+    assert checks(error)
+    assert not error.__dict__, "attributes should live in __slots__"
 
-    def test_timeout_error(self):
-        """Test TimeoutError with timeout_seconds."""
-        error = TimeoutError("Request timed out", provider="ollama", timeout_seconds=30)
-        assert error.timeout_seconds == 30
-        assert error.provider == "ollama"
 
-    def test_all_exceptions_inherit_from_base(self):
-        """Test all exceptions inherit from AIProviderError."""
-        exception_classes = [
-            RateLimitError,
-            AuthenticationError,
-            ModelNotFoundError,
-            ContextLengthError,
-            ContentFilterError,
-            ConnectionError,
-            TimeoutError,
-            InsufficientQuotaError,
-            ServiceUnavailableError,
-        ]
-        for exc_class in exception_classes:
-            assert issubclass(exc_class, AIProviderError), f"{exc_class} should inherit from AIProviderError"
+@pytest.mark.parametrize(
+    "exc_cls, args, kwargs, status_code, checks",
+    [
+        pytest.param(
+            LLMingsError, ("Boom",), {}, 500,
+            lambda e: e.message == "Boom",
+            id="base",
+        ),
+        pytest.param(
+            ValidationError, ("Bad input",), {"field": "prompt"}, 400,
+            lambda e: e.field == "prompt" and e.message == "Bad input",
+            id="validation",
+        ),
+        pytest.param(
+            NotFoundError, ("Session",), {"identifier": "abc"}, 404,
+            lambda e: e.resource == "Session" and str(e) == e.message == "Session 'abc' not found",
+            id="not_found",
+        ),
+        pytest.param(
+            NotFoundError, ("Template",), {}, 404,
+            lambda e: e.identifier is None and str(e) == "Template not found",
+            id="not_found_no_identifier",
+        ),
+        pytest.param(
+            ConfigurationError, ("Missing key",), {}, 500,
+            lambda e: str(e) == "Missing key",
+            id="configuration",
+        ),
+        pytest.param(
+            SessionError, ("Session failed",), {"session_id": "s-1"}, 400,
+            lambda e: e.session_id == "s-1" and e.message == "Session failed",
+            id="session",
+        ),
+    ],
+)
+def test_application_exception(exc_cls, args, kwargs, status_code, checks):
+    """Test application exceptions carry their status code and diagnostic fields."""
+    error = exc_cls(*args, **kwargs)
+    assert isinstance(error, LLMingsError)
+    assert error.status_code == status_code
+    assert checks(error)
+    assert not error.__dict__, "attributes should live in __slots__"
@@ -0,0 +1,87 @@
+"""Test Google provider helpers."""
+from types import SimpleNamespace
+
+import pytest
+from google.generativeai import protos
+from google.generativeai.types import BlockedPromptException, StopCandidateException
+
+from app.core.exceptions import ContentFilterError
+from app.services.ai_providers import google_provider
+from app.services.ai_providers.google_provider import GoogleProvider
+
+
+def test_generative_model_reused_per_config():
+    """Test identical settings share one GenerativeModel and new settings get their own."""
+    provider = GoogleProvider(api_key="test", model="gemini-1.5-pro")
+
+    model = provider._get_generative_model(0.7, 2000)
+    assert provider._get_generative_model(0.7, 2000) is model
+    assert provider._get_generative_model(0.2, 2000) is not model
+
+    provider.model = "gemini-1.5-flash"
+    assert provider._get_generative_model(0.7, 2000) is not model
+
+
+def test_generative_model_cache_is_bounded():
+    """Test the oldest configuration is evicted once the cache is full."""
+    provider = GoogleProvider(api_key="test")
+
+    first = provider._get_generative_model(0.0, 1)
+    for max_tokens in range(2, google_provider._MODEL_CACHE_SIZE + 2):
+        provider._get_generative_model(0.0, max_tokens)
+
+    assert len(provider._model_cache) == google_provider._MODEL_CACHE_SIZE
+    assert provider._get_generative_model(0.0, 1) is not first
+
+
+class _FakeModel:
+    """Stand-in GenerativeModel returning a canned stream or raising."""
+
+    def __init__(self, chunks=(), error=None):
+        self.chunks = chunks
+        self.error = error
+
+    async def generate_content_async(self, prompt, stream=True):
+        if self.error:
+            raise self.error
+
+        async def response():
+            for chunk in self.chunks:
+                yield chunk
+
+        return response()
+
+
+def _chunk(text, finish_reason=protos.Candidate.FinishReason.FINISH_REASON_UNSPECIFIED):
+    return SimpleNamespace(text=text, candidates=[SimpleNamespace(finish_reason=finish_reason)])
+
+
+async def _stream(provider, model):
+    provider._get_generative_model = lambda temperature, max_tokens: model
+    return [piece async for piece in provider.stream_completion("Hi")]
+
+
+@pytest.mark.asyncio
+async def test_stream_completion():
+    """Test streamed text is yielded to the caller."""
+    provider = GoogleProvider(api_key="test")
+    pieces = await _stream(provider, _FakeModel([_chunk("Hello "), _chunk("there")]))
+    assert "".join(pieces) == "Hello there"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "model",
+    [
+        pytest.param(_FakeModel(error=BlockedPromptException("block_reason: SAFETY")), id="blocked_prompt"),
+        pytest.param(_FakeModel(error=StopCandidateException("finish_reason: SAFETY")), id="stopped_candidate"),
+        pytest.param(
+            _FakeModel([_chunk("Partial"), _chunk("", protos.Candidate.FinishReason.SAFETY)]),
+            id="safety_finish_reason",
+        ),
+    ],
+)
+async def test_safety_blocks_raise_content_filter(model):
+    """Test SDK safety signals map to ContentFilterError by type."""
+    with pytest.raises(ContentFilterError):
+        await _stream(GoogleProvider(api_key="test"), model)
@@ -0,0 +1,71 @@
+"""Test Grok provider helpers."""
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.exceptions import (
+    AIProviderError,
+    ModelNotFoundError,
+    ContextLengthError,
+    ContentFilterError,
+    TimeoutError,
+    ServiceUnavailableError,
+)
+from app.services.ai_providers import grok_provider
+from app.services.ai_providers.grok_provider import GrokProvider, _classify_api_error
+
+
+@pytest.mark.asyncio
+async def test_client_shared_per_key():
+    """Test providers with the same key share one client and pool."""
+    first = GrokProvider(api_key="key-a")
+    second = GrokProvider(api_key="key-a", model="grok-2")
+    other = GrokProvider(api_key="key-b")
+
+    assert first.client is second.client
+    assert other.client is not first.client
+
+    await grok_provider.close_clients()
+    assert not grok_provider._clients
+    assert GrokProvider(api_key="key-a").client is not first.client
+    await grok_provider.close_clients()
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ("The model grok-9 does not exist", ModelNotFoundError),
+        ("Model not found", ModelNotFoundError),
+        ("This exceeds the maximum context length", ContextLengthError),
+        ("context_length_exceeded", ContextLengthError),
+        ("Rejected by content_policy", ContentFilterError),
+        ("Upstream timeout", TimeoutError),
+        ("Service temporarily unavailable", ServiceUnavailableError),
+        ("Something else went wrong", AIProviderError),
+    ],
+)
+def test_classify_api_error(message, expected):
+    """Test APIError messages map to the matching provider exception."""
+    assert _classify_api_error(message) is expected
+
+
+@pytest.mark.asyncio
+async def test_stream_completion_skips_empty_chunks(monkeypatch):
+    """Test role-only, empty and choice-less chunks are not yielded."""
+    def chunk(*contents):
+        return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=c)) for c in contents])
+
+    async def stream():
+        for item in (chunk(None), chunk("Hello "), chunk(""), chunk("world"), chunk()):
+            yield item
+
+    async def create(**kwargs):
+        return stream()
+
+    provider = GrokProvider(api_key="key-stream")
+    monkeypatch.setattr(provider, "client", SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    ))
+    pieces = [piece async for piece in provider.stream_completion("Hi")]
+    assert "".join(pieces) == "Hello world"
+    await grok_provider.close_clients()
@@ -0,0 +1,23 @@
+"""Test Ollama provider helpers."""
+import pytest
+
+from app.services.ai_providers import ollama_provider
+from app.services.ai_providers.ollama_provider import OllamaProvider
+
+
+@pytest.mark.asyncio
+async def test_client_shared_per_server():
+    """Test providers for the same server share one client that outlives `async with`."""
+    await ollama_provider.close_clients()
+    async with OllamaProvider(model="llama3:8b", base_url="http://ollama-a:11434") as first:
+        pass
+    second = OllamaProvider(model="qwen3:8b", base_url="http://ollama-a:11434")
+    other = OllamaProvider(base_url="http://ollama-b:11434")
+
+    assert first.client is second.client
+    assert not first.client.is_closed
+    assert other.client is not first.client
+
+    await ollama_provider.close_clients()
+    assert not ollama_provider._clients
+    assert first.client.is_closed
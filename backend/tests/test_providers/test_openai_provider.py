@@ -0,0 +1,51 @@
+"""Test OpenAI provider helpers."""
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.ai_providers import openai_provider
+from app.services.ai_providers.openai_provider import OpenAIProvider
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Replace tiktoken loading with a fake that records each model loaded."""
+    loaded = []
+
+    def encoding_for_model(model):
+        loaded.append(model)
+        if model == "offline":
+            raise ConnectionError("no network")
+        return SimpleNamespace(encode=lambda text: text.split())
+
+    monkeypatch.setattr(openai_provider, "_tokenizers", {})
+    monkeypatch.setattr(openai_provider, "TIKTOKEN_AVAILABLE", True)
+    monkeypatch.setattr(openai_provider, "tiktoken", SimpleNamespace(encoding_for_model=encoding_for_model), raising=False)
+    return loaded
+
+
+@pytest.mark.asyncio
+async def test_tokenizer_loaded_once_per_model(loads):
+    """Test instances share each model's tokenizer, loaded lazily on first count."""
+    first = OpenAIProvider(api_key="key-tok", model="gpt-4o")
+    second = OpenAIProvider(api_key="key-tok", model="gpt-4o")
+    assert loads == []
+
+    assert first.count_tokens("one two three") == 3
+    assert second.count_tokens("four five") == 2
+    second.model = "gpt-4o-mini"
+    second.count_tokens("six")
+
+    assert loads == ["gpt-4o", "gpt-4o-mini"]
+    await openai_provider.close_clients()
+
+
+@pytest.mark.asyncio
+async def test_tokenizer_load_failure_falls_back_to_estimate(loads):
+    """Test a tokenizer that can't be loaded falls back to the estimate without retrying."""
+    provider = OpenAIProvider(api_key="key-tok", model="offline")
+
+    assert provider.count_tokens("12345678") == 2
+    assert provider.count_tokens("12345678") == 2
+    assert loads == ["offline"]
+    await openai_provider.close_clients()
@@ -0,0 +1,69 @@
+"""Test provider factory."""
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.ai_providers.ollama_provider import OllamaProvider
+from app.services.ai_providers.provider_factory import ProviderFactory
+
+
+def test_providers_created_on_first_use():
+    """Test providers are instantiated lazily and reused afterwards."""
+    factory = ProviderFactory(model_configs={"ollama": "qwen3:8b"})
+    assert "ollama" in factory.get_provider_names()
+    assert factory.is_provider_configured("ollama")
+    assert not factory._providers
+
+    provider = factory.get_provider("ollama")
+    assert isinstance(provider, OllamaProvider)
+    assert provider.model == "qwen3:8b"
+    assert factory.get_provider("ollama") is provider
+
+
+def test_model_variants_leave_base_provider_untouched():
+    """Test each requested model gets its own cached instance sharing the client."""
+    factory = ProviderFactory(model_configs={"ollama": "qwen3:8b"})
+    base = factory.get_provider("ollama")
+
+    variant = factory.get_provider("ollama", "llama3:8b")
+
+    assert variant is not base
+    assert variant.model == "llama3:8b"
+    assert base.model == "qwen3:8b"
+    assert variant.client is base.client
+    assert factory.get_provider("ollama", "llama3:8b") is variant
+    assert factory.get_provider("ollama", "qwen3:8b") is base
+
+
+def test_unknown_provider():
+    """Test requesting an unconfigured provider raises ValueError."""
+    factory = ProviderFactory()
+    with pytest.raises(ValueError, match="not found or not configured"):
+        factory.get_provider("nonexistent")
+
+
+@pytest.mark.parametrize(
+    "provider, model, expected",
+    [
+        ("ollama", "llava:13b", True),
+        ("ollama", "qwen3:8b", False),
+    ],
+)
+def test_supports_vision(provider, model, expected):
+    """Test vision capability follows the provider's configured model."""
+    factory = ProviderFactory(model_configs={provider: model})
+    assert factory.supports_vision(provider) is expected
+
+
+def test_supports_vision_from_config():
+    """Test providers with declared vision models are answered from the config table."""
+    factory = ProviderFactory()
+    provider = factory._providers["openai"] = SimpleNamespace(model="gpt-4o")
+    assert factory.supports_vision("openai")
+
+    provider.model = "gpt-3.5-turbo"
+    assert not factory.supports_vision("openai")
+
+    # An explicit model is checked against the table without the instance
+    assert factory.supports_vision("openai", "gpt-4o")
+    assert not factory.supports_vision("openai", "gpt-3.5-turbo")
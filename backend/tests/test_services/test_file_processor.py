@@ -0,0 +1,205 @@
+"""Test file text extraction."""
+import base64
+import io
+
+import pytest
+from docx import Document
+from openpyxl import Workbook
+from pptx import Presentation
+from pypdf import PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+from PIL import Image
+
+from app.services import file_processor
+from app.services.file_processor import FileProcessor
+
+
+def _save(document) -> bytes:
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def _text_pdf(page_texts: list[str]) -> bytes:
+    """Build a PDF with one line of Helvetica text per page."""
+    writer = PdfWriter()
+    font = writer._add_object(DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    }))
+    for text in page_texts:
+        page = writer.add_blank_page(width=612, height=792)
+        content = DecodedStreamObject()
+        content.set_data(f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode() if text else b"")
+        page[NameObject("/Contents")] = writer._add_object(content)
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font}),
+        })
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+class TestDocuments:
+    """Test text extraction from office documents."""
+
+    def test_docx(self):
+        """Test paragraphs and tables are extracted in document order."""
+        doc = Document()
+        doc.add_paragraph("Hello world")
+        doc.add_paragraph("   ")
+        doc.add_paragraph("Second para")
+        table = doc.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = "a"
+        table.cell(0, 1).text = "b"
+        table.cell(1, 0).text = "c"
+
+        doc.add_paragraph("After table")
+
+        text, image = FileProcessor.process_file(_save(doc), "notes.docx")
+        assert text == "Hello world\n\nSecond para\n\na | b\nc | \n\nAfter table"
+        assert image is None
+
+    def test_empty_docx(self):
+        """Test an empty document reports no text."""
+        text, _ = FileProcessor.process_file(_save(Document()), "empty.docx")
+        assert text == "[Document contains no text]"
+
+    def test_xlsx(self):
+        """Test each sheet is rendered with empty rows skipped."""
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.title = "One"
+        sheet.append([1, None, "x"])
+        sheet.append([None, None, None])
+        sheet.append(["y", 2.5, None])
+        workbook.create_sheet("Empty")
+
+        text, _ = FileProcessor.process_file(_save(workbook), "data.xlsx")
+        assert text == (
+            "=== Sheet: One ===\n\n\n1 |  | x\ny | 2.5 | "
+            "\n\n=== Sheet: Empty ===\n\n\n[Empty sheet]"
+        )
+
+    def test_pptx(self):
+        """Test slides without text-frame shapes are skipped."""
+        presentation = Presentation()
+        slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+        slide.shapes.title.text = "Title"
+        slide.placeholders[1].text = "Body"
+        slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+        # Tables have no text frame and are skipped
+        slide.shapes.add_table(1, 1, 0, 0, 914400, 914400).table.cell(0, 0).text = "cell"
+        slide = presentation.slides.add_slide(presentation.slide_layouts[5])
+        slide.shapes.title.text = "Third"
+
+        text, _ = FileProcessor.process_file(_save(presentation), "deck.pptx")
+        assert text == "--- Slide 1 ---\nTitle\nBody\n\n--- Slide 3 ---\nThird"
+
+    def test_pdf(self):
+        """Test pages with text are extracted with page headers."""
+        text, _ = FileProcessor.process_file(_text_pdf(["First", "", "Third"]), "doc.pdf")
+        assert text == "--- Page 1 ---\nFirst\n\n--- Page 3 ---\nThird"
+
+    def test_pdf_parallel_extraction(self, monkeypatch):
+        """Test large PDFs extracted across worker processes keep page order."""
+        pages = [f"Page {n}" if n % 3 else "" for n in range(1, 10)]
+        content = _text_pdf(pages)
+        serial, _ = FileProcessor.process_file(content, "doc.pdf")
+
+        monkeypatch.setattr(file_processor, "_PDF_WORKERS", 2)
+        monkeypatch.setattr(file_processor, "_PDF_PARALLEL_MIN_PAGES", 4)
+        assert file_processor._extract_pdf_pages_parallel(content, len(pages)) == [
+            "Page 1", "Page 2", "", "Page 4", "Page 5", "", "Page 7", "Page 8", "",
+        ]
+        assert FileProcessor.process_file(content, "doc.pdf")[0] == serial
+        file_processor.shutdown_pdf_pool(wait=True)
+
+    def test_pdf_without_text(self):
+        """Test a PDF of blank pages reports no extractable text."""
+        writer = PdfWriter()
+        writer.add_blank_page(width=612, height=792)
+        buffer = io.BytesIO()
+        writer.write(buffer)
+
+        text, _ = FileProcessor.process_file(buffer.getvalue(), "blank.pdf")
+        assert text == "[PDF contains no extractable text]"
+
+    def test_invalid_pdf(self):
+        """Test parse failures are reported in the extracted text."""
+        text, _ = FileProcessor.process_file(b"not a pdf", "broken.pdf")
+        assert text.startswith("[Error processing PDF:")
+
+
+class TestImages:
+    """Test image description and encoding."""
+
+    def test_png(self):
+        """Test images are described and returned as base64."""
+        buffer = io.BytesIO()
+        Image.new("RGBA", (8, 6)).save(buffer, format="PNG")
+
+        text, image = FileProcessor.process_file(buffer.getvalue(), "pic.png")
+        assert text == "[Image: 8x6px, RGBA mode, .png format]"
+        assert Image.open(io.BytesIO(base64.b64decode(image))).size == (8, 6)
+
+    def test_matching_format_passed_through(self):
+        """Test uploads already in the target format are not re-encoded."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (8, 6)).save(buffer, format="JPEG", quality=95, comment=b"kept")
+        content = buffer.getvalue()
+
+        _, image = FileProcessor.process_file(content, "photo.jpg")
+        assert base64.b64decode(image) == content
+
+    def test_other_formats_converted(self):
+        """Test images needing conversion are re-encoded to the target format."""
+        buffer = io.BytesIO()
+        Image.new("L", (8, 6)).save(buffer, format="PNG")
+
+        _, image = FileProcessor.process_file(buffer.getvalue(), "gray.png")
+        converted = Image.open(io.BytesIO(base64.b64decode(image)))
+        assert (converted.format, converted.mode) == ("PNG", "RGB")
+
+    def test_invalid_image(self):
+        """Test undecodable images return an error and no data."""
+        text, image = FileProcessor.process_file(b"not an image", "pic.png")
+        assert text.startswith("[Error processing image:")
+        assert image is None
+
+
+@pytest.mark.parametrize(
+    "filename, expected",
+    [
+        ("data.csv", "a,b\n1,2\n"),
+        ("notes.MD", "a,b\n1,2\n"),
+        ("binary.exe", "[Unsupported file type: .exe]"),
+    ],
+)
+def test_text_and_unsupported_files(filename, expected):
+    """Test text files are decoded as-is and unknown types are reported."""
+    assert FileProcessor.process_file(b"a,b\n1,2\n", filename) == (expected, None)
+
+
+@pytest.mark.asyncio
+async def test_process_file_async():
+    """Test the async wrapper returns the same result as process_file."""
+    content = b"print('hello')\n"
+    assert await FileProcessor.process_file_async(content, "script.py") == (content.decode(), None)
+
+
+@pytest.mark.parametrize(
+    "filename, supported, image",
+    [
+        ("report.PDF", True, False),
+        ("photo.JPeG", True, True),
+        ("archive.tar.gz", False, False),
+        ("Makefile", False, False),
+        (".bashrc", False, False),
+    ],
+)
+def test_extension_checks(filename, supported, image):
+    """Test extension checks are case-insensitive and use the last suffix."""
+    assert FileProcessor.is_supported(filename) is supported
+    assert FileProcessor.is_image(filename) is image
@@ -0,0 +1,495 @@
+"""Test MLX model downloads."""
+import asyncio
+import hashlib
+import json
+import os
+import time
+
+import httpx
+import pytest
+import pytest_asyncio
+import respx
+
+from app.services import mlx_model_manager
+from app.services.mlx_model_manager import MLXModelManager
+
+REPO = "mlx-community/Phi-3-mini-4k-instruct-4bit"
+FILES = {
+    "config.json": b'{"model_type": "phi3"}',
+    "model.safetensors": bytes(range(256)) * 40,
+}
+WEIGHTS_SHA256 = hashlib.sha256(FILES["model.safetensors"]).hexdigest()
+
+MODEL_INFO = {
+    "sha": "abc123",
+    "siblings": [
+        {"rfilename": "config.json", "size": len(FILES["config.json"])},
+        {
+            "rfilename": "model.safetensors",
+            "size": len(FILES["model.safetensors"]),
+            "lfs": {"sha256": WEIGHTS_SHA256},
+        },
+        {"rfilename": "README.md"},
+    ],
+}
+
+
+def _serve_file(request: httpx.Request) -> httpx.Response:
+    """Serve FILES with HEAD and single-range GET support."""
+    body = FILES[request.url.path.rsplit("/", 1)[-1]]
+    headers = {"accept-ranges": "bytes", "content-length": str(len(body)), "etag": f'"{len(body)}"'}
+    if request.method == "HEAD":
+        return httpx.Response(200, headers=headers)
+
+    byte_range = request.headers.get("range")
+    if byte_range is None:
+        return httpx.Response(200, content=body)
+    start, end = (int(bound) for bound in byte_range.removeprefix("bytes=").split("-"))
+    return httpx.Response(206, content=body[start:end + 1])
+
+
+async def _noop_create_ollama_model(self, model_name, model_path):
+    pass
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def close_shared_client():
+    """Close the shared client so each test's event loop gets a fresh one."""
+    yield
+    await mlx_model_manager.close_client()
+
+
+@pytest.fixture
+def hf_hub(monkeypatch):
+    """Mock the HuggingFace model API and file endpoints for the built-in downloader."""
+    monkeypatch.setattr(mlx_model_manager.shutil, "which", lambda name: None)
+    with respx.mock(base_url=mlx_model_manager.HF_ENDPOINT) as router:
+        router.get(f"/api/models/{REPO}").respond(json=MODEL_INFO)
+        resolve = router.route(path__startswith=f"/{REPO}/resolve/abc123/").mock(side_effect=_serve_file)
+        yield resolve
+
+
+@pytest.mark.asyncio
+async def test_download_fetches_files_in_ranges(tmp_path, monkeypatch, hf_hub):
+    """Test allowed files are downloaded, large ones as parallel byte ranges."""
+    monkeypatch.setattr(mlx_model_manager, "HF_MIN_RANGE_BYTES", 1024)
+    registered = []
+
+    async def fake_create_ollama_model(self, model_name, model_path):
+        registered.append(model_name)
+
+    monkeypatch.setattr(MLXModelManager, "_create_ollama_model", fake_create_ollama_model)
+
+    async with MLXModelManager(models_dir=str(tmp_path)) as manager:
+        updates = [update async for update in manager.download_mlx_model("phi-3-mini")]
+
+    model_dir = tmp_path / "phi-3-mini"
+    assert {path.name for path in model_dir.iterdir()} == {*FILES, mlx_model_manager.SIZE_CACHE_FILE}
+    for name, body in FILES.items():
+        assert (model_dir / name).read_bytes() == body
+
+    ranges = [call.request.headers.get("range") for call in hf_hub.calls if call.request.method == "GET"]
+    assert ranges.count("bytes=0-21") == 1
+    assert sum(r is not None for r in ranges) == 9
+    assert registered == ["phi-3-mini"]
+
+    progress = [u for u in updates if "completed" in u]
+    assert progress[-1]["completed"] == progress[-1]["total"] == 2
+    assert progress[-1]["bytes"] == progress[-1]["total_bytes"] == sum(map(len, FILES.values()))
+    assert [u["status"] for u in updates][-3:] == ["complete", "converting", "ready"]
+
+
+@pytest.mark.asyncio
+async def test_download_failure_reports_error(tmp_path):
+    """Test an unavailable file ends the stream with an error."""
+    with respx.mock(base_url=mlx_model_manager.HF_ENDPOINT) as router:
+        router.get(f"/api/models/{REPO}").respond(json={
+            "sha": "abc123",
+            "siblings": [{"rfilename": "model.safetensors"}],
+        })
+        router.head(f"/{REPO}/resolve/abc123/model.safetensors").respond(404)
+
+        async with MLXModelManager(models_dir=str(tmp_path)) as manager:
+            updates = [update async for update in manager.download_mlx_model("phi-3-mini")]
+
+    assert "404" in updates[-1]["error"]
+
+
+@pytest.mark.asyncio
+async def test_interrupted_download_resumes(tmp_path, monkeypatch, hf_hub):
+    """Test a retry requests only the bytes missing from the .part file."""
+    monkeypatch.setattr(MLXModelManager, "_create_ollama_model", _noop_create_ollama_model)
+    body = FILES["model.safetensors"]
+    model_dir = tmp_path / "phi-3-mini"
+    model_dir.mkdir()
+    (model_dir / "config.json").write_bytes(FILES["config.json"])
+    (model_dir / "model.safetensors.part").write_bytes(body[:4000] + bytes(len(body) - 4000))
+    (model_dir / mlx_model_manager.DOWNLOAD_STATE_FILE).write_text(json.dumps({"files": {
+        "model.safetensors": {
+            "etag": f'"{len(body)}"',
+            "size": len(body),
+            "ranges": [[0, len(body) - 1, 4000]],
+        },
+    }}))
+
+    async with MLXModelManager(models_dir=str(tmp_path)) as manager:
+        updates = [update async for update in manager.download_mlx_model("phi-3-mini")]
+
+    assert updates[-1]["status"] == "ready"
+    assert (model_dir / "model.safetensors").read_bytes() == body
+    assert not (model_dir / mlx_model_manager.DOWNLOAD_STATE_FILE).exists()
+
+    gets = [call.request for call in hf_hub.calls if call.request.method == "GET"]
+    assert [request.headers["range"] for request in gets] == [f"bytes=4000-{len(body) - 1}"]
+
+    # Resumed and already-finished files count toward progress
+    assert updates[-4]["bytes"] == updates[-4]["total_bytes"]
+
+
+@pytest.mark.asyncio
+async def test_changed_file_restarts_download(tmp_path, monkeypatch, hf_hub):
+    """Test saved progress is discarded when the server's ETag differs."""
+    monkeypatch.setattr(MLXModelManager, "_create_ollama_model", _noop_create_ollama_model)
+    body = FILES["model.safetensors"]
+    model_dir = tmp_path / "phi-3-mini"
+    model_dir.mkdir()
+    (model_dir / "model.safetensors.part").write_bytes(bytes(len(body)))
+    (model_dir / mlx_model_manager.DOWNLOAD_STATE_FILE).write_text(json.dumps({"files": {
+        "model.safetensors": {"etag": '"stale"', "size": len(body), "ranges": [[0, len(body) - 1, 4000]]},
+    }}))
+
+    async with MLXModelManager(models_dir=str(tmp_path)) as manager:
+        [update async for update in manager.download_mlx_model("phi-3-mini")]
+
+    assert (model_dir / "model.safetensors").read_bytes() == body
+
+
+@pytest.mark.asyncio
+async def test_list_downloaded_models_sizes(tmp_path):
+    """Test model sizes include nested files, but not download bookkeeping or top-level files."""
+    model_dir = tmp_path / "tiny"
+    (model_dir / "nested").mkdir(parents=True)
+    (model_dir / "model.safetensors").write_bytes(bytes(3 * 1024**2))
+    (model_dir / "nested" / "extra.bin").write_bytes(bytes(2 * 1024**2))
+    (model_dir / mlx_model_manager.DOWNLOAD_STATE_FILE).write_bytes(bytes(1024**2))
+    (model_dir / "nested" / "extra.bin.aria2").write_bytes(bytes(1024**2))
+    (tmp_path / "stray.txt").write_text("not a model")
+
+    async with MLXModelManager(models_dir=str(tmp_path)) as manager:
+        models = await manager.list_downloaded_models()
+
+    assert models == [{"name": "tiny", "path": str(model_dir), "size_gb": round(5 / 1024, 2)}]
+
+
+def test_model_size_cached(tmp_path):
+    """Test the size sidecar is reused until the directory changes."""
+    (tmp_path / "model.safetensors").write_bytes(bytes(100))
+    assert mlx_model_manager._model_size(str(tmp_path)) == 100
+    assert (tmp_path / mlx_model_manager.SIZE_CACHE_FILE).read_text() == "100"
+
+    (tmp_path / mlx_model_manager.SIZE_CACHE_FILE).write_text("42")
+    assert mlx_model_manager._model_size(str(tmp_path)) == 42
+
+    os.utime(tmp_path, (time.time() + 10, time.time() + 10))
+    assert mlx_model_manager._model_size(str(tmp_path)) == 100
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("model_name, installed", [("tiny", False), ("qwen3:8b", True)])
+async def test_create_ollama_model(tmp_path, monkeypatch, mock_ollama, model_name, installed):
+    """Test the Modelfile is written and `ollama create` only runs for new models."""
+    calls = []
+
+    class FakeProcess:
+        returncode = 0
+
+        async def communicate(self):
+            return b"", b""
+
+    async def fake_exec(*cmd, **kwargs):
+        calls.append(cmd)
+        return FakeProcess()
+
+    monkeypatch.setattr(mlx_model_manager.asyncio, "create_subprocess_exec", fake_exec)
+
+    async with MLXModelManager(models_dir=str(tmp_path)) as manager:
+        await manager._create_ollama_model(model_name, tmp_path)
+        await manager._create_ollama_model(model_name, tmp_path)
+
+    modelfile = tmp_path / "Modelfile"
+    assert modelfile.read_text().startswith(f"FROM {tmp_path}\nTEMPLATE \"\"\"{{{{ if .System }}}}")
+    assert calls == ([] if installed else [("ollama", "create", model_name, "-f", str(modelfile))])
+    assert [call.request.url.path for call in mock_ollama.calls] == ["/api/tags"]
+
+
+@pytest.mark.asyncio
+async def test_delete_model_removes_tree(tmp_path):
+    """Test a nested model directory is removed without following symlinks."""
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "keep.txt").write_text("keep")
+
+    model_dir = tmp_path / "models" / "tiny"
+    (model_dir / "a" / "b").mkdir(parents=True)
+    (model_dir / "model.safetensors").write_bytes(b"weights")
+    (model_dir / "a" / "b" / "config.json").write_text("{}")
+    (model_dir / "a" / "linked").symlink_to(outside, target_is_directory=True)
+
+    async with MLXModelManager(models_dir=str(tmp_path / "models")) as manager:
+        assert await manager.delete_model("tiny")
+        assert not await manager.delete_model("tiny")
+
+    assert not model_dir.exists()
+    assert (outside / "keep.txt").exists()
+
+
+@pytest.mark.asyncio
+async def test_delete_symlinked_model_removes_only_link(tmp_path):
+    """Test deleting a model whose directory is a symlink leaves the target intact."""
+    target = tmp_path / "external" / "tiny"
+    target.mkdir(parents=True)
+    (target / "model.safetensors").write_bytes(b"weights")
+    models_dir = tmp_path / "models"
+    models_dir.mkdir()
+    (models_dir / "tiny").symlink_to(target, target_is_directory=True)
+
+    async with MLXModelManager(models_dir=str(models_dir)) as manager:
+        assert await manager.delete_model("tiny")
+
+    assert not (models_dir / "tiny").exists()
+    assert (target / "model.safetensors").read_bytes() == b"weights"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("corrupt_responses, succeeds", [(1, True), (2, False)])
+async def test_checksum_mismatch_retries_once(tmp_path, monkeypatch, hf_hub, corrupt_responses, succeeds):
+    """Test a corrupted download is fetched again once before failing."""
+    monkeypatch.setattr(MLXModelManager, "_create_ollama_model", _noop_create_ollama_model)
+    remaining = [corrupt_responses]
+
+    def corrupting_server(request):
+        response = _serve_file(request)
+        if request.method == "GET" and request.url.path.endswith(".safetensors") and remaining[0]:
+            remaining[0] -= 1
+            return httpx.Response(response.status_code, content=bytes(len(response.content)))
+        return response
+
+    hf_hub.side_effect = corrupting_server
+
+    async with MLXModelManager(models_dir=str(tmp_path)) as manager:
+        updates = [update async for update in manager.download_mlx_model("phi-3-mini")]
+
+    # The retry resolves the file's URL again rather than reusing the first HEAD
+    heads = [c for c in hf_hub.calls if c.request.method == "HEAD" and c.request.url.path.endswith(".safetensors")]
+    assert len(heads) == 2
+
+    weights = tmp_path / "phi-3-mini" / "model.safetensors"
+    if succeeds:
+        assert updates[-1]["status"] == "ready"
+        assert weights.read_bytes() == FILES["model.safetensors"]
+    else:
+        assert "Checksum mismatch" in updates[-1]["error"]
+        assert not weights.exists()
+
+
+@pytest.mark.asyncio
+async def test_unknown_size_fetched_in_one_request(tmp_path, monkeypatch, hf_hub):
+    """Test a HEAD without Content-Length falls back to one plain GET instead of empty ranges."""
+    monkeypatch.setattr(MLXModelManager, "_create_ollama_model", _noop_create_ollama_model)
+
+    def sizeless_hub(request):
+        response = _serve_file(request)
+        if request.method == "HEAD":
+            del response.headers["content-length"]
+        return response
+
+    hf_hub.side_effect = sizeless_hub
+    async with MLXModelManager(models_dir=str(tmp_path)) as manager:
+        updates = [update async for update in manager.download_mlx_model("phi-3-mini")]
+
+    assert updates[-1]["status"] == "ready"
+    for filename, body in FILES.items():
+        assert (tmp_path / "phi-3-mini" / filename).read_bytes() == body
+    assert not any("range" in call.request.headers for call in hf_hub.calls)
+
+
+@pytest.mark.asyncio
+async def test_token_not_sent_to_redirected_cdn(tmp_path, monkeypatch, hf_hub):
+    """Test ranged GETs to a cross-host CDN location don't carry the HF token."""
+    monkeypatch.setattr(MLXModelManager, "_create_ollama_model", _noop_create_ollama_model)
+    monkeypatch.setenv("HF_TOKEN", "hf_secret")
+
+    def redirecting_hub(request):
+        if request.url.path.endswith(".safetensors"):
+            return httpx.Response(302, headers={"location": "https://cdn-lfs.example/model.safetensors"})
+        return _serve_file(request)
+
+    hf_hub.side_effect = redirecting_hub
+    with respx.mock(assert_all_called=False) as cdn_router:
+        cdn = cdn_router.route(host="cdn-lfs.example").mock(side_effect=_serve_file)
+        async with MLXModelManager(models_dir=str(tmp_path)) as manager:
+            updates = [update async for update in manager.download_mlx_model("phi-3-mini")]
+
+    assert updates[-1]["status"] == "ready"
+    assert any(call.request.method == "GET" for call in cdn.calls)
+    assert not any("authorization" in call.request.headers for call in cdn.calls)
+    assert all(call.request.headers["authorization"] == "Bearer hf_secret" for call in hf_hub.calls)
+
+
+@pytest.mark.asyncio
+async def test_head_issued_when_slot_is_acquired(tmp_path, monkeypatch, hf_hub):
+    """Test a file's HEAD waits for its slot, so its CDN URL is fresh when the GETs start."""
+    monkeypatch.setattr(MLXModelManager, "_create_ollama_model", _noop_create_ollama_model)
+
+    async with MLXModelManager(models_dir=str(tmp_path)) as manager:
+        manager._file_slots = asyncio.Semaphore(1)
+        [update async for update in manager.download_mlx_model("phi-3-mini")]
+
+    # With one slot each file's HEAD directly precedes its own GETs
+    files = [call.request.url.path.rsplit("/", 1)[-1] for call in hf_hub.calls]
+    methods = [call.request.method for call in hf_hub.calls]
+    assert methods.count("HEAD") == len(FILES)
+    second_head = methods.index("HEAD", 1)
+    assert set(files[:second_head]) == {files[0]}
+    assert set(files[second_head:]) == {files[second_head]} != {files[0]}
+
+
+@pytest.mark.asyncio
+async def test_managers_share_client(tmp_path):
+    """Test managers reuse one client that outlives each context."""
+    async with MLXModelManager(models_dir=str(tmp_path)) as first:
+        pass
+    async with MLXModelManager(models_dir=str(tmp_path)) as second:
+        assert second.client is first.client
+    assert not first.client.is_closed
+
+    await mlx_model_manager.close_client()
+    assert first.client.is_closed
+    assert MLXModelManager(models_dir=str(tmp_path)).client is not first.client
+
+
+@pytest.fixture
+def fake_aria2(monkeypatch):
+    """Stand in for aria2c, capturing its command line and input file."""
+    monkeypatch.setattr(mlx_model_manager.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(MLXModelManager, "_create_ollama_model", _noop_create_ollama_model)
+
+    class FakeStdin:
+        def __init__(self):
+            self.data = b""
+
+        def write(self, data):
+            self.data += data
+
+        async def drain(self):
+            pass
+
+        def close(self):
+            pass
+
+    class FakeAria2:
+        returncode = None
+        calls = []
+        stdin = FakeStdin()
+
+        def __init__(self):
+            async def output():
+                yield b"\n"
+                yield b"[#2089b0 5.0KiB/10KiB(50%) CN:16 DL:1.0KiB]\n"
+                yield b"[#3a1c00 11B/22B(50%) CN:1 DL:11B]\n"
+            self.stdout = output()
+
+        async def wait(self):
+            self.returncode = 0
+            return 0
+
+    async def fake_exec(*cmd, **kwargs):
+        FakeAria2.calls.append(cmd)
+        return FakeAria2()
+
+    monkeypatch.setattr(mlx_model_manager.asyncio, "create_subprocess_exec", fake_exec)
+    return FakeAria2
+
+
+@pytest.mark.asyncio
+async def test_aria2_download(tmp_path, fake_aria2):
+    """Test aria2c gets every file with its checksum, and its readout becomes progress."""
+    with respx.mock(base_url=mlx_model_manager.HF_ENDPOINT) as router:
+        router.get(f"/api/models/{REPO}").respond(json=MODEL_INFO)
+        router.head(path__startswith=f"/{REPO}/resolve/abc123/").mock(side_effect=_serve_file)
+        async with MLXModelManager(models_dir=str(tmp_path)) as manager:
+            updates = [update async for update in manager.download_mlx_model("phi-3-mini")]
+
+    assert fake_aria2.calls[0][0] == "aria2c"
+    assert f"--dir={tmp_path / 'phi-3-mini'}" in fake_aria2.calls[0]
+    resolve = f"{mlx_model_manager.HF_ENDPOINT}/{REPO}/resolve/abc123"
+    assert fake_aria2.stdin.data.decode() == (
+        f"{resolve}/config.json\n"
+        "  out=config.json\n"
+        f"{resolve}/model.safetensors\n"
+        "  out=model.safetensors\n"
+        f"  checksum=sha-256={WEIGHTS_SHA256}\n"
+    )
+    # Readout lines are folded into one byte count, reported on an interval
+    total_bytes = sum(map(len, FILES.values()))
+    assert [(u["bytes"], u["total_bytes"]) for u in updates if "bytes" in u] == [(total_bytes, total_bytes)]
+    assert updates[-1]["status"] == "ready"
+
+
+@pytest.mark.asyncio
+async def test_aria2_token_not_sent_to_redirected_cdn(tmp_path, monkeypatch, fake_aria2):
+    """Test aria2c gets cross-host files at their CDN location, without the HF token."""
+    monkeypatch.setenv("HF_TOKEN", "hf_secret")
+
+    def redirecting_hub(request):
+        if request.url.path.endswith(".safetensors"):
+            return httpx.Response(302, headers={"location": "https://cdn-lfs.example/model.safetensors"})
+        return _serve_file(request)
+
+    with respx.mock(base_url=mlx_model_manager.HF_ENDPOINT) as router:
+        router.get(f"/api/models/{REPO}").respond(json=MODEL_INFO)
+        router.head(path__startswith=f"/{REPO}/resolve/abc123/").mock(side_effect=redirecting_hub)
+        with respx.mock() as cdn_router:
+            cdn_router.head(host="cdn-lfs.example").mock(side_effect=_serve_file)
+            async with MLXModelManager(models_dir=str(tmp_path)) as manager:
+                updates = [update async for update in manager.download_mlx_model("phi-3-mini")]
+
+    resolve = f"{mlx_model_manager.HF_ENDPOINT}/{REPO}/resolve/abc123"
+    assert fake_aria2.stdin.data.decode() == (
+        f"{resolve}/config.json\n"
+        "  out=config.json\n"
+        "  header=Authorization: Bearer hf_secret\n"
+        "https://cdn-lfs.example/model.safetensors\n"
+        "  out=model.safetensors\n"
+        f"  checksum=sha-256={WEIGHTS_SHA256}\n"
+    )
+    assert updates[-1]["status"] == "ready"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("custom_repo", ["evil/..", "trailing/", "..", "/"])
+async def test_download_rejects_escaping_names(tmp_path, custom_repo):
+    """Test custom repos can't place a model outside the models directory."""
+    models_dir = tmp_path / "models"
+    async with MLXModelManager(models_dir=str(models_dir)) as manager:
+        updates = [update async for update in manager.download_mlx_model("custom", custom_repo)]
+
+    assert updates == [{"error": f"Invalid model name: {custom_repo.rpartition('/')[2]}"}]
+    assert list(tmp_path.iterdir()) == [models_dir]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("model_name", ["..", "../models", "", "/tmp", "a/b"])
+async def test_delete_rejects_escaping_names(tmp_path, model_name):
+    """Test delete_model never removes anything outside the models directory."""
+    (tmp_path / "models" / "a" / "b").mkdir(parents=True)
+    async with MLXModelManager(models_dir=str(tmp_path / "models")) as manager:
+        assert not await manager.delete_model(model_name)
+    assert (tmp_path / "models" / "a" / "b").exists()
+
+
+def test_aria2_readout_parsing():
+    """Test readout sizes are converted to bytes per aria2 download id."""
+    match = mlx_model_manager._ARIA2_PROGRESS.search("[#2089b0 400.5MiB/1.2GiB(33%) CN:16 DL:115MiB ETA:7s]")
+    assert match.groups() == ("2089b0", "400.5", "MiB")
+    assert int(float(match[2]) * mlx_model_manager._ARIA2_UNITS[match[3]]) == int(400.5 * 1024**2)
@@ -0,0 +1,99 @@
+"""Test personality archetype helpers."""
+from app.core.personality_archetypes import (
+    ARCHETYPE_MODEL_RECOMMENDATIONS,
+    PERSONALITY_ARCHETYPES,
+    get_archetype_list,
+    get_archetype_system_prompt,
+    get_dynamic_model_recommendations,
+    _cached_recommendations,
+    _resolve_suitability,
+)
+
+SUITABILITY = {
+    "qwen3": {"general": 9, "coding": 9, "reasoning": 9, "creative": 8},
+    "phi3": {"general": 7, "coding": 8, "reasoning": 7, "creative": 6},
+    "gemma3": {"general": 9, "coding": 8, "reasoning": 9, "creative": 8},
+}
+
+
+class TestArchetypeList:
+    """Test the archetype list served to the UI."""
+
+    def test_static_list(self):
+        """Test static list covers every archetype with fallback recommendations."""
+        archetypes = get_archetype_list()
+        assert [a["id"] for a in archetypes] == list(PERSONALITY_ARCHETYPES)
+        for archetype in archetypes:
+            assert archetype["recommended_models"] == ARCHETYPE_MODEL_RECOMMENDATIONS[archetype["id"]]
+            assert isinstance(archetype["recommended_models"], tuple)
+
+    def test_static_list_is_not_shared(self):
+        """Test callers mutating the result do not affect later calls."""
+        get_archetype_list()[0]["name"] = "Changed"
+        assert get_archetype_list()[0]["name"] == PERSONALITY_ARCHETYPES["balanced"]["name"]
+
+    def test_dynamic_list(self):
+        """Test installed models with suitability data drive recommendations."""
+        archetypes = get_archetype_list(["qwen3:8b"], SUITABILITY)
+        assert all(a["recommended_models"][0] == "qwen3:8b" for a in archetypes)
+
+
+class TestDynamicRecommendations:
+    """Test suitability-based model recommendations."""
+
+    def test_ranked_by_weighted_score(self):
+        """Test installed models are ranked by weighted archetype score."""
+        recs = get_dynamic_model_recommendations("critic", ["phi3", "qwen3:8b"], SUITABILITY)
+        assert recs[:2] == ["qwen3:8b", "phi3"]
+
+    def test_static_fallback_fills_without_duplicates(self):
+        """Test static recommendations top up the list without repeating models."""
+        recs = get_dynamic_model_recommendations("balanced", ["qwen3"], SUITABILITY)
+        assert len(recs) == 4
+        assert len(set(recs)) == 4
+        assert recs[0] == "qwen3"
+
+    def test_max_recommendations(self):
+        """Test the result is capped at max_recommendations."""
+        recs = get_dynamic_model_recommendations(
+            "creative", ["qwen3", "phi3", "gemma3"], SUITABILITY, max_recommendations=2
+        )
+        assert len(recs) == 2
+
+    def test_models_without_suitability_ignored(self):
+        """Test installed models lacking suitability data are not ranked."""
+        recs = get_dynamic_model_recommendations("technical", ["unknown-model"], SUITABILITY)
+        assert "unknown-model" not in recs
+        assert recs == list(ARCHETYPE_MODEL_RECOMMENDATIONS["technical"])
+
+    def test_results_are_cached_and_not_shared(self):
+        """Test repeated calls hit the cache and return independent lists."""
+        first = get_dynamic_model_recommendations("analyst", ["qwen3"], SUITABILITY)
+        first.append("mutated")
+        second = get_dynamic_model_recommendations("analyst", ["qwen3"], dict(SUITABILITY))
+        assert "mutated" not in second
+        assert _cached_recommendations.cache_info().hits >= 1
+
+    def test_suitability_resolved_once_per_model_set(self):
+        """Test every archetype shares one resolution of the installed models."""
+        misses = _resolve_suitability.cache_info().misses
+        get_archetype_list(["gemma3:27b", "phi3:mini"], SUITABILITY)
+        assert _resolve_suitability.cache_info().misses == misses + 1
+
+
+class TestArchetypeSystemPrompt:
+    """Test archetype system prompt construction."""
+
+    def test_known_archetype(self):
+        """Test a known archetype returns its own system prompt."""
+        assert get_archetype_system_prompt("critic") == PERSONALITY_ARCHETYPES["critic"]["system_prompt"]
+
+    def test_unknown_archetype_falls_back_to_balanced(self):
+        """Test unknown archetypes use the balanced system prompt."""
+        assert get_archetype_system_prompt("nope") == PERSONALITY_ARCHETYPES["balanced"]["system_prompt"]
+
+    def test_custom_personality_appended(self):
+        """Test custom personality text is stripped and appended."""
+        prompt = get_archetype_system_prompt("critic", "  Be terse.  ")
+        assert prompt.endswith("Additional personality guidance: Be terse.")
+        assert get_archetype_system_prompt("critic", "   ") == get_archetype_system_prompt("critic")
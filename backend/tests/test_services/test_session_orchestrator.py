@@ -0,0 +1,292 @@
+"""Test session orchestrator streaming, fan-in and response caching."""
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.exceptions import AuthenticationError, RateLimitError, ServiceUnavailableError, TimeoutError
+from app.services import session_orchestrator
+from app.services.ai_providers.base import AIProvider, TokenUsage
+from app.services.session_orchestrator import SessionOrchestrator, _response_cache_key
+
+
+async def _stream(*items, delay: float = 0, error: Exception | None = None):
+    """Fake `_stream_provider_response` generator."""
+    for item in items:
+        await asyncio.sleep(delay)
+        yield item
+    if error:
+        raise error
+
+
+async def _collect(stream):
+    """Drain an async generator into a list."""
+    return [item async for item in stream]
+
+
+@pytest.mark.asyncio
+async def test_fan_in_interleaves_by_arrival():
+    """Test a fast member's tokens are relayed before a slow member finishes."""
+    orchestrator = SessionOrchestrator(db=None)
+    jobs = [
+        (["slow"], _stream(("a", None), ("", ("a", 1, 1, 0.0)), delay=0.05)),
+        (["fast"], _stream(("b", None), ("", ("b", 1, 1, 0.0)))),
+    ]
+
+    keys = [key async for key, *_ in orchestrator._fan_in(jobs)]
+
+    assert keys == ["fast", "fast", "slow", "slow"]
+
+
+@pytest.mark.asyncio
+async def test_fan_in_reports_errors_and_finishes():
+    """Test a failing stream yields its error and does not stall the others."""
+    orchestrator = SessionOrchestrator(db=None)
+    boom = RuntimeError("boom")
+    jobs = [
+        (["bad"], _stream(("x", None), error=boom)),
+        (["good"], _stream(("", ("y", 1, 1, 0.0)))),
+    ]
+
+    items = [item async for item in orchestrator._fan_in(jobs)]
+
+    assert ("bad", None, None, boom) in items
+    assert ("good", "", ("y", 1, 1, 0.0), None) in items
+
+
+@pytest.mark.asyncio
+async def test_fan_in_ends_when_stream_stops_without_result():
+    """Test the consumer terminates even if a stream never yields a final result."""
+    orchestrator = SessionOrchestrator(db=None)
+
+    items = await asyncio.wait_for(
+        _collect(orchestrator._fan_in([(["cut"], _stream(("partial", None)))])), timeout=1
+    )
+
+    assert items == [("cut", "partial", None, None)]
+
+
+def test_response_cache_key_ignores_only_surrounding_whitespace():
+    """Test trimming is the only normalization; case and indentation stay significant."""
+    key = lambda prompt: _response_cache_key("ollama", "llama3", 0.3, "Be brief.", prompt, None)
+
+    assert key("  Summarize TDD\n") == key("Summarize TDD")
+    assert key("Summarize TDD") != key("summarize TDD")
+    assert key("if x:\n    y()") != key("if x:\n y()")
+    assert key("Summarize TDD") != key("Summarize BDD")
+
+
+@pytest.mark.asyncio
+async def test_reused_tokens_counted_once():
+    """Test a member's system prompt is tokenized once and reused afterwards."""
+    orchestrator = SessionOrchestrator(db=None)
+    calls = []
+    provider = SimpleNamespace(name="ollama", model="llama3", count_tokens=lambda text: calls.append(text) or 7)
+
+    counts = [await orchestrator._count_reused_tokens(provider, "Be brief.") for _ in range(3)]
+
+    assert counts == [7, 7, 7]
+    assert calls == ["Be brief."]
+    assert await orchestrator._count_reused_tokens(provider, None) == 0
+
+
+@pytest.mark.asyncio
+async def test_count_tokens_runs_tokenizer_off_event_loop():
+    """Test a real tokenizer runs in a worker thread while the estimate runs inline."""
+    loop_thread = threading.get_ident()
+    tokenizer = SimpleNamespace(count_tokens=lambda text: threading.get_ident())
+    estimator = SimpleNamespace(count_tokens=AIProvider._approx_tokens)
+
+    assert await session_orchestrator._count_tokens(tokenizer, "text") != loop_thread
+    assert await session_orchestrator._count_tokens(estimator, "12345678") == 2
+
+
+@pytest.mark.asyncio
+async def test_reported_usage_replaces_token_counting():
+    """Test usage reported at the end of a stream is used instead of tokenizing."""
+    orchestrator = SessionOrchestrator(db=None)
+    calls = []
+
+    async def stream_completion(**kwargs):
+        yield "ok"
+        yield TokenUsage(11, 3)
+
+    provider = SimpleNamespace(
+        name="fake",
+        model="fake-1",
+        count_tokens=lambda text: calls.append(text) or 1,
+        stream_completion=stream_completion,
+        estimate_cost=lambda i, o: i + o,
+    )
+
+    items = await _collect(orchestrator._stream_provider_response(provider, "Hi", 0.7))
+
+    assert items == [("ok", None), ("", ("ok", 11, 3, 14, False))]
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_file_context_tokenized_once_per_model():
+    """Test the file context is counted once per model while prompts are counted per request."""
+    orchestrator = SessionOrchestrator(db=None)
+    orchestrator.file_context = "FILE"
+    calls = []
+
+    async def stream_completion(**kwargs):
+        yield "ok"
+
+    provider = SimpleNamespace(
+        name="ollama",
+        model="llama3",
+        count_tokens=lambda text: calls.append(text) or 1,
+        stream_completion=stream_completion,
+        estimate_cost=lambda i, o: 0.0,
+    )
+
+    for prompt in ("one", "two"):
+        await _collect(orchestrator._stream_provider_response(provider, prompt, 0.7))
+    other_model = SimpleNamespace(**{**vars(provider), "model": "mistral"})
+    await _collect(orchestrator._stream_provider_response(other_model, "one", 0.7))
+
+    assert calls.count("FILE") == 2
+    assert calls.count("one") == 2 and calls.count("two") == 1
+
+
+@pytest.mark.asyncio
+async def test_fan_in_close_cancels_streams_in_flight():
+    """Test closing the consumer aborts provider streams before returning."""
+    orchestrator = SessionOrchestrator(db=None)
+    aborted = []
+
+    async def hanging():
+        try:
+            yield "first", None
+            await asyncio.Event().wait()
+        finally:
+            aborted.append(True)
+
+    fan_in = orchestrator._fan_in([(["slow"], hanging())])
+    assert await fan_in.__anext__() == ("slow", "first", None, None)
+
+    await fan_in.aclose()
+
+    assert aborted == [True]
+
+
+@pytest.mark.parametrize(
+    "temperature, groups",
+    [(0.0, [["a"], ["b", "c"]]), (0.3, [["a"], ["b"], ["c"]]), (0.7, [["a"], ["b"], ["c"]])],
+)
+def test_member_jobs_group_identical_members(temperature, groups):
+    """Test identical member configurations share a stream only at temperature 0."""
+    orchestrator = SessionOrchestrator(db=None)
+    provider = SimpleNamespace(name="ollama")
+    orchestrator._provider_by_member_id = {"a": provider, "b": provider, "c": provider}
+    orchestrator.member_personalities = {"a": "Lead.", "b": "Critique.", "c": "Critique."}
+    members = [
+        SimpleNamespace(id=member_id, provider="ollama", model="qwen3")
+        for member_id in ("a", "b", "c")
+    ]
+
+    jobs = orchestrator._member_jobs(members, "Summarize TDD", temperature)
+
+    assert [[m.id for m in keys] for keys, _ in jobs] == groups
+
+
+@pytest.mark.asyncio
+async def test_fan_in_charges_shared_stream_once():
+    """Test every member of a shared stream gets its result, but only the first pays."""
+    orchestrator = SessionOrchestrator(db=None)
+    jobs = [(["first", "twin"], _stream(("", ("y", 1, 2, 0.5, False))))]
+
+    results = {key: result async for key, _, result, _ in orchestrator._fan_in(jobs)}
+
+    assert results == {"first": ("y", 1, 2, 0.5, False), "twin": ("y", 1, 2, 0.0, True)}
+
+
+def _flaky_provider(failures: list[Exception], chunks=("Hello", " there")):
+    """Fake provider that raises the queued errors before streaming `chunks`."""
+
+    async def stream_completion(**kwargs):
+        if failures:
+            raise failures.pop(0)
+        for chunk in chunks:
+            yield chunk
+
+    return SimpleNamespace(
+        name="fake", model="fake-1", stream_completion=stream_completion,
+        count_tokens=len, estimate_cost=lambda i, o: 0.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_retries_transient_errors(monkeypatch):
+    """Test rate limits and outages are retried before any output is relayed."""
+    monkeypatch.setattr(session_orchestrator, "RETRY_BASE_DELAY", 0)
+    provider = _flaky_provider([RateLimitError(), ServiceUnavailableError()])
+    orchestrator = SessionOrchestrator(db=None)
+
+    items = [item async for item in orchestrator._stream_provider_response(provider, "Hi", 0.7)]
+
+    assert [delta for delta, _ in items] == ["Hello", " there", ""]
+    assert items[-1][1][0] == "Hello there"
+
+
+@pytest.mark.asyncio
+async def test_stream_does_not_retry_permanent_errors(monkeypatch):
+    """Test errors a retry cannot fix, or exhausted attempts, are raised."""
+    monkeypatch.setattr(session_orchestrator, "RETRY_BASE_DELAY", 0)
+    orchestrator = SessionOrchestrator(db=None)
+
+    with pytest.raises(AuthenticationError):
+        await _collect(orchestrator._stream_provider_response(_flaky_provider([AuthenticationError()]), "Hi", 0.7))
+
+    failures = [TimeoutError() for _ in range(session_orchestrator.PROVIDER_MAX_ATTEMPTS)]
+    with pytest.raises(TimeoutError):
+        await _collect(orchestrator._stream_provider_response(_flaky_provider(failures), "Hi", 0.7))
+
+
+def test_retry_delay_honors_retry_after():
+    """Test backoff never undercuts the provider's Retry-After, up to the cap."""
+    assert session_orchestrator._retry_delay(1, retry_after=5) >= 5
+    assert session_orchestrator._retry_delay(1, retry_after=600) == session_orchestrator.RETRY_MAX_DELAY
+
+
+@pytest.mark.asyncio
+async def test_provider_requests_are_limited_across_streams(monkeypatch):
+    """Test no more than the provider's max_concurrent_requests run at once."""
+    monkeypatch.setattr(session_orchestrator, "DEFAULT_MAX_CONCURRENT_REQUESTS", 2)
+    in_flight, peak = 0, 0
+
+    async def stream_completion(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        yield kwargs["system_prompt"]
+
+    provider = SimpleNamespace(
+        name="limited", model="fake-1", stream_completion=stream_completion,
+        count_tokens=len, estimate_cost=lambda i, o: 0.0,
+    )
+    orchestrator = SessionOrchestrator(db=None)
+    jobs = [
+        ([n], orchestrator._stream_provider_response(provider, "Hi", 0.9, f"Member {n}"))
+        for n in range(5)
+    ]
+
+    results = [result async for _, _, result, _ in orchestrator._fan_in(jobs) if result]
+
+    assert len(results) == 5
+    assert peak == 2
+
+
+@pytest.mark.parametrize("count", [0, 1, 3])
+def test_format_council_responses(count):
+    """Test responses render as separated, labelled sections."""
+    responses = [{"provider": f"p{n}", "content": f"text {n}"} for n in range(count)]
+
+    expected = "\n\n".join(f"--- Response from p{n} ---\ntext {n}" for n in range(count))
+    assert session_orchestrator._format_council_responses(responses) == expected
@@ -50,12 +50,19 @@ export const ResponseCard: React.FC<ResponseCardProps> = ({ response, isMerged =
             </span>
           )}
         </div>
-        <div className="flex flex-col items-end text-xs text-muted-foreground">
-          <div>
-            {response.tokens.input.toLocaleString()} in / {response.tokens.output.toLocaleString()} out
+        {response.streaming ? (
+          <div className="flex items-center gap-2 text-xs text-muted-foreground">
+            <div className="w-2 h-2 bg-green-500 rounded-full animate-pulse" />
+            Streaming...
           </div>
-          <div className="font-semibold">${response.cost.toFixed(4)}</div>
-        </div>
+        ) : (
+          <div className="flex flex-col items-end text-xs text-muted-foreground">
+            <div>
+              {response.tokens.input.toLocaleString()} in / {response.tokens.output.toLocaleString()} out
+            </div>
+            <div className="font-semibold">${response.cost.toFixed(4)}</div>
+          </div>
+        )}
       </div>
 
       <div className="prose prose-sm max-w-none">
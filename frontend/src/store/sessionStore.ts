@@ -20,6 +20,55 @@ interface SessionStore extends SessionStateType {
   isPaused: boolean;
 }
 
+// Negative ids keep in-progress entries from colliding with saved response ids
+let nextStreamingId = -1;
+
+// Whether `response` is the in-progress entry a delta or done event belongs to
+const isStreamingEntry = (response: CouncilResponse, event: StreamEvent) =>
+  response.streaming === true &&
+  response.type === event.type &&
+  response.member_id === event.member_id &&
+  response.iteration === (event.iteration || 1);
+
+// Append a streamed token to its member's in-progress entry, creating it on the first token
+const appendDelta = (list: CouncilResponse[], event: StreamEvent): CouncilResponse[] => {
+  const index = list.findIndex((response) => isStreamingEntry(response, event));
+  if (index === -1) {
+    return [
+      ...list,
+      {
+        id: nextStreamingId--,
+        provider: event.provider || '',
+        content: event.delta || '',
+        iteration: event.iteration || 1,
+        type: event.type as CouncilResponse['type'],
+        tokens: { input: 0, output: 0 },
+        cost: 0,
+        member_id: event.member_id,
+        member_role: event.member_role,
+        streaming: true,
+      },
+    ];
+  }
+  const updated = [...list];
+  updated[index] = { ...list[index], content: list[index].content + (event.delta || '') };
+  return updated;
+};
+
+// Replace the in-progress entry with the final response, keeping its position
+const settleResponse = (list: CouncilResponse[], event: StreamEvent, response: CouncilResponse) => {
+  const index = list.findIndex((entry) => isStreamingEntry(entry, event));
+  if (index === -1) {
+    return [...list, response];
+  }
+  const updated = [...list];
+  updated[index] = response;
+  return updated;
+};
+
+// Drop partial text that will never complete (paused or interrupted streams)
+const withoutStreaming = (list: CouncilResponse[]) => list.filter((response) => !response.streaming);
+
 // Initial state for resetting
 const initialState = {
   sessionId: null,
@@ -157,8 +206,8 @@ export const useSessionStore = create<SessionStore>()(
           ...state._sessionConfig,
           resume_state: {
             current_iteration: state.currentIteration,
-            responses: state.responses,
-            merged_responses: state.mergedResponses,
+            responses: withoutStreaming(state.responses),
+            merged_responses: withoutStreaming(state.mergedResponses),
             total_cost: state.totalCost,
             total_tokens: state.totalTokens,
           }
@@ -168,6 +217,8 @@ export const useSessionStore = create<SessionStore>()(
           status: 'running',
           isPaused: false,
           statusMessage: 'Resuming session...',
+          responses: withoutStreaming(state.responses),
+          mergedResponses: withoutStreaming(state.mergedResponses),
         });
 
         try {
@@ -260,7 +311,9 @@ export const useSessionStore = create<SessionStore>()(
             break;
 
           case 'initial_response':
-            if (event.done && event.provider && event.content) {
+            if (!event.done && event.delta) {
+              set({ responses: appendDelta(state.responses, event) });
+            } else if (event.done && event.provider && event.content) {
               const newResponse: CouncilResponse = {
                 id: event.response_id || Date.now(),
                 provider: event.provider,
@@ -274,7 +327,7 @@ export const useSessionStore = create<SessionStore>()(
               };
 
               set({
-                responses: [...state.responses, newResponse],
+                responses: settleResponse(state.responses, event, newResponse),
                 totalCost: state.totalCost + (event.cost || 0),
                 totalTokens: {
                   input: state.totalTokens.input + (event.tokens?.input || 0),
@@ -286,7 +339,9 @@ export const useSessionStore = create<SessionStore>()(
             break;
 
           case 'merge':
-            if (event.done && event.provider && event.content) {
+            if (!event.done && event.delta) {
+              set({ mergedResponses: appendDelta(state.mergedResponses, event) });
+            } else if (event.done && event.provider && event.content) {
               const mergedResponse: CouncilResponse = {
                 id: event.response_id || Date.now(),
                 provider: event.provider,
@@ -300,7 +355,7 @@ export const useSessionStore = create<SessionStore>()(
               };
 
               set({
-                mergedResponses: [...state.mergedResponses, mergedResponse],
+                mergedResponses: settleResponse(state.mergedResponses, event, mergedResponse),
                 totalCost: state.totalCost + (event.cost || 0),
                 totalTokens: {
                   input: state.totalTokens.input + (event.tokens?.input || 0),
@@ -313,7 +368,14 @@ export const useSessionStore = create<SessionStore>()(
             break;
 
           case 'feedback':
-            if (event.done && event.provider && event.content) {
+            if (!event.done && event.delta) {
+              // Open the new iteration's tab as soon as its feedback starts streaming
+              const streamingIteration = event.iteration || 1;
+              set({
+                responses: appendDelta(state.responses, event),
+                ...(streamingIteration > state.currentIteration && { currentIteration: streamingIteration }),
+              });
+            } else if (event.done && event.provider && event.content) {
               const feedbackResponse: CouncilResponse = {
                 id: event.response_id || Date.now(),
                 provider: event.provider,
@@ -331,7 +393,7 @@ export const useSessionStore = create<SessionStore>()(
               const shouldUpdateIteration = newIteration > state.currentIteration;
 
               set({
-                responses: [...state.responses, feedbackResponse],
+                responses: settleResponse(state.responses, event, feedbackResponse),
                 totalCost: state.totalCost + (event.cost || 0),
                 totalTokens: {
                   input: state.totalTokens.input + (event.tokens?.input || 0),
@@ -380,8 +442,8 @@ export const useSessionStore = create<SessionStore>()(
         status: state.status,
         currentIteration: state.currentIteration,
         totalIterations: state.totalIterations,
-        responses: state.responses,
-        mergedResponses: state.mergedResponses,
+        responses: withoutStreaming(state.responses),
+        mergedResponses: withoutStreaming(state.mergedResponses),
         statusMessage: state.statusMessage,
         totalCost: state.totalCost,
         totalTokens: state.totalTokens,
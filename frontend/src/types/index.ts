@@ -102,12 +102,14 @@ export interface StreamEvent {
   message?: string;
   provider?: string;
   content?: string;
+  delta?: string;
   iteration?: number;
   tokens?: {
     input: number;
     output: number;
   };
   cost?: number;
+  cache_hit?: boolean;
   done?: boolean;
   response_id?: number;
   member_id?: string;
@@ -127,6 +129,7 @@ export interface CouncilResponse {
   cost: number;
   member_id?: string;
   member_role?: string;
+  streaming?: boolean;
 }
 
 export interface SessionState {